@@ -1,6 +1,16 @@
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.serializers import (
+    TokenObtainPairSerializer,
+    TokenRefreshSerializer,
+    TokenVerifySerializer,
+)
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken, UntypedToken
+
+from authentication.models import TokenUser
+from authentication.revocation import revocations
 
 User = get_user_model()
 
@@ -12,14 +22,65 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
     def get_token(cls, user):
         token = super().get_token(user)
 
-        # Add custom claims
-        token["username"] = user.username
-        token["user_type"] = user.user_type
-        token["email"] = user.email
+        # Add custom claims, from which StatelessJWTAuthentication builds
+        # the request user
+        for field in TokenUser.CLAIM_FIELDS:
+            token[field] = getattr(user, field)
 
         return token
 
 
+class RevocationCheckedTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Refuses to refresh a revoked refresh token, or one of a user that was
+    deactivated or deleted: access tokens are authenticated from their
+    claims alone, so this is where the user's state is checked.
+    """
+
+    def validate(self, attrs):
+        refresh = self.token_class(attrs["refresh"])
+        if revocations.is_revoked(refresh):
+            raise TokenError("Token has been revoked")
+        user_id = refresh.get(api_settings.USER_ID_CLAIM)
+        if not User.objects.filter(
+            **{api_settings.USER_ID_FIELD: user_id, "is_active": True}
+        ).exists():
+            raise TokenError("User is inactive or does not exist")
+        return super().validate(attrs)
+
+
+class RevocationCheckedTokenVerifySerializer(TokenVerifySerializer):
+    """Reports revoked tokens as invalid"""
+
+    def validate(self, attrs):
+        if revocations.is_revoked(UntypedToken(attrs["token"])):
+            raise TokenError("Token has been revoked")
+        return super().validate(attrs)
+
+
+class LogoutSerializer(serializers.Serializer):
+    """Refresh token revoked along with the access token of the request"""
+
+    refresh = serializers.CharField(required=False)
+
+    def validate_refresh(self, value):
+        try:
+            refresh = RefreshToken(value)
+        except TokenError as error:
+            raise serializers.ValidationError(str(error))
+        user_id = refresh.get(api_settings.USER_ID_CLAIM)
+        if str(user_id) != str(self.context["request"].user.pk):
+            raise serializers.ValidationError("Token belongs to another user")
+        return refresh
+
+
+class PasswordChangeSerializer(serializers.Serializer):
+    """Current and new password of the authenticated user"""
+
+    current_password = serializers.CharField(help_text="Current user password")
+    new_password = serializers.CharField(help_text="New password to set")
+
+
 class RegisterSerializer(serializers.ModelSerializer):
     """Serializer for user registration"""
 
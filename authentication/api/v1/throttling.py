@@ -0,0 +1,28 @@
+from collections.abc import Mapping
+
+from rest_framework.throttling import BaseThrottle
+
+from authentication.login_limiter import lockout_remaining
+
+
+def attempted_username(request):
+    """Username of a login attempt; empty when the body is not an object"""
+    if isinstance(request.data, Mapping):
+        return request.data.get("username", "")
+    return ""
+
+
+class LoginAttemptThrottle(BaseThrottle):
+    """
+    Refuses login attempts for a locked out username or client IP, before
+    the credentials (and their password hash) are checked.
+    """
+
+    def allow_request(self, request, view):
+        self.retry_after = lockout_remaining(
+            attempted_username(request), view.get_client_ip(request)
+        )
+        return not self.retry_after
+
+    def wait(self):
+        return self.retry_after
@@ -1,15 +1,30 @@
 from django.urls import path
-from rest_framework_simplejwt.views import TokenRefreshView, TokenVerifyView
 
-from .views import CustomTokenObtainPairView, PasswordChangeView, RegisterView
+from .views import (
+    CustomTokenObtainPairView,
+    LogoutView,
+    PasswordChangeView,
+    RegisterView,
+    RevocationCheckedTokenRefreshView,
+    RevocationCheckedTokenVerifyView,
+)
 
 app_name = "authentication"
 
 urlpatterns = [
     # JWT token endpoints
     path("token/", CustomTokenObtainPairView.as_view(), name="token_obtain_pair"),
-    path("token/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
-    path("token/verify/", TokenVerifyView.as_view(), name="token_verify"),
+    path(
+        "token/refresh/",
+        RevocationCheckedTokenRefreshView.as_view(),
+        name="token_refresh",
+    ),
+    path(
+        "token/verify/",
+        RevocationCheckedTokenVerifyView.as_view(),
+        name="token_verify",
+    ),
+    path("logout/", LogoutView.as_view(), name="logout"),
     # Registration and password management
     path("register/", RegisterView.as_view(), name="register"),
     path("change-password/", PasswordChangeView.as_view(), name="change_password"),
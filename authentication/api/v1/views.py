@@ -1,5 +1,3 @@
-import logging
-
 from django.contrib.auth import get_user_model
 from drf_spectacular.utils import OpenApiResponse, extend_schema, inline_serializer
 from rest_framework import (  # Adicionando a importação de serializers aqui
@@ -7,14 +5,29 @@ from rest_framework import (  # Adicionando a importação de serializers aqui
     serializers,
     status,
 )
+from rest_framework.exceptions import APIException
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from rest_framework_simplejwt.views import TokenObtainPairView
-
-from .serializers import CustomTokenObtainPairSerializer, RegisterSerializer
+from rest_framework_simplejwt.views import (
+    TokenObtainPairView,
+    TokenRefreshView,
+    TokenVerifyView,
+)
 
-logger = logging.getLogger(__name__)
+from authentication import login_limiter
+from authentication.revocation import revoke_tokens, revoke_user_tokens
+from core.audit import audit
+
+from .serializers import (
+    CustomTokenObtainPairSerializer,
+    LogoutSerializer,
+    PasswordChangeSerializer,
+    RegisterSerializer,
+    RevocationCheckedTokenRefreshSerializer,
+    RevocationCheckedTokenVerifySerializer,
+)
+from .throttling import LoginAttemptThrottle, attempted_username
 
 User = get_user_model()
 
@@ -26,29 +39,47 @@ User = get_user_model()
     responses={
         200: CustomTokenObtainPairSerializer,
         401: OpenApiResponse(description="Credenciais inválidas"),
+        429: OpenApiResponse(
+            description="Muitas tentativas falhas para o usuário ou IP; tente "
+            "novamente após o tempo indicado em `Retry-After`"
+        ),
     },
 )
 class CustomTokenObtainPairView(TokenObtainPairView):
     """Custom token endpoint que usa nosso serializer aprimorado"""
 
     serializer_class = CustomTokenObtainPairSerializer
+    # Instead of the anonymous rate, shared with every other public endpoint
+    throttle_classes = [LoginAttemptThrottle]
 
     def post(self, request, *args, **kwargs):
-        response = super().post(request, *args, **kwargs)
+        # Anything but a JSON object is rejected by the serializer with a 400
+        username = attempted_username(request)
+        try:
+            response = super().post(request, *args, **kwargs)
+        except APIException:
+            # Wrong credentials are raised, not returned
+            self._login_failed(request, username)
+            raise
 
         if response.status_code == status.HTTP_200_OK:
-            username = request.data.get("username", "")
-            logger.info(
-                f"Successful login: username={username}, IP={self.get_client_ip(request)}"
-            )
+            login_limiter.record_success(username)
+            self._audit_login("login.succeeded", request, username)
         else:
-            username = request.data.get("username", "")
-            logger.warning(
-                f"Failed login attempt: username={username}, IP={self.get_client_ip(request)}"
-            )
-
+            self._login_failed(request, username)
         return response
 
+    def throttled(self, request, wait):
+        self._audit_login("login.locked", request, attempted_username(request))
+        super().throttled(request, wait)
+
+    def _login_failed(self, request, username):
+        login_limiter.record_failure(username, self.get_client_ip(request))
+        self._audit_login("login.failed", request, username)
+
+    def _audit_login(self, event, request, username):
+        audit(event, username=username, ip=self.get_client_ip(request))
+
     def get_client_ip(self, request):
         x_forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
         if x_forwarded_for:
@@ -58,6 +89,50 @@ class CustomTokenObtainPairView(TokenObtainPairView):
         return ip
 
 
+class RevocationCheckedTokenRefreshView(TokenRefreshView):
+    """Token refresh endpoint that refuses revoked refresh tokens"""
+
+    serializer_class = RevocationCheckedTokenRefreshSerializer
+
+
+class RevocationCheckedTokenVerifyView(TokenVerifyView):
+    """Token verify endpoint that reports revoked tokens as invalid"""
+
+    serializer_class = RevocationCheckedTokenVerifySerializer
+
+
+@extend_schema(
+    tags=["Authentication"],
+    summary="Encerrar sessão",
+    description=(
+        "Revoga o token de acesso usado na requisição e, se informado, o token "
+        "de atualização (refresh) da mesma sessão. Os tokens revogados deixam "
+        "de ser aceitos imediatamente."
+    ),
+    request=LogoutSerializer,
+    responses={
+        204: OpenApiResponse(description="Sessão encerrada"),
+        400: OpenApiResponse(description="Token de atualização inválido"),
+    },
+)
+class LogoutView(APIView):
+    """Endpoint para encerrar a sessão"""
+
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        serializer = LogoutSerializer(data=request.data, context={"request": request})
+        serializer.is_valid(raise_exception=True)
+
+        tokens = [request.auth]
+        if serializer.validated_data.get("refresh"):
+            tokens.append(serializer.validated_data["refresh"])
+        revoke_tokens(tokens)
+
+        audit("logout", user_id=request.user.pk, username=request.user.username)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
 @extend_schema(
     tags=["Authentication"],
     summary="Registrar novo usuário",
@@ -78,28 +153,33 @@ class RegisterView(generics.CreateAPIView):
     def create(self, request, *args, **kwargs):
         response = super().create(request, *args, **kwargs)
         if response.status_code == 201:
-            username = request.data.get("username", "")
-            email = request.data.get("email", "")
-            logger.info(f"User registered: username={username}, email={email}")
+            audit(
+                "user.registered",
+                username=request.data.get("username", ""),
+                email=request.data.get("email", ""),
+            )
         return response
 
 
 @extend_schema(
     tags=["Authentication"],
     summary="Alterar senha",
-    description="Altera a senha do usuário atualmente autenticado.",
-    request=inline_serializer(
-        name="PasswordChangeRequest",
-        fields={
-            "current_password": serializers.CharField(
-                help_text="Current user password"
-            ),
-            "new_password": serializers.CharField(help_text="New password to set"),
-        },
+    description=(
+        "Altera a senha do usuário atualmente autenticado. Todos os tokens "
+        "emitidos antes da alteração são revogados; a resposta traz um novo "
+        "par de tokens."
     ),
+    request=PasswordChangeSerializer,
     responses={
-        200: OpenApiResponse(description="Senha alterada com sucesso"),
-        400: OpenApiResponse(description="Senha atual incorreta"),
+        200: inline_serializer(
+            name="PasswordChangeResponse",
+            fields={
+                "detail": serializers.CharField(),
+                "access": serializers.CharField(),
+                "refresh": serializers.CharField(),
+            },
+        ),
+        400: OpenApiResponse(description="Dados inválidos ou senha atual incorreta"),
     },
 )
 @extend_schema(tags=["Users"])
@@ -110,11 +190,13 @@ class PasswordChangeView(APIView):
 
     def post(self, request):
         user = request.user
-        current_password = request.data.get("current_password")
-        new_password = request.data.get("new_password")
+        serializer = PasswordChangeSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        current_password = serializer.validated_data["current_password"]
+        new_password = serializer.validated_data["new_password"]
 
         if not user.check_password(current_password):
-            logger.warning(f"Failed password change attempt: user={user.username}")
+            audit("password.change_failed", user_id=user.pk, username=user.username)
             return Response(
                 {"current_password": "Incorrect password"},
                 status=status.HTTP_400_BAD_REQUEST,
@@ -122,6 +204,15 @@ class PasswordChangeView(APIView):
 
         user.set_password(new_password)
         user.save()
-
-        logger.info(f"Password changed successfully: user={user.username}")
-        return Response({"detail": "Password changed successfully"})
+        # Sessions opened with the old password end here
+        revoke_user_tokens(user)
+        refresh = CustomTokenObtainPairSerializer.get_token(user)
+
+        audit("password.changed", user_id=user.pk, username=user.username)
+        return Response(
+            {
+                "detail": "Password changed successfully",
+                "access": str(refresh.access_token),
+                "refresh": str(refresh),
+            }
+        )
@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class AuthenticationConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "authentication"
+
+    def ready(self):
+        # Registers the OpenAPI extension of the authentication backend
+        from authentication import (
+            schema,  # noqa: F401
+            signals,  # noqa: F401
+        )
@@ -0,0 +1,29 @@
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+
+from authentication.models import TokenUser
+from authentication.revocation import revocations
+
+
+class StatelessJWTAuthentication(JWTAuthentication):
+    """
+    ``JWTAuthentication`` without the user ``SELECT`` of every request.
+
+    The user is a ``TokenUser`` built from the token's claims, which is
+    enough for the permission classes; the rest of the user is only loaded
+    when a view reads it. Tokens issued without the claims fall back to
+    loading the user from the database. Revoked tokens are rejected, which
+    costs no query either unless the token may be revoked (see
+    ``authentication.revocation``).
+    """
+
+    def get_validated_token(self, raw_token):
+        validated_token = super().get_validated_token(raw_token)
+        if revocations.is_revoked(validated_token):
+            raise InvalidToken("Token has been revoked", code="token_revoked")
+        return validated_token
+
+    def get_user(self, validated_token):
+        if not all(claim in validated_token for claim in TokenUser.CLAIM_FIELDS):
+            return super().get_user(validated_token)
+        return TokenUser.from_token(validated_token)
@@ -0,0 +1,132 @@
+"""
+Login brute-force protection.
+
+Failed logins are counted per username and per client IP in sliding
+windows of ``LOGIN_ATTEMPTS_WINDOW`` seconds. A sliding window is
+approximated from two fixed ones, weighting the previous window by how much
+of it still overlaps the sliding one; so each key needs two counters, not
+one timestamp per attempt. Past the limit of its scope, the key is locked
+out for ``LOGIN_LOCKOUT`` seconds, doubled on each lockout in a row up to
+``LOGIN_MAX_LOCKOUT``.
+
+Everything lives in the shared cache, with atomic ``incr`` where the backend
+has it (Redis), so every worker sees the same counters. Checking a lockout
+is one ``get_many`` and happens before the credentials are checked: locked
+out attempts never cost a password hash.
+"""
+
+import hashlib
+import math
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+
+
+def _cache():
+    return caches[settings.LOGIN_ATTEMPTS_CACHE]
+
+
+class AttemptCounter:
+    """Failed attempts of one scope (``username`` or ``ip``)"""
+
+    def __init__(self, scope, limit):
+        self.scope = scope
+        self.limit = limit
+
+    @property
+    def window(self):
+        return settings.LOGIN_ATTEMPTS_WINDOW
+
+    def _key(self, kind, value, *suffix):
+        # Hashed: usernames may contain characters cache keys cannot
+        digest = hashlib.sha256(str(value).lower().encode()).hexdigest()[:32]
+        return ":".join(["login", kind, self.scope, digest, *map(str, suffix)])
+
+    def lockout_key(self, value):
+        return self._key("lockout", value)
+
+    def _count(self, value, now):
+        """Attempts in the sliding window ending ``now``"""
+        index, elapsed = divmod(now, self.window)
+        counters = _cache().get_many(
+            [
+                self._key("attempts", value, int(index) - 1),
+                self._key("attempts", value, int(index)),
+            ]
+        )
+        previous = counters.get(self._key("attempts", value, int(index) - 1), 0)
+        current = counters.get(self._key("attempts", value, int(index)), 0)
+        return previous * (1 - elapsed / self.window) + current
+
+    def add_failure(self, value, now):
+        """Count a failed attempt; return the lockout it causes, in seconds"""
+        cache = _cache()
+        key = self._key("attempts", value, int(now // self.window))
+        # Kept through the next window, which still weighs it
+        cache.add(key, 0, 2 * self.window)
+        cache.incr(key)
+        if self._count(value, now) < self.limit:
+            return 0
+
+        strikes_key = self._key("strikes", value)
+        cache.add(strikes_key, 0, settings.LOGIN_MAX_LOCKOUT)
+        strikes = cache.incr(strikes_key)
+        cache.touch(strikes_key, settings.LOGIN_MAX_LOCKOUT)
+        lockout = min(
+            settings.LOGIN_LOCKOUT * 2 ** (strikes - 1), settings.LOGIN_MAX_LOCKOUT
+        )
+        cache.set(self.lockout_key(value), now + lockout, lockout)
+        return lockout
+
+    def reset(self, value):
+        index = int(time.time() // self.window)
+        _cache().delete_many(
+            [
+                self._key("attempts", value, index - 1),
+                self._key("attempts", value, index),
+                self._key("strikes", value),
+            ]
+        )
+
+
+def _counters():
+    return (
+        AttemptCounter("username", settings.LOGIN_MAX_ATTEMPTS_PER_USERNAME),
+        AttemptCounter("ip", settings.LOGIN_MAX_ATTEMPTS_PER_IP),
+    )
+
+
+def _scoped(username, ip):
+    """(counter, value) pairs for the identifiers of an attempt"""
+    username_counter, ip_counter = _counters()
+    pairs = []
+    if username:
+        pairs.append((username_counter, username))
+    if ip:
+        pairs.append((ip_counter, ip))
+    return pairs
+
+
+def lockout_remaining(username, ip):
+    """Seconds until an attempt for ``username`` from ``ip`` is allowed"""
+    keys = [counter.lockout_key(value) for counter, value in _scoped(username, ip)]
+    if not keys:
+        return 0
+    until = max(_cache().get_many(keys).values(), default=0)
+    return max(0, math.ceil(until - time.time()))
+
+
+def record_failure(username, ip):
+    """Count a failed login; return the lockout it causes, in seconds"""
+    now = time.time()
+    return max(
+        [counter.add_failure(value, now) for counter, value in _scoped(username, ip)],
+        default=0,
+    )
+
+
+def record_success(username):
+    """A successful login clears the username's failures, not the IP's"""
+    if username:
+        _counters()[0].reset(username)
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from authentication.revocation import prune_revoked_tokens
+
+
+class Command(BaseCommand):
+    help = (
+        "Remove as revogações de tokens que já expiraram, que não precisam mais "
+        "ser verificadas. Pode ser agendado, por exemplo, uma vez por dia."
+    )
+
+    def handle(self, *args, **options):
+        deleted = prune_revoked_tokens()
+        self.stdout.write(f"Pruned {deleted} revoked tokens")
@@ -0,0 +1,28 @@
+# Generated by Django 4.2.10 on 2026-10-17 04:34
+
+from django.db import migrations
+import users.models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = [
+        ("users", "0003_trigram_search_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TokenUser",
+            fields=[],
+            options={
+                "proxy": True,
+                "indexes": [],
+                "constraints": [],
+            },
+            bases=("users.customuser",),
+            managers=[
+                ("objects", users.models.CustomUserManager()),
+            ],
+        ),
+    ]
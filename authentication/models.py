@@ -1,2 +1,71 @@
-# Este arquivo pode ficar vazio, pois usaremos o modelo CustomUser do app users
-# e não precisamos de modelos adicionais para JWT
+from django.contrib.auth import get_user_model
+from django.db import models, router
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.settings import api_settings
+
+User = get_user_model()
+
+
+class TokenUser(User):
+    """
+    The user of a request authenticated by an access token, built from the
+    token's claims without querying the database.
+
+    Only the fields in ``CLAIM_FIELDS`` (and the id) are loaded; the others
+    are deferred, and the first access to any of them loads them all in one
+    query. Being a proxy of the user model, it compares equal to the
+    matching ``CustomUser``, keeps its helpers (``is_admin()``,
+    ``accessible_verticals``...) and can be used in filters and foreign
+    keys. Claims are only as fresh as the token, so deactivating, deleting
+    or changing the type of a user revokes their tokens
+    (``authentication.signals``).
+    """
+
+    # Claims added by CustomTokenObtainPairSerializer, named after the fields
+    CLAIM_FIELDS = ("username", "email", "user_type", "token_version")
+
+    class Meta:
+        proxy = True
+
+    @classmethod
+    def from_token(cls, token):
+        values = {field: token[field] for field in cls.CLAIM_FIELDS}
+        values[api_settings.USER_ID_FIELD] = token[api_settings.USER_ID_CLAIM]
+        field_names = [
+            field.attname
+            for field in cls._meta.concrete_fields
+            if field.attname in values
+        ]
+        return cls.from_db(
+            router.db_for_read(cls),
+            field_names,
+            [values[name] for name in field_names],
+        )
+
+    def refresh_from_db(self, using=None, fields=None, **kwargs):
+        deferred = self.get_deferred_fields()
+        if fields is not None and deferred.issuperset(fields):
+            # Reading one field that is not a claim loads all of them
+            fields = deferred
+        super().refresh_from_db(using=using, fields=fields, **kwargs)
+
+
+class RevokedToken(models.Model):
+    """
+    A revoked token (``jti:<jti>``) or token version of a user
+    (``user:<id>:v<version>``, every token issued before a password change).
+
+    Rows are only needed until the tokens they revoke expire; see
+    ``authentication.revocation`` for how requests are checked against them.
+    """
+
+    key = models.CharField(_("Key"), max_length=100, unique=True)
+    expires_at = models.DateTimeField(_("Expires At"), db_index=True)
+    created_at = models.DateTimeField(_("Created At"), auto_now_add=True)
+
+    class Meta:
+        verbose_name = _("Revoked Token")
+        verbose_name_plural = _("Revoked Tokens")
+
+    def __str__(self):
+        return self.key
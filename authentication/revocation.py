@@ -0,0 +1,193 @@
+"""
+Token revocation.
+
+Tokens are revoked one by one by their ``jti`` (logout), or all at once per
+user by bumping ``CustomUser.token_version``, which every token carries as
+a claim (password change): the user's previous version is then revoked.
+Both are stored as ``RevokedToken`` rows until the tokens they cover
+expire.
+
+Checking a request must not cost a query, so each process keeps the
+revoked keys in a ``BloomFilter``. A token whose keys are not in the filter
+is valid; only a (rare) match is confirmed against the database. Each
+revocation replaces a generation id in the cache, which processes compare
+with their own at most every ``SYNC_INTERVAL`` seconds; when it changed,
+they add the recently created revocations to their filter. The filter is
+rebuilt when it grows past its capacity.
+"""
+
+import threading
+import time
+import uuid
+from datetime import UTC, datetime, timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+from rest_framework_simplejwt.settings import api_settings
+
+from authentication.models import RevokedToken
+from core.bloom import BloomFilter
+
+GENERATION_CACHE_KEY = "token_revocations:generation"
+SYNC_INTERVAL = 1  # seconds
+SYNC_MARGIN = timedelta(minutes=5)
+ERROR_RATE = 0.001
+MIN_CAPACITY = 10_000
+
+
+def jti_key(jti):
+    return f"jti:{jti}"
+
+
+def token_version_key(user_id, version):
+    return f"user:{user_id}:v{version}"
+
+
+def token_keys(token):
+    """Revocation keys that apply to ``token``"""
+    keys = [
+        token_version_key(
+            token.get(api_settings.USER_ID_CLAIM), token.get("token_version", 0)
+        )
+    ]
+    jti = token.get(api_settings.JTI_CLAIM)
+    if jti:
+        keys.append(jti_key(jti))
+    return keys
+
+
+class RevocationList:
+    """The revoked keys of this process, synced with the database"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._filter = None
+        self._generation = None
+        self._loaded_at = None
+        self._checked_at = 0.0
+
+    def _current_generation(self):
+        generation = cache.get(GENERATION_CACHE_KEY)
+        if generation is None:
+            cache.add(GENERATION_CACHE_KEY, uuid.uuid4().hex, None)
+            generation = cache.get(GENERATION_CACHE_KEY)
+        return generation
+
+    def sync(self):
+        """Catch up with the revocations of other processes, if due"""
+        now = time.monotonic()
+        if self._filter is not None and now - self._checked_at < SYNC_INTERVAL:
+            return
+        with self._lock:
+            if self._filter is not None and now - self._checked_at < SYNC_INTERVAL:
+                return
+            generation = self._current_generation()
+            if self._filter is None or self._filter.is_full:
+                self._load()
+            elif generation != self._generation:
+                # Rows committed late or by servers with a skewed clock
+                # still fall within the margin
+                self._load(since=self._loaded_at - SYNC_MARGIN)
+            self._generation = generation
+            self._checked_at = now
+
+    def _load(self, since=None):
+        """Add the revocations created ``since`` then, or rebuild the filter"""
+        loaded_at = timezone.now()
+        queryset = RevokedToken.objects.filter(expires_at__gt=loaded_at)
+        if since is None:
+            keys = list(queryset.values_list("key", flat=True))
+            self._filter = BloomFilter(max(MIN_CAPACITY, 2 * len(keys)), ERROR_RATE)
+        else:
+            keys = queryset.filter(created_at__gte=since).values_list("key", flat=True)
+        self._add(keys)
+        self._loaded_at = loaded_at
+
+    def _add(self, keys):
+        for key in keys:
+            # Already matching keys are not counted again towards the capacity
+            if key not in self._filter:
+                self._filter.add(key)
+
+    def add(self, keys):
+        """Apply this process' own revocations without waiting for a sync"""
+        self.sync()
+        with self._lock:
+            self._add(keys)
+
+    def is_revoked(self, token):
+        self.sync()
+        keys = token_keys(token)
+        if not any(key in self._filter for key in keys):
+            return False
+        # Possibly a false positive of the filter
+        return RevokedToken.objects.filter(
+            key__in=keys, expires_at__gt=timezone.now()
+        ).exists()
+
+    def reset(self):
+        """Forget the filter, which is rebuilt on the next check"""
+        with self._lock:
+            self._filter = None
+            self._generation = None
+
+
+revocations = RevocationList()
+
+
+def _publish_generation():
+    # Deleting first makes the other workers drop their in-process copy
+    cache.delete(GENERATION_CACHE_KEY)
+    cache.set(GENERATION_CACHE_KEY, uuid.uuid4().hex, None)
+
+
+def _revoke(entries):
+    """Store ``{key: expires_at}`` and announce it to the other processes"""
+    RevokedToken.objects.bulk_create(
+        [
+            RevokedToken(key=key, expires_at=expires_at)
+            for key, expires_at in entries.items()
+        ],
+        ignore_conflicts=True,
+    )
+    revocations.add(entries)
+    transaction.on_commit(_publish_generation)
+
+
+def revoke_tokens(tokens):
+    """Revoke each token by its jti, until it expires"""
+    _revoke(
+        {
+            jti_key(token[api_settings.JTI_CLAIM]): datetime.fromtimestamp(
+                token["exp"], tz=UTC
+            )
+            for token in tokens
+        }
+    )
+
+
+def revoke_token_version(user_id, version):
+    """Revoke the tokens issued to a user while at ``version``"""
+    # No token issued before now outlives the longest token lifetime
+    lifetime = max(
+        api_settings.ACCESS_TOKEN_LIFETIME, api_settings.REFRESH_TOKEN_LIFETIME
+    )
+    _revoke({token_version_key(user_id, version): timezone.now() + lifetime})
+
+
+def revoke_user_tokens(user):
+    """Revoke every token issued to ``user`` so far"""
+    User = get_user_model()
+    with transaction.atomic():
+        User.objects.filter(pk=user.pk).update(token_version=F("token_version") + 1)
+        user.refresh_from_db(fields=["token_version"])
+        revoke_token_version(user.pk, user.token_version - 1)
+
+
+def prune_revoked_tokens():
+    """Delete the revocations whose tokens all expired; return how many"""
+    deleted, _ = RevokedToken.objects.filter(expires_at__lte=timezone.now()).delete()
+    return deleted
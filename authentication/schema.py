@@ -0,0 +1,7 @@
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+
+
+class StatelessJWTScheme(SimpleJWTScheme):
+    """Documents StatelessJWTAuthentication as the JWT bearer scheme"""
+
+    target_class = "authentication.backends.StatelessJWTAuthentication"
@@ -0,0 +1,28 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from authentication.models import TokenUser
+from authentication.revocation import revoke_token_version, revoke_user_tokens
+
+User = get_user_model()
+
+# Fields copied into, or checked for, every token: tokens issued before a
+# change of one of them no longer describe the user
+TOKEN_FIELDS = {"is_active", "user_type"}
+
+
+@receiver(post_save, sender=User)
+@receiver(post_save, sender=TokenUser)
+def revoke_tokens_on_change(sender, instance, created, **kwargs):
+    """The user was deactivated, reactivated or changed type"""
+    # Saves send the signal before the dirty fields snapshot is refreshed
+    if not created and TOKEN_FIELDS.intersection(instance.get_dirty_fields()):
+        revoke_user_tokens(instance)
+
+
+@receiver(post_delete, sender=User)
+@receiver(post_delete, sender=TokenUser)
+def revoke_tokens_on_delete(sender, instance, **kwargs):
+    """The user was deleted"""
+    revoke_token_version(instance.pk, instance.token_version)
@@ -0,0 +1,245 @@
+"""
+Audit log.
+
+Security and editorial events (logins, registrations, publications,
+subscription changes) are recorded with ``audit(event, **fields)`` as JSON
+lines in ``logs/audit.log``. Each event has a schema in ``EVENT_SCHEMAS``:
+the fields it must carry, no more and no less, so the log stays queryable.
+
+Request threads never touch the file. ``AsyncAuditHandler`` puts the
+records on a bounded queue and a ``BatchingQueueListener`` thread formats
+and writes them, draining the queue in batches of one write and one flush
+each. Formatting happens in that thread too, and ``audit`` returns before
+building anything when the logger is disabled. When the queue is full,
+records are dropped rather than blocking requests (or block for at most
+``block`` seconds); the number dropped is logged as an ``audit.dropped``
+event once the queue has room again.
+"""
+
+import json
+import logging
+import os
+import queue
+import threading
+from datetime import UTC, date, datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+logger = logging.getLogger("audit")
+
+EVENT_SCHEMAS = {
+    "login.succeeded": ("username", "ip"),
+    "login.failed": ("username", "ip"),
+    "login.locked": ("username", "ip"),
+    "logout": ("user_id", "username"),
+    "user.registered": ("username", "email"),
+    "password.changed": ("user_id", "username"),
+    "password.change_failed": ("user_id", "username"),
+    "news.created": ("news_id", "title", "status", "author"),
+    "news.updated": ("news_id", "title", "user"),
+    "news.published": ("news_id", "title", "user"),
+    "news.unpublished": ("news_id", "title", "user"),
+    "news.scheduled": ("news_id", "title", "user", "scheduled_for"),
+    "news.publish_denied": ("news_id", "user"),
+    "subscription.created": ("subscription_id", "user_id", "plan_id", "status", "by"),
+    "subscription.updated": ("subscription_id", "user_id", "plan_id", "status", "by"),
+    "subscription.deleted": ("subscription_id", "user_id", "plan_id", "status", "by"),
+}
+
+
+def audit(event, **fields):
+    """Record ``event``, whose ``fields`` must match its schema"""
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    schema = EVENT_SCHEMAS[event]
+    if len(fields) != len(schema) or not all(name in fields for name in schema):
+        raise ValueError(
+            f"Audit event {event!r} takes {', '.join(schema)}, got {', '.join(fields)}"
+        )
+    logger.info(event, extra={"audit": fields})
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record: time, level, event and its fields"""
+
+    def format(self, record):
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, tz=UTC).isoformat(),
+            "level": record.levelname,
+            "event": record.getMessage(),
+        }
+        entry.update(getattr(record, "audit", {}))
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=_json_default, ensure_ascii=False)
+
+
+class BatchRotatingFileHandler(RotatingFileHandler):
+    """``RotatingFileHandler`` that also writes a batch of records at once"""
+
+    def handle_batch(self, records):
+        records = [record for record in records if self.filter(record)]
+        if not records:
+            return
+        self.acquire()
+        try:
+            data = "".join(self.format(record) + self.terminator for record in records)
+            if self.stream is None:
+                self.stream = self._open()
+            position = self.stream.tell()
+            if self.maxBytes > 0 and position and position + len(data) > self.maxBytes:
+                self.doRollover()
+            self.stream.write(data)
+            self.stream.flush()
+        except (OSError, TypeError, ValueError):
+            # Write or format errors, reported like logging.Handler.emit does
+            self.handleError(records[0])
+        finally:
+            self.release()
+
+
+class BatchingQueueListener(QueueListener):
+    """
+    ``QueueListener`` that hands its handlers everything queued so far at
+    once, up to ``batch_size`` records, instead of one record at a time.
+    """
+
+    def __init__(self, queue, *handlers, batch_size=500, before_batch=None):
+        super().__init__(queue, *handlers, respect_handler_level=True)
+        self.batch_size = batch_size
+        # Returns records to write ahead of each batch
+        self.before_batch = before_batch
+
+    def enqueue_sentinel(self):
+        # Waits for room, where the default put_nowait() fails on a full queue
+        self.queue.put(self._sentinel)
+
+    def handle_batch(self, records):
+        if self.before_batch is not None:
+            records = self.before_batch() + records
+        for handler in self.handlers:
+            accepted = [record for record in records if record.levelno >= handler.level]
+            if hasattr(handler, "handle_batch"):
+                handler.handle_batch(accepted)
+            else:
+                for record in accepted:
+                    handler.handle(record)
+
+    def _monitor(self):
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            records = [record for record in batch if record is not self._sentinel]
+            if records:
+                self.handle_batch(records)
+            for _ in batch:
+                self.queue.task_done()
+            if len(records) < len(batch):
+                return
+
+
+class AsyncAuditHandler(QueueHandler):
+    """
+    Queues records for a ``BatchingQueueListener`` that writes them as JSON
+    lines to a rotating file.
+
+    The listener thread is started by the first record of each process, so
+    servers that fork workers after loading the settings get one per worker.
+    """
+
+    def __init__(
+        self,
+        filename,
+        max_bytes=0,
+        backup_count=0,
+        queue_size=10_000,
+        batch_size=500,
+        block=0.0,
+    ):
+        super().__init__(queue.Queue(queue_size))
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.block = block
+        self.dropped = 0
+        self.target = BatchRotatingFileHandler(
+            filename,
+            maxBytes=max_bytes,
+            backupCount=backup_count,
+            encoding="utf-8",
+            delay=True,
+        )
+        self.target.setFormatter(JsonFormatter())
+        self._listener = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def _ensure_listener(self):
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            if self._pid is not None:
+                # Forked: the parent's queue and thread are not ours
+                self.queue = queue.Queue(self.queue_size)
+                self.dropped = 0
+            self._listener = BatchingQueueListener(
+                self.queue,
+                self.target,
+                batch_size=self.batch_size,
+                before_batch=self._dropped_records,
+            )
+            self._listener.start()
+            self._pid = os.getpid()
+
+    def _dropped_records(self):
+        with self._lock:
+            dropped, self.dropped = self.dropped, 0
+        if not dropped:
+            return []
+        return [
+            logging.makeLogRecord(
+                {
+                    "name": logger.name,
+                    "levelno": logging.WARNING,
+                    "levelname": logging.getLevelName(logging.WARNING),
+                    "msg": "audit.dropped",
+                    "audit": {"count": dropped},
+                }
+            )
+        ]
+
+    def prepare(self, record):
+        # Formatted by the listener, off the request thread
+        return record
+
+    def enqueue(self, record):
+        self._ensure_listener()
+        try:
+            self.queue.put(record, block=self.block > 0, timeout=self.block or None)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+
+    def flush(self):
+        """Wait until the listener wrote everything queued"""
+        if self._listener is not None and self._pid == os.getpid():
+            self.queue.join()
+
+    def close(self):
+        with self._lock:
+            listener, self._listener = self._listener, None
+        if listener is not None and self._pid == os.getpid():
+            listener.stop()
+        self._pid = None
+        self.target.close()
+        super().close()
@@ -0,0 +1,248 @@
+"""
+Two-level cache backend.
+
+``TieredCache`` keeps a small in-process LRU (L1) in front of a shared cache
+(L2, Redis in production, a file-based cache locally), so hot keys such as a
+reader's entitlements are served without a network round trip while every
+worker still shares the same data.
+
+Keys are grouped in namespaces by the prefix before the first ``:``
+(``"entitlements:user_1"`` belongs to ``entitlements``). Deleting a key bumps
+a version counter for its namespace in L2; every process re-reads the
+versions of the namespaces it holds at most every ``SYNC_INTERVAL`` seconds
+and drops L1 entries written under an older version. Invalidation must
+therefore go through ``delete``/``delete_many``/``clear``: ``set`` only
+reaches other processes once their L1 entry expires.
+
+Configuration::
+
+    CACHES = {
+        "default": {
+            "BACKEND": "core.cache.TieredCache",
+            "LOCATION": "shared",  # alias of the L2 cache
+            "OPTIONS": {"L1_MAX_ENTRIES": 5000, "L1_TIMEOUT": 30, "SYNC_INTERVAL": 1},
+        },
+        "shared": {...},
+    }
+"""
+
+import pickle
+import threading
+import time
+from collections import Counter, OrderedDict, defaultdict
+
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+
+DEFAULT_NAMESPACE = "default"
+VERSION_KEY = "cache-namespace-version:{namespace}"
+
+# One L1 store per LOCATION and process, shared by all threads like LocMemCache
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+class _LocalStore:
+    """In-process LRU with namespace versions and hit/miss counters"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()  # key -> (pickled, expires_at, namespace_version)
+        self.versions = {}  # namespace -> last version read from L2
+        self.synced_at = 0.0
+        self.stats = defaultdict(Counter)
+
+
+def get_namespace(key):
+    namespace, separator, _ = str(key).partition(":")
+    return namespace if separator else DEFAULT_NAMESPACE
+
+
+class TieredCache(BaseCache):
+    def __init__(self, location, params):
+        super().__init__(params)
+        options = params.get("OPTIONS", {})
+        self._shared_alias = location
+        self._l1_max_entries = int(options.get("L1_MAX_ENTRIES", 5000))
+        self._l1_timeout = float(options.get("L1_TIMEOUT", 30))
+        self._sync_interval = float(options.get("SYNC_INTERVAL", 1))
+
+        with _stores_lock:
+            self._store = _stores.setdefault(location, _LocalStore())
+
+    @property
+    def shared(self):
+        return caches[self._shared_alias]
+
+    # Namespace versions
+
+    def _namespace_version(self, namespace):
+        """Current version of ``namespace``, refreshed from L2 when stale"""
+        store = self._store
+        now = time.monotonic()
+        with store.lock:
+            stale = now - store.synced_at > self._sync_interval
+            known = namespace in store.versions
+
+        if stale or not known:
+            namespaces = set(store.versions) | {namespace}
+            keys = {VERSION_KEY.format(namespace=name): name for name in namespaces}
+            versions = self.shared.get_many(list(keys))
+            with store.lock:
+                for key, name in keys.items():
+                    store.versions[name] = versions.get(key, 0)
+                store.synced_at = now
+
+        return store.versions[namespace]
+
+    def _bump_namespaces(self, keys):
+        store = self._store
+        for namespace in {get_namespace(key) for key in keys}:
+            version_key = VERSION_KEY.format(namespace=namespace)
+            try:
+                version = self.shared.incr(version_key)
+            except ValueError:
+                version = 1
+                self.shared.set(version_key, version, None)
+            with store.lock:
+                store.versions[namespace] = version
+
+    # L1 helpers
+
+    def _l1_get(self, key, namespace):
+        version = self._namespace_version(namespace)
+        store = self._store
+        with store.lock:
+            entry = store.entries.get(key)
+            if entry is None:
+                return False, None
+            pickled, expires_at, entry_version = entry
+            if expires_at <= time.monotonic() or entry_version != version:
+                del store.entries[key]
+                return False, None
+            store.entries.move_to_end(key)
+        return True, pickle.loads(pickled)
+
+    def _l1_set(self, key, value, timeout):
+        namespace = get_namespace(key)
+        version = self._namespace_version(namespace)
+        l1_timeout = self._l1_timeout
+        if timeout is not None:
+            l1_timeout = min(l1_timeout, timeout)
+        if l1_timeout <= 0:
+            self._l1_delete(key)
+            return
+
+        pickled = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        expires_at = time.monotonic() + l1_timeout
+        store = self._store
+        with store.lock:
+            store.entries[key] = (pickled, expires_at, version)
+            store.entries.move_to_end(key)
+            while len(store.entries) > self._l1_max_entries:
+                store.entries.popitem(last=False)
+
+    def _l1_delete(self, key):
+        with self._store.lock:
+            self._store.entries.pop(key, None)
+
+    def _l1_key(self, key, version):
+        return f"{self.version if version is None else version}:{key}"
+
+    def _timeout(self, timeout):
+        if timeout is DEFAULT_TIMEOUT:
+            return self.default_timeout
+        return timeout
+
+    # Cache API
+
+    def get(self, key, default=None, version=None):
+        namespace = get_namespace(key)
+        l1_key = self._l1_key(key, version)
+        found, value = self._l1_get(l1_key, namespace)
+        if found:
+            self._record(namespace, "l1_hits")
+            return value
+
+        sentinel = object()
+        value = self.shared.get(key, sentinel, version=version)
+        if value is sentinel:
+            self._record(namespace, "misses")
+            return default
+
+        self._record(namespace, "l2_hits")
+        self._l1_set(l1_key, value, self._l1_timeout)
+        return value
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        timeout = self._timeout(timeout)
+        self.shared.set(key, value, timeout, version=version)
+        self._l1_set(self._l1_key(key, version), value, timeout)
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        timeout = self._timeout(timeout)
+        added = self.shared.add(key, value, timeout, version=version)
+        if added:
+            self._l1_set(self._l1_key(key, version), value, timeout)
+        return added
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        return self.shared.touch(key, self._timeout(timeout), version=version)
+
+    def delete(self, key, version=None):
+        deleted = self.shared.delete(key, version=version)
+        self._l1_delete(self._l1_key(key, version))
+        self._bump_namespaces([key])
+        return deleted
+
+    def delete_many(self, keys, version=None):
+        keys = list(keys)
+        if not keys:
+            return
+        self.shared.delete_many(keys, version=version)
+        for key in keys:
+            self._l1_delete(self._l1_key(key, version))
+        self._bump_namespaces(keys)
+
+    def has_key(self, key, version=None):
+        return self.shared.has_key(key, version=version)
+
+    def incr(self, key, delta=1, version=None):
+        value = self.shared.incr(key, delta, version=version)
+        self._l1_delete(self._l1_key(key, version))
+        return value
+
+    def clear(self):
+        self.shared.clear()
+        with self._store.lock:
+            self._store.entries.clear()
+            self._store.versions.clear()
+            self._store.synced_at = 0.0
+
+    def close(self, **kwargs):
+        self.shared.close(**kwargs)
+
+    # Metrics
+
+    def _record(self, namespace, counter):
+        with self._store.lock:
+            self._store.stats[namespace][counter] += 1
+
+    def stats(self):
+        """Hit/miss counters of this process, per namespace"""
+        with self._store.lock:
+            stats = {
+                namespace: dict(counters)
+                for namespace, counters in self._store.stats.items()
+            }
+            l1_entries = len(self._store.entries)
+
+        for counters in stats.values():
+            lookups = sum(counters.get(name, 0) for name in ("l1_hits", "l2_hits"))
+            total = lookups + counters.get("misses", 0)
+            counters["hit_ratio"] = round(lookups / total, 4) if total else None
+        return {"l1_entries": l1_entries, "namespaces": stats}
+
+    def reset_stats(self):
+        with self._store.lock:
+            self._store.stats.clear()
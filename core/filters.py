@@ -0,0 +1,113 @@
+import re
+
+from django.contrib.postgres.lookups import TrigramWordSimilar
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    TrigramWordSimilarity,
+)
+from django.db import connections
+from django.db.models import F, Q
+from django.db.models.functions import Greatest, Upper
+from rest_framework import filters
+from rest_framework.settings import api_settings
+
+
+class RankedSearchFilter(filters.SearchFilter):
+    """
+    Base for Postgres-specific search backends that annotate a relevance rank.
+
+    Unless the client asks for an explicit ``ordering``, results are sorted by
+    rank first, so these backends must run after ``OrderingFilter``. On other
+    databases (SQLite in ``DB_DEBUG`` mode) they fall back to the ``ILIKE``
+    lookups of ``SearchFilter`` over ``search_fields``.
+    """
+
+    rank_annotation = "search_rank"
+
+    def is_supported(self, queryset):
+        return connections[queryset.db].vendor == "postgresql"
+
+    def order_by_rank(self, request, queryset):
+        if api_settings.ORDERING_PARAM in request.query_params:
+            return queryset
+        ordering = queryset.query.order_by or queryset.model._meta.ordering
+        return queryset.order_by(f"-{self.rank_annotation}", *ordering)
+
+
+class FullTextSearchFilter(RankedSearchFilter):
+    """
+    ``SearchFilter`` backed by a stored ``tsvector`` column on Postgres.
+
+    Views opt in by setting ``search_vector_field``. Every search term must
+    match (as a prefix, after stemming) and results are ranked with
+    ``ts_rank``, so title (weight A) beats subtitle (B) and content (C).
+    """
+
+    search_config = "portuguese"
+
+    def filter_queryset(self, request, queryset, view):
+        vector_field = getattr(view, "search_vector_field", None)
+        search_terms = self.get_search_terms(request)
+        if not vector_field or not search_terms or not self.is_supported(queryset):
+            return super().filter_queryset(request, queryset, view)
+
+        query = self.get_search_query(search_terms, view)
+        if query is None:
+            return super().filter_queryset(request, queryset, view)
+
+        queryset = queryset.filter(**{vector_field: query}).annotate(
+            **{self.rank_annotation: SearchRank(F(vector_field), query)}
+        )
+        return self.order_by_rank(request, queryset)
+
+    def get_search_query(self, search_terms, view):
+        """AND of prefix matches for every word in the search terms"""
+        words = [word for term in search_terms for word in re.findall(r"\w+", term)]
+        if not words:
+            return None
+
+        config = getattr(view, "search_config", self.search_config)
+        raw_query = " & ".join(f"{word}:*" for word in words)
+        return SearchQuery(raw_query, config=config, search_type="raw")
+
+
+class TrigramSearchFilter(RankedSearchFilter):
+    """
+    Fuzzy, type-ahead friendly ``SearchFilter`` using ``pg_trgm``.
+
+    A term matches when any of ``search_fields`` contains it (``icontains``)
+    or is word-similar to it (``%>``, tolerates typos). Both predicates are
+    written over ``UPPER(column)``, the expression Django uses for
+    ``icontains``, so a single GIN ``gin_trgm_ops`` index on ``Upper(column)``
+    serves them. Results are ranked by the best ``word_similarity`` across
+    the fields.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        search_fields = self.get_search_fields(view, request)
+        search_terms = self.get_search_terms(request)
+        if not search_fields or not search_terms or not self.is_supported(queryset):
+            return super().filter_queryset(request, queryset, view)
+
+        field_names = [
+            field[1:] if field[0] in self.lookup_prefixes else field
+            for field in search_fields
+        ]
+
+        condition = Q()
+        for term in search_terms:
+            term_condition = Q()
+            for name in field_names:
+                term_condition |= Q(**{f"{name}__icontains": term})
+                term_condition |= Q(TrigramWordSimilar(Upper(name), term))
+            condition &= term_condition
+
+        search = " ".join(search_terms)
+        similarities = [TrigramWordSimilarity(search, name) for name in field_names]
+        rank = similarities[0] if len(similarities) == 1 else Greatest(*similarities)
+
+        queryset = queryset.filter(condition).annotate(**{self.rank_annotation: rank})
+        if self.must_call_distinct(queryset, search_fields):
+            queryset = queryset.distinct()
+        return self.order_by_rank(request, queryset)
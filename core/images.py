@@ -0,0 +1,164 @@
+"""
+Image renditions.
+
+``generate_renditions`` reads an uploaded image from its storage and writes
+one downscaled copy per configured size, in the original format and in WebP,
+next to the original: ``photo.jpg`` gets ``photo.thumbnail.jpg`` and
+``photo.thumbnail.webp``. The result is a JSON-serializable map meant to be
+stored on the model::
+
+    {
+        "source": "news/images/2026/10/17/photo.jpg",
+        "thumbnail": {"width": 320, "height": 180,
+                      "image": ".../photo.thumbnail.jpg",
+                      "webp": ".../photo.thumbnail.webp"},
+        ...
+    }
+
+``sanitize_image`` is the upload worker's step before that: it validates a
+received file and re-encodes it without its metadata.
+"""
+
+import os
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+# Pillow format -> extension and encoder options of the fallback rendition
+FORMATS = {
+    "JPEG": ("jpg", {"quality": 85, "optimize": True, "progressive": True}),
+    "PNG": ("png", {"optimize": True}),
+}
+WEBP_OPTIONS = {"quality": 80, "method": 4}
+
+
+class InvalidImage(ValueError):
+    """The file is not an image that can be accepted"""
+
+
+def _encode(image, image_format, options):
+    buffer = BytesIO()
+    image.save(buffer, format=image_format, **options)
+    return ContentFile(buffer.getvalue())
+
+
+def _save(storage, name, content):
+    # Renditions are derived data: overwrite instead of getting a new name
+    if storage.exists(name):
+        storage.delete(name)
+    return storage.save(name, content)
+
+
+def _output_format(image, image_format):
+    """Encoder and extension for ``image``, converted to suit them"""
+    if image_format not in FORMATS:
+        image_format = "PNG" if image.has_transparency_data else "JPEG"
+    if image_format == "JPEG" and image.mode not in ("RGB", "L"):
+        image = image.convert("RGB")
+    extension, options = FORMATS[image_format]
+    return image, image_format, extension, options
+
+
+def sanitize_image(source, max_size, max_pixels, formats):
+    """
+    Decode the image in the binary file ``source`` and re-encode it without
+    its metadata (EXIF, GPS, comments), rotated according to its EXIF
+    orientation and downscaled to fit ``max_size``.
+
+    Raise ``InvalidImage`` when the file is not an image, is damaged, is in
+    none of ``formats`` or has more than ``max_pixels`` pixels. Return the
+    new file with its extension and its dimensions.
+    """
+    try:
+        image = Image.open(source)
+        if image.format not in formats:
+            raise InvalidImage(f"Unsupported image format: {image.format}.")
+        # Checked on the header, before any pixel is decoded
+        if image.width * image.height > max_pixels:
+            raise InvalidImage(f"Image too large: {image.width}x{image.height} pixels.")
+        image_format = image.format
+        image = ImageOps.exif_transpose(image)
+        image.load()
+    except (UnidentifiedImageError, Image.DecompressionBombError):
+        raise InvalidImage("The file is not a valid image.")
+    except OSError:
+        raise InvalidImage("The image is damaged or truncated.")
+
+    image.thumbnail(max_size, Image.Resampling.LANCZOS)
+    image, image_format, extension, options = _output_format(image, image_format)
+    # Some encoders read defaults from image.info: only the color profile stays
+    image.info = {
+        key: value for key, value in image.info.items() if key == "icc_profile"
+    }
+    return _encode(image, image_format, options), extension, image.width, image.height
+
+
+def generate_renditions(field_file, sizes):
+    """
+    Write the renditions of ``field_file`` for ``sizes`` (``{name: (max
+    width, max height)}``) and return the renditions map.
+
+    Images are never upscaled. The fallback rendition keeps JPEG or PNG,
+    anything else (GIF, BMP...) is written as PNG, or JPEG when it has no
+    transparency.
+    """
+    storage = field_file.storage
+    base, _ = os.path.splitext(field_file.name)
+
+    with storage.open(field_file.name, "rb") as source:
+        original = Image.open(source)
+        original_format = original.format
+        original = ImageOps.exif_transpose(original)
+        original.load()
+
+    original, original_format, extension, options = _output_format(
+        original, original_format
+    )
+
+    renditions = {"source": field_file.name}
+    for name, size in sizes.items():
+        image = original.copy()
+        image.thumbnail(size, Image.Resampling.LANCZOS)
+        renditions[name] = {
+            "width": image.width,
+            "height": image.height,
+            "image": _save(
+                storage,
+                f"{base}.{name}.{extension}",
+                _encode(image, original_format, options),
+            ),
+            "webp": _save(
+                storage, f"{base}.{name}.webp", _encode(image, "WEBP", WEBP_OPTIONS)
+            ),
+        }
+    return renditions
+
+
+def delete_renditions(storage, renditions):
+    """Remove the files listed in a renditions map"""
+    for name, rendition in renditions.items():
+        if name == "source":
+            continue
+        for key in ("image", "webp"):
+            if rendition.get(key):
+                storage.delete(rendition[key])
+
+
+def rendition_urls(storage, renditions, request=None):
+    """Public URLs of a renditions map, as exposed by the API"""
+
+    def url(name):
+        url = storage.url(name)
+        return request.build_absolute_uri(url) if request is not None else url
+
+    return {
+        name: {
+            "width": rendition["width"],
+            "height": rendition["height"],
+            "url": url(rendition["image"]),
+            "webp": url(rendition["webp"]),
+        }
+        for name, rendition in renditions.items()
+        if name != "source"
+    }
@@ -0,0 +1,63 @@
+from django.contrib.postgres.indexes import PostgresIndex
+from django.db import migrations
+
+
+class AddPostgresIndex(migrations.AddIndex):
+    """
+    AddIndex for Postgres-only index types (GIN, trigram...).
+
+    The index is recorded in the migration state on every backend, so
+    ``makemigrations`` stays clean, but it is only created on Postgres. In
+    ``DB_DEBUG`` mode (SQLite) the operation is a no-op.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+
+
+def _without_postgres_indexes(state, app_label, model_name):
+    """Copy of ``state`` whose model has no Postgres-only index"""
+    state = state.clone()
+    model_state = state.models[app_label, model_name]
+    model_state.options["indexes"] = [
+        index
+        for index in model_state.options.get("indexes", [])
+        if not isinstance(index, PostgresIndex)
+    ]
+    state.reload_model(app_label, model_name, delay=True)
+    return state
+
+
+class AddFieldBesidePostgresIndexes(migrations.AddField):
+    """
+    AddField for models with ``AddPostgresIndex`` indexes.
+
+    SQLite adds most columns by rebuilding the table, along with every index
+    in the migration state, including the ones it cannot create. Outside
+    Postgres the rebuild ignores them, as ``AddPostgresIndex`` does.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor != "postgresql":
+            from_state = _without_postgres_indexes(
+                from_state, app_label, self.model_name_lower
+            )
+            to_state = _without_postgres_indexes(
+                to_state, app_label, self.model_name_lower
+            )
+        super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor != "postgresql":
+            from_state = _without_postgres_indexes(
+                from_state, app_label, self.model_name_lower
+            )
+            to_state = _without_postgres_indexes(
+                to_state, app_label, self.model_name_lower
+            )
+        super().database_backwards(app_label, schema_editor, from_state, to_state)
@@ -0,0 +1,79 @@
+import copy
+
+
+class DirtyFieldsMixin:
+    """
+    Model mixin that makes ``save()`` write only the columns that changed.
+
+    Values are snapshotted when a row is loaded (``from_db``) and after each
+    save. A plain ``save()`` of an existing row becomes
+    ``save(update_fields=<changed fields + auto_now fields>)``, so setting a
+    status no longer rewrites large columns such as ``News.content``. An
+    explicit ``update_fields``, ``force_insert``/``force_update``, new rows and
+    instances that were not loaded from the database keep Django's default
+    behaviour, as does a save with nothing changed on a model without
+    ``auto_now`` fields.
+    """
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._snapshot_fields()
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None, **kwargs):
+        super().refresh_from_db(using=using, fields=fields, **kwargs)
+        self._snapshot_fields(fields)
+
+    def _field_state(self, field):
+        # Files are compared by name: FieldFile objects are mutated in place
+        return field.get_prep_value(field.value_from_object(self))
+
+    def _snapshot_fields(self, names=None):
+        loaded = self.__dict__
+        snapshot = self.__dict__.setdefault("_loaded_field_values", {})
+        for field in self._meta.concrete_fields:
+            if field.attname not in loaded:
+                continue  # Deferred
+            if names is None or field.name in names or field.attname in names:
+                # Copied: JSON values are the live dicts/lists, which callers
+                # mutate in place, and the snapshot must not change with them
+                snapshot[field.attname] = copy.deepcopy(self._field_state(field))
+
+    def get_dirty_fields(self):
+        """Names of the loaded fields whose value changed since the snapshot"""
+        snapshot = self.__dict__.get("_loaded_field_values", {})
+        return [
+            field.name
+            for field in self._meta.concrete_fields
+            if not field.primary_key
+            and field.attname in self.__dict__
+            and (
+                field.attname not in snapshot
+                or snapshot[field.attname] != self._field_state(field)
+            )
+        ]
+
+    def save(self, *args, **kwargs):
+        tracked = (
+            not self._state.adding
+            and "_loaded_field_values" in self.__dict__
+            and not args
+            and kwargs.get("update_fields") is None
+            and not kwargs.get("force_insert")
+            and not kwargs.get("force_update")
+        )
+        if tracked:
+            auto_now = [
+                field.name
+                for field in self._meta.concrete_fields
+                if getattr(field, "auto_now", False)
+            ]
+            dirty = self.get_dirty_fields()
+            if dirty or auto_now:
+                kwargs["update_fields"] = list(dict.fromkeys(dirty + auto_now))
+
+        super().save(*args, **kwargs)
+
+        saved = kwargs.get("update_fields")
+        self._snapshot_fields(None if saved is None else set(saved))
@@ -0,0 +1,240 @@
+import binascii
+import json
+import operator
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from functools import partial, reduce
+
+from django.core.exceptions import ValidationError
+from django.core.paginator import Paginator
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class CountedPaginator(Paginator):
+    """Django ``Paginator`` that can be handed a row count computed elsewhere"""
+
+    def __init__(self, object_list, per_page, count=None, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        if count is not None:
+            # Shadows the ``count`` cached_property, skipping its COUNT(*)
+            self.count = count
+
+
+class KnownCountPageNumberPagination(PageNumberPagination):
+    """
+    ``PageNumberPagination`` that skips its ``COUNT(*)`` when the view already
+    knows the size of the filtered queryset and sets ``known_count``.
+    """
+
+    known_count = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.django_paginator_class = partial(CountedPaginator, count=self.known_count)
+        return super().paginate_queryset(queryset, request, view)
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor (keyset) pagination over a composite ordering.
+
+    Unlike DRF's ``CursorPagination``, which positions on the first ordering
+    field only, the cursor here stores the full key of the boundary row, so
+    nullable and non-unique columns can be part of the ordering as long as the
+    last field is unique (usually ``id``). Each page is a single
+    ``WHERE key < boundary ORDER BY key LIMIT page_size + 1`` query, with no
+    ``COUNT(*)`` and no ``OFFSET``, so page N costs the same as page 1.
+
+    NULL values sort as larger than any other value, as in Postgres' default
+    ``ORDER BY``, so plain ``DESC`` indexes can serve the scan.
+    """
+
+    page_size = api_settings.PAGE_SIZE
+    cursor_query_param = "cursor"
+    mode_query_param = "pagination"
+    mode_query_value = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+
+    # Ordering of the keyset, e.g. ("-publication_date", "-created_at", "-id")
+    keyset = ()
+
+    @classmethod
+    def is_requested(cls, request):
+        """Whether the request asked for keyset pagination instead of pages"""
+        params = request.query_params
+        return (
+            cls.cursor_query_param in params
+            or params.get(cls.mode_query_param) == cls.mode_query_value
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.model = queryset.model
+        cursor = self.decode_cursor(request)
+
+        if cursor is None:
+            values, self.reverse = None, False
+        else:
+            values, self.reverse = cursor
+
+        queryset = self.get_page_queryset(queryset, values, self.reverse)
+        results = list(queryset[: self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[: self.page_size]
+
+        if self.reverse:
+            results.reverse()
+            self.has_next, self.has_previous = values is not None, has_more
+        else:
+            self.has_next, self.has_previous = has_more, values is not None
+
+        self.page = results
+        return results
+
+    def get_page_queryset(self, queryset, values=None, reverse=False):
+        """Order ``queryset`` by the keyset and start it after ``values``"""
+        queryset = queryset.order_by(*self._ordering(reverse))
+        if values is not None:
+            queryset = queryset.filter(self._after(values, reverse))
+        return queryset
+
+    def get_position(self, obj):
+        """Keyset values of ``obj``, in keyset order"""
+        return [getattr(obj, name) for name, _ in self._fields()]
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "The pagination cursor value.",
+                "schema": {"type": "string"},
+            }
+        ]
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def encode_cursor(self, obj, reverse):
+        values = [
+            value.isoformat() if hasattr(value, "isoformat") else value
+            for value in self.get_position(obj)
+        ]
+
+        payload = json.dumps({"k": values, "r": int(reverse)}, separators=(",", ":"))
+        token = urlsafe_b64encode(payload.encode("ascii")).decode("ascii")
+        url = remove_query_param(self.base_url, self.mode_query_param)
+        return replace_query_param(url, self.cursor_query_param, token)
+
+    def decode_cursor(self, request):
+        """Return ``(values, reverse)`` for the request cursor, or None"""
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None
+
+        try:
+            payload = json.loads(urlsafe_b64decode(token.encode("ascii")))
+            raw_values = payload["k"]
+            reverse = bool(payload.get("r", 0))
+            fields = self._fields()
+            if len(raw_values) != len(fields):
+                raise ValueError
+            values = [
+                None if raw is None else self.model._meta.get_field(name).to_python(raw)
+                for raw, (name, _) in zip(raw_values, fields)
+            ]
+        except (
+            binascii.Error,
+            json.JSONDecodeError,
+            KeyError,
+            TypeError,
+            ValueError,
+            ValidationError,
+        ) as exc:
+            # Malformed base64 or JSON, or keys that do not fit the keyset
+            raise NotFound(self.invalid_cursor_message) from exc
+
+        return values, reverse
+
+    def _fields(self):
+        return [(field.lstrip("-"), field.startswith("-")) for field in self.keyset]
+
+    def _ordering(self, reverse):
+        ordering = []
+        for name, descending in self._fields():
+            if descending != reverse:
+                ordering.append(F(name).desc(nulls_first=True))
+            else:
+                ordering.append(F(name).asc(nulls_last=True))
+        return ordering
+
+    def _after(self, values, reverse):
+        """Build the predicate selecting rows strictly after the boundary key"""
+        fields = self._fields()
+        branches = []
+        equal = Q()
+        for (name, descending), value in zip(fields, values):
+            beyond = self._beyond(name, descending != reverse, value)
+            if beyond is not None:
+                branches.append(equal & beyond)
+            if value is None:
+                equal &= Q(**{f"{name}__isnull": True})
+            else:
+                equal &= Q(**{name: value})
+        condition = reduce(operator.or_, branches)
+
+        # Redundant bound on the leading column: the OR chain alone cannot be
+        # used as an index range, this lets the scan start at the boundary.
+        name, descending = fields[0]
+        if values[0] is not None and descending != reverse:
+            condition &= Q(**{f"{name}__lte": values[0]})
+        return condition
+
+    @staticmethod
+    def _beyond(name, descending, value):
+        """
+        Rows whose ``name`` column is strictly past ``value`` when scanning in
+        the given direction, or None when nothing can be past it.
+        """
+        if descending:
+            # NULLs come first, everything non-null is past a NULL boundary
+            if value is None:
+                return Q(**{f"{name}__isnull": False})
+            return Q(**{f"{name}__lt": value})
+
+        # NULLs come last, nothing is past a NULL boundary
+        if value is None:
+            return None
+        return Q(**{f"{name}__gt": value}) | Q(**{f"{name}__isnull": True})
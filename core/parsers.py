@@ -0,0 +1,36 @@
+import codecs
+import json
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+
+class NDJSONParser(BaseParser):
+    """
+    Newline-delimited JSON (one JSON value per line).
+
+    The body is parsed lazily: ``request.data`` is a generator reading the
+    stream line by line, so consumers that work in chunks keep memory flat
+    however long the stream is. A line that is not valid JSON yields a
+    ``ParseError`` in its place instead of aborting the whole stream.
+    """
+
+    media_type = "application/x-ndjson"
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        if stream is None:
+            return iter(())
+        return self._iter_lines(codecs.getreader(encoding)(stream))
+
+    @staticmethod
+    def _iter_lines(reader):
+        for number, line in enumerate(reader, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError as exc:
+                yield ParseError(f"Line {number}: JSON parse error - {exc}")
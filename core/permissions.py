@@ -0,0 +1,67 @@
+from rest_framework import permissions
+
+from core import policies
+
+
+class PolicyPermission(permissions.BasePermission):
+    """
+    Permission class checking ``core.policies`` rules.
+
+    ``rule`` is checked for every request and ``object_rule`` for each object
+    the view checks; either can be left unset. With ``read_only_objects``,
+    safe methods skip the object rule.
+    """
+
+    rule = None
+    object_rule = None
+    read_only_objects = False
+
+    def has_permission(self, request, view):
+        if self.rule is None:
+            return True
+        return policies.is_allowed(request, self.rule)
+
+    def has_object_permission(self, request, view, obj):
+        if self.object_rule is None:
+            return True
+        if self.read_only_objects and request.method in permissions.SAFE_METHODS:
+            return True
+        return policies.is_allowed(request, self.object_rule, obj)
+
+
+class IsAdminUser(PolicyPermission):
+    """Permission to allow only admin users"""
+
+    rule = staticmethod(policies.is_admin)
+
+
+class IsEditor(PolicyPermission):
+    """Permission to allow only editor users"""
+
+    rule = staticmethod(policies.is_editor)
+
+
+class IsSelf(PolicyPermission):
+    """Permission to allow users to manage only their own data"""
+
+    object_rule = staticmethod(policies.is_self)
+
+
+class IsAdminOrSelf(PolicyPermission):
+    """
+    Permission to allow:
+    - Admin to do anything
+    - Users to view/edit only themselves
+    """
+
+    object_rule = staticmethod(policies.is_admin_or_self)
+
+    def has_permission(self, request, view):
+        return request.user.is_authenticated
+
+
+class ReadOnly(permissions.BasePermission):
+    """Permission to allow read-only access"""
+
+    def has_permission(self, request, view):
+        return request.method in permissions.SAFE_METHODS
@@ -0,0 +1,93 @@
+"""
+Authorization policies.
+
+The rules behind every permission class of the API, written once. A rule is
+a function of the user and, for object rules, the object. Rules read foreign
+keys by id (``news.author_id``), so checking an article never fetches its
+author.
+
+Views and permission classes go through ``is_allowed``, which memoizes each
+decision on the request: ``get_object`` and the view itself often check the
+same object, and a rule such as ``can_view_news`` may need the reader's
+entitlements. Decisions are keyed by rule, model and primary key, so they
+assume the object does not change in a way that matters during the request.
+``allowed_ids`` checks a list of objects in one pass, for bulk endpoints.
+"""
+
+DECISIONS_ATTRIBUTE = "_policy_decisions"
+
+
+# Rules
+
+
+def is_admin(user, obj=None):
+    return user.is_authenticated and user.is_admin()
+
+
+def is_editor(user, obj=None):
+    return user.is_authenticated and user.is_editor()
+
+
+def is_self(user, obj):
+    return user.is_authenticated and obj.pk == user.pk
+
+
+def is_admin_or_self(user, obj):
+    return is_admin(user) or is_self(user, obj)
+
+
+def is_news_author(user, news):
+    return user.is_authenticated and news.author_id == user.pk
+
+
+def can_edit_news(user, news):
+    """Admins edit any article, editors only their own"""
+    return is_admin(user) or (is_editor(user) and is_news_author(user, news))
+
+
+def can_publish_news(user, news):
+    """Admins publish any article, authors their own"""
+    return is_admin(user) or is_news_author(user, news)
+
+
+def can_view_news(user, news):
+    """Drafts are visible to admins and their author, the rest by entitlement"""
+    if not news.is_published:
+        return is_admin(user) or is_news_author(user, news)
+    return user.is_authenticated and user.can_access_content(news)
+
+
+# Evaluation
+
+
+def _decisions(request):
+    decisions = request.__dict__.get(DECISIONS_ATTRIBUTE)
+    if decisions is None:
+        decisions = request.__dict__[DECISIONS_ATTRIBUTE] = {}
+    return decisions
+
+
+def _key(rule, obj):
+    if obj is None:
+        return (rule, None, None)
+    if obj.pk is None:
+        return None  # Unsaved objects are not memoized
+    return (rule, type(obj), obj.pk)
+
+
+def is_allowed(request, rule, obj=None):
+    """Decision of ``rule`` for the request's user, memoized on the request"""
+    key = _key(rule, obj)
+    if key is None:
+        return rule(request.user, obj)
+
+    decisions = _decisions(request)
+    decision = decisions.get(key)
+    if decision is None:
+        decision = decisions[key] = bool(rule(request.user, obj))
+    return decision
+
+
+def allowed_ids(request, rule, objects):
+    """Primary keys of the ``objects`` that ``rule`` allows"""
+    return {obj.pk for obj in objects if is_allowed(request, rule, obj)}
@@ -3,6 +3,7 @@ Django settings for core project.
 """
 
 import os
+import tempfile
 from datetime import timedelta
 from pathlib import Path
 
@@ -44,6 +45,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     # Third party apps
     "rest_framework",
     "rest_framework_simplejwt",
@@ -54,6 +56,7 @@ INSTALLED_APPS = [
     "news",
     "plans",
     "authentication",
+    "uploads",
 ]
 
 MIDDLEWARE = [
@@ -153,6 +156,24 @@ MEDIA_ROOT = BASE_DIR / "media"
 # Create media directory if it doesn't exist
 os.makedirs(MEDIA_ROOT, exist_ok=True)
 
+# Renditions generated for uploaded news images: name -> (max width, max height)
+IMAGE_RENDITIONS = {
+    "thumbnail": (320, 320),
+    "small": (640, 640),
+    "large": (1280, 1280),
+}
+# Generate them in a background thread after the upload is committed
+IMAGE_RENDITIONS_ASYNC = env.bool("IMAGE_RENDITIONS_ASYNC", default=True)
+
+# Image uploads, processed by `manage.py process_uploads`
+UPLOAD_MAX_SIZE = env.int("UPLOAD_MAX_SIZE", default=10 * 1024 * 1024)  # bytes
+UPLOAD_IMAGE_FORMATS = ("JPEG", "PNG", "WEBP", "GIF")
+UPLOAD_IMAGE_MAX_SIZE = (2560, 2560)  # larger images are downscaled
+UPLOAD_IMAGE_MAX_PIXELS = 50_000_000  # larger images are rejected
+# Uploads left "processing" longer than this (a worker died) are retried
+UPLOAD_PROCESSING_TIMEOUT = 10 * 60  # seconds
+UPLOAD_MAX_ATTEMPTS = 3
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/4.2/ref/settings/#default-auto-field
 
@@ -164,7 +185,8 @@ AUTH_USER_MODEL = "users.CustomUser"
 # Django REST Framework settings
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        # Builds the user from the token claims, without a query per request
+        "authentication.backends.StatelessJWTAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
     "DEFAULT_FILTER_BACKENDS": (
@@ -185,6 +207,16 @@ REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
 }
 
+# Login brute-force protection (authentication.login_limiter): failed
+# attempts allowed per sliding window before a lockout, which doubles on
+# each lockout in a row
+LOGIN_ATTEMPTS_CACHE = "shared"
+LOGIN_ATTEMPTS_WINDOW = 15 * 60  # seconds
+LOGIN_MAX_ATTEMPTS_PER_USERNAME = env.int("LOGIN_MAX_ATTEMPTS_PER_USERNAME", default=5)
+LOGIN_MAX_ATTEMPTS_PER_IP = env.int("LOGIN_MAX_ATTEMPTS_PER_IP", default=20)
+LOGIN_LOCKOUT = 60  # seconds
+LOGIN_MAX_LOCKOUT = 24 * 60 * 60  # seconds
+
 # JWT settings
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(hours=1),
@@ -192,14 +224,44 @@ SIMPLE_JWT = {
 }
 
 # Improved cache settings
+# Two-level cache: a per-process LRU (L1) in front of a cache shared by every
+# worker (L2). The L2 is Redis when REDIS_URL is set and a file-based cache
+# otherwise, so local runs and tests still share it across processes. The
+# file-based cache lives outside the source tree (CACHE_DIR, or the system
+# temp dir), where clearing it never touches the checkout.
+REDIS_URL = env("REDIS_URL", default=None)
+
+if REDIS_URL:
+    SHARED_CACHE = {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": REDIS_URL,
+    }
+else:
+    SHARED_CACHE = {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": env(
+            "CACHE_DIR",
+            default=str(Path(tempfile.gettempdir()) / "django-news-api-cache"),
+        ),
+    }
+
 CACHES = {
     "default": {
-        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
-        "LOCATION": "django-news-api",
-    }
+        "BACKEND": "core.cache.TieredCache",
+        "LOCATION": "shared",
+        "OPTIONS": {
+            "L1_MAX_ENTRIES": env.int("CACHE_L1_MAX_ENTRIES", default=5000),
+            "L1_TIMEOUT": env.int("CACHE_L1_TIMEOUT", default=30),
+            "SYNC_INTERVAL": env.float("CACHE_SYNC_INTERVAL", default=1),
+        },
+    },
+    "shared": {**SHARED_CACHE, "KEY_PREFIX": "django-news-api"},
 }
 
 # Logging configuration
+# Audit events waiting to be written; beyond that they are dropped
+AUDIT_LOG_QUEUE_SIZE = env.int("AUDIT_LOG_QUEUE_SIZE", default=10_000)
+
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
@@ -241,8 +303,22 @@ LOGGING = {
             "backupCount": 10,
             "formatter": "verbose",
         },
+        "audit_file": {
+            # Written by a background thread, in batches; see core.audit
+            "()": "core.audit.AsyncAuditHandler",
+            "level": "INFO",
+            "filename": BASE_DIR / "logs" / "audit.log",
+            "max_bytes": 1024 * 1024 * 5,  # 5 MB
+            "backup_count": 10,
+            "queue_size": AUDIT_LOG_QUEUE_SIZE,
+        },
     },
     "loggers": {
+        "audit": {
+            "handlers": ["audit_file"],
+            "level": "INFO",
+            "propagate": False,
+        },
         "django": {
             "handlers": ["console", "file"],
             "propagate": True,
@@ -269,6 +345,10 @@ LOGGING = {
             "handlers": ["console", "file"],
             "level": "INFO",
         },
+        "uploads": {
+            "handlers": ["console", "file"],
+            "level": "INFO",
+        },
     },
 }
 
@@ -293,6 +373,10 @@ SPECTACULAR_SETTINGS = {
             "name": "Subscriptions",
             "description": "Gerenciamento de assinaturas e pagamentos",
         },
+        {
+            "name": "Uploads",
+            "description": "Acompanhamento do processamento de imagens enviadas",
+        },
         {
             "name": "Users",
             "description": "Gerenciamento de usuários e permissões",
@@ -26,6 +26,8 @@ from drf_spectacular.views import (
 )
 from rest_framework.renderers import JSONRenderer
 
+from core.views import CacheStatsView
+
 urlpatterns = [
     path("admin/", admin.site.urls),
     # API Schema documentation - modificado para retornar JSON por padrão
@@ -44,6 +46,8 @@ urlpatterns = [
     path("api/news/", include("news.urls")),
     path("api/plans/", include("plans.urls")),
     path("api/users/", include("users.urls")),
+    path("api/uploads/", include("uploads.urls")),
+    path("api/v1/cache/stats/", CacheStatsView.as_view(), name="cache-stats"),
 ]
 
 # Serve media files in development
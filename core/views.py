@@ -0,0 +1,25 @@
+import os
+
+from django.core.cache import cache
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core.permissions import IsAdminUser
+
+
+class CacheStatsView(APIView):
+    """Cache hit/miss counters of the worker process serving the request"""
+
+    permission_classes = [IsAdminUser]
+
+    @extend_schema(
+        tags=["Cache"],
+        summary="Métricas do cache",
+        description="Retorna os acertos no cache local (L1), no cache compartilhado (L2) e as falhas, por namespace, do processo que atendeu a requisição. Disponível apenas para administradores.",
+        responses={200: OpenApiTypes.OBJECT},
+    )
+    def get(self, request):
+        stats = cache.stats() if hasattr(cache, "stats") else {}
+        return Response({"pid": os.getpid(), **stats})
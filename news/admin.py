@@ -21,9 +21,16 @@ class NewsAdmin(admin.ModelAdmin):
     def image_preview(self, obj):
         """Mostra preview da imagem no admin"""
         if obj.image:
+            # The thumbnail rendition, once generated, instead of the original
+            thumbnail = obj.image_renditions.get("thumbnail")
+            url = (
+                obj.image.storage.url(thumbnail["image"])
+                if thumbnail
+                else obj.image.url
+            )
             return format_html(
                 '<img src="{}" style="max-height: 100px; max-width: 100px;" />',
-                obj.image.url,
+                url,
             )
         return "Sem imagem"
 
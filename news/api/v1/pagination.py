@@ -0,0 +1,13 @@
+from core.pagination import KeysetPagination
+
+
+class NewsKeysetPagination(KeysetPagination):
+    """
+    Cursor pagination for the news feed.
+
+    Follows ``News.Meta.ordering`` with ``id`` as tie-breaker, so it can be
+    combined with the ``category``/``is_pro_content``/``status`` filters and
+    never runs a ``COUNT(*)`` over the archive.
+    """
+
+    keyset = ("-publication_date", "-created_at", "-id")
@@ -1,15 +1,39 @@
+from collections.abc import Mapping
+
+from django.utils import timezone
 from rest_framework import serializers
 
+from core.images import rendition_urls
+from core.mixins import EagerLoadingMixin
 from news.models import News
 
 
-class NewsSerializer(serializers.ModelSerializer):
+class ImageRenditionsField(serializers.ReadOnlyField):
+    """URLs of the renditions of ``News.image``, empty until they are ready"""
+
+    def __init__(self, **kwargs):
+        # The whole instance: the image storage is needed to build the URLs
+        kwargs["source"] = "*"
+        super().__init__(**kwargs)
+
+    def to_representation(self, instance):
+        return rendition_urls(
+            instance.image.storage,
+            instance.image_renditions or {},
+            self.context.get("request"),
+        )
+
+
+class NewsSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     """Serializer for News model with full fields"""
 
+    select_related_fields = ("author",)
+
     author_username = serializers.ReadOnlyField(source="author.username")
     category_display = serializers.ReadOnlyField(source="get_category_display")
     status_display = serializers.ReadOnlyField(source="get_status_display")
     is_published = serializers.ReadOnlyField()
+    renditions = ImageRenditionsField()
 
     class Meta:
         model = News
@@ -18,8 +42,10 @@ class NewsSerializer(serializers.ModelSerializer):
             "title",
             "subtitle",
             "image",
+            "renditions",
             "content",
             "publication_date",
+            "scheduled_for",
             "created_at",
             "updated_at",
             "category",
@@ -31,21 +57,79 @@ class NewsSerializer(serializers.ModelSerializer):
             "status_display",
             "is_published",
         ]
-        read_only_fields = ["created_at", "updated_at", "author"]
+        # Images go through the upload queue (POST .../{id}/image/), which
+        # strips their metadata outside the request
+        read_only_fields = ["image", "created_at", "updated_at", "author"]
+
+    def to_internal_value(self, data):
+        if isinstance(data, Mapping) and hasattr(data.get("image"), "read"):
+            # Read-only fields are otherwise dropped silently
+            raise serializers.ValidationError(
+                {"image": ["Upload images through the article's image endpoint"]}
+            )
+        return super().to_internal_value(data)
+
+    def validate(self, data):
+        """Scheduled news need a publication time in the future"""
+        status = data.get("status", getattr(self.instance, "status", None))
+        scheduled_for = data.get(
+            "scheduled_for", getattr(self.instance, "scheduled_for", None)
+        )
+        if status == News.StatusChoices.SCHEDULED:
+            if scheduled_for is None:
+                raise serializers.ValidationError(
+                    {"scheduled_for": "Scheduled news need a scheduled_for date"}
+                )
+            if "scheduled_for" in data and scheduled_for <= timezone.now():
+                raise serializers.ValidationError(
+                    {"scheduled_for": "Scheduled date must be in the future"}
+                )
+        return data
+
+
+class NewsPublishSerializer(serializers.Serializer):
+    """Optional body of the publish action"""
+
+    scheduled_for = serializers.DateTimeField(
+        required=False,
+        help_text="Publish at this date instead of now",
+    )
+
+    def validate_scheduled_for(self, value):
+        if value <= timezone.now():
+            raise serializers.ValidationError("Scheduled date must be in the future")
+        return value
+
+
+class NewsBulkPublishSerializer(serializers.Serializer):
+    """Body of the bulk publish/unpublish actions"""
+
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=1000,
+    )
 
 
 class NewsDetailSerializer(NewsSerializer):
     """Extended serializer for news details"""
 
+    # Part of the rendered-response cache entries: bump on any output change
+    cache_version = 3
+
     class Meta(NewsSerializer.Meta):
         fields = NewsSerializer.Meta.fields
 
 
-class NewsListSerializer(serializers.ModelSerializer):
+class NewsListSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     """Simplified serializer for listing news"""
 
+    select_related_fields = ("author",)
+
     author_username = serializers.ReadOnlyField(source="author.username")
     category_display = serializers.ReadOnlyField(source="get_category_display")
+    accessible = serializers.BooleanField(read_only=True)
+    renditions = ImageRenditionsField()
 
     class Meta:
         model = News
@@ -54,10 +138,22 @@ class NewsListSerializer(serializers.ModelSerializer):
             "title",
             "subtitle",
             "image",
+            "renditions",
             "publication_date",
             "category",
             "category_display",
             "is_pro_content",
             "author_username",
             "is_published",
+            "accessible",
+        ]
+
+
+class NewsFeedItemSerializer(NewsListSerializer):
+    """Article summary stored in the materialized vertical feeds"""
+
+    class Meta(NewsListSerializer.Meta):
+        # ``accessible`` depends on the reader, it is added per request
+        fields = [
+            field for field in NewsListSerializer.Meta.fields if field != "accessible"
         ]
@@ -1,12 +1,13 @@
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
-from .views import NewsViewSet
+from .views import NewsFeedViewSet, NewsViewSet
 
 app_name = "api-v1"
 
 router = DefaultRouter()
 router.register(r"articles", NewsViewSet)
+router.register(r"feeds", NewsFeedViewSet, basename="feed")
 
 urlpatterns = [
     path("", include(router.urls)),
@@ -1,41 +1,96 @@
 import logging
 
-from django.db import models
+from django.core.cache import cache
+from django.db import models, transaction
+from django.http import HttpResponse, StreamingHttpResponse
 from django.utils import timezone
 from django_filters.rest_framework import DjangoFilterBackend
+from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import (
+    OpenApiParameter,
     OpenApiResponse,
     extend_schema,
     extend_schema_view,
 )
 from rest_framework import filters, status, viewsets
 from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound, ParseError, ValidationError
+from rest_framework.parsers import JSONParser
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 
-from news.models import News
+from core import policies
+from core.audit import audit
+from core.filters import FullTextSearchFilter
+from core.mixins import ConditionalGetViewMixin, EagerLoadingViewMixin
+from core.pagination import KnownCountPageNumberPagination
+from core.parsers import NDJSONParser
+from core.permissions import IsAdminUser, IsEditor
+from news.exporting import EXPORT_FORMATS, iter_rows
+from news.feeds import get_feed, rebuild_feed
+from news.importing import import_news
+from news.models import NEWS_DETAIL_CACHE_KEY, NEWS_DETAIL_CACHE_TIMEOUT, News
+from plans.models import Vertical
+from uploads.api.v1.mixins import ImageUploadViewMixin
+from uploads.api.v1.serializers import ImageUploadSerializer, UploadSerializer
 
-from .permissions import (
-    CanViewNewsContent,
-    IsAdminUser,
-    IsEditor,
-    IsNewsAuthorOrReadOnly,
+from .pagination import NewsKeysetPagination
+from .permissions import CanViewNewsContent, IsNewsAuthorOrReadOnly
+from .serializers import (
+    NewsBulkPublishSerializer,
+    NewsDetailSerializer,
+    NewsListSerializer,
+    NewsPublishSerializer,
+    NewsSerializer,
 )
-from .serializers import NewsDetailSerializer, NewsListSerializer, NewsSerializer
 
 logger = logging.getLogger(__name__)
 
+TRUE_VALUES = ("true", "1")
+
 
 @extend_schema_view(
     list=extend_schema(
         tags=["News"],
         summary="Listar notícias",
-        description="Retorna uma lista paginada de notícias, filtrada de acordo com as permissões do usuário atual.",
+        description=(
+            "Retorna uma lista paginada de notícias, filtrada de acordo com as permissões do usuário atual. "
+            "Use `pagination=cursor` (ou o parâmetro `cursor`) para paginação por cursor, "
+            "sem contagem total e com custo constante por página. "
+            "Cada notícia traz o campo `accessible`, indicando se o usuário pode lê-la na íntegra. "
+            "As respostas trazem `ETag`; envie `If-None-Match` para receber "
+            "`304 Not Modified` se nada mudou."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name="pagination",
+                description="Use `cursor` para paginação por cursor (keyset).",
+                required=False,
+                type=str,
+                enum=["cursor"],
+            ),
+            OpenApiParameter(
+                name="accessible",
+                description="Use `true` para retornar apenas notícias que o usuário pode ler na íntegra.",
+                required=False,
+                type=bool,
+            ),
+            OpenApiParameter(
+                name="cursor",
+                description="Cursor retornado nos links `next`/`previous`.",
+                required=False,
+                type=str,
+            ),
+        ],
     ),
     retrieve=extend_schema(
         tags=["News"],
         summary="Obter notícia",
-        description="Retorna os detalhes de uma notícia específica se o usuário tiver permissão para acessá-la.",
+        description=(
+            "Retorna os detalhes de uma notícia específica se o usuário tiver permissão para acessá-la. "
+            "Suporta `If-None-Match`/`If-Modified-Since`, respondendo `304 Not Modified` se a notícia não mudou."
+        ),
     ),
     create=extend_schema(
         tags=["News"],
@@ -58,7 +113,12 @@ logger = logging.getLogger(__name__)
         description="Exclui uma notícia. Administradores podem excluir qualquer notícia, editores apenas suas próprias.",
     ),
 )
-class NewsViewSet(viewsets.ModelViewSet):
+class NewsViewSet(
+    ConditionalGetViewMixin,
+    EagerLoadingViewMixin,
+    ImageUploadViewMixin,
+    viewsets.ModelViewSet,
+):
     """
     API endpoint para operações CRUD em notícias.
 
@@ -70,16 +130,37 @@ class NewsViewSet(viewsets.ModelViewSet):
 
     queryset = News.objects.all()
     serializer_class = NewsSerializer
+    pagination_class = KnownCountPageNumberPagination
     filter_backends = [
         DjangoFilterBackend,
-        filters.SearchFilter,
         filters.OrderingFilter,
+        # After OrderingFilter so search results can be sorted by rank
+        FullTextSearchFilter,
     ]
     filterset_fields = ["category", "is_pro_content", "status"]
     search_fields = ["title", "subtitle", "content"]
+    search_vector_field = "search_vector"
     ordering_fields = ["publication_date", "created_at", "title"]
     ordering = ["-publication_date", "-created_at"]
 
+    @property
+    def paginator(self):
+        """Switch the list to keyset pagination when the client asks for it"""
+        if not hasattr(self, "_paginator"):
+            if self.action == "list" and NewsKeysetPagination.is_requested(
+                self.request
+            ):
+                self._paginator = NewsKeysetPagination()
+            else:
+                self._paginator = super().paginator
+        return self._paginator
+
+    def get_etag_extra(self):
+        """The list's ``accessible`` flags depend on the reader's entitlements"""
+        if self.action == "list":
+            return ",".join(sorted(self.request.user.accessible_verticals))
+        return ""
+
     def get_serializer_class(self):
         """Use different serializers for list and detail"""
         if self.action == "list":
@@ -95,9 +176,9 @@ class NewsViewSet(viewsets.ModelViewSet):
         - POST: IsAuthenticated + (IsAdminUser or IsEditor)
         - PUT/PATCH/DELETE: IsAuthenticated + IsNewsAuthorOrReadOnly
         """
-        if self.action == "create":
+        if self.action in ["create", "bulk", "bulk_publish", "bulk_unpublish"]:
             permission_classes = [IsAuthenticated, (IsAdminUser | IsEditor)]
-        elif self.action in ["update", "partial_update", "destroy"]:
+        elif self.action in ["update", "partial_update", "destroy", "upload_image"]:
             permission_classes = [IsAuthenticated, IsNewsAuthorOrReadOnly]
         elif self.action == "retrieve":
             permission_classes = [IsAuthenticated, CanViewNewsContent]
@@ -111,6 +192,21 @@ class NewsViewSet(viewsets.ModelViewSet):
         user = self.request.user
         queryset = super().get_queryset()
 
+        # The list serializer never reads the article body
+        if self.action == "list":
+            queryset = queryset.defer("content", "search_vector")
+            queryset = queryset.with_access_flag(user)
+            if self.request.query_params.get("accessible", "").lower() in TRUE_VALUES:
+                queryset = queryset.filter(accessible=True)
+        elif self.action == "export":
+            # Bodies the user cannot read are left out of the export
+            queryset = queryset.defer("search_vector").with_access_flag(user)
+        elif self.action == "retrieve" and self.is_conditional_request():
+            # Most revalidations end in a 304: only load the body if needed
+            queryset = queryset.defer("content", "search_vector")
+        else:
+            queryset = queryset.defer("search_vector")
+
         # Admin can see all news
         if user.is_admin():
             return queryset
@@ -124,17 +220,193 @@ class NewsViewSet(viewsets.ModelViewSet):
         # Readers can only see published news
         return queryset.filter(status=News.StatusChoices.PUBLISHED)
 
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Serve published, non-PRO articles from a cache of rendered JSON.
+
+        Their detail is the same for every authenticated user, so a cache hit
+        skips the object permissions, the serializer, the renderer and the
+        database. Anything else (drafts, PRO content whose access depends on
+        entitlements, other renderers, query parameters or non-canonical ids)
+        is never cached.
+        Entries are cleared by the news signals on save and delete.
+
+        Image URLs are absolute, so the content is rendered once per origin
+        (scheme and host) the article is requested from, all in its one entry.
+        """
+        if not self.is_detail_cacheable():
+            return super().retrieve(request, *args, **kwargs)
+
+        cache_key = NEWS_DETAIL_CACHE_KEY.format(news_id=kwargs[self.lookup_field])
+        origin = f"{request.scheme}://{request.get_host()}"
+        entry = cache.get(cache_key)
+        if entry is not None and entry["version"] != NewsDetailSerializer.cache_version:
+            entry = None
+        if entry is not None:
+            response = self.get_not_modified_response(
+                entry["etag"], entry["last_modified"]
+            )
+            if response is None and origin in entry["content"]:
+                response = HttpResponse(
+                    entry["content"][origin], content_type=JSONRenderer.media_type
+                )
+            if response is not None:
+                return self.set_validators(
+                    response, entry["etag"], entry["last_modified"]
+                )
+
+        response = super().retrieve(request, *args, **kwargs)
+        if (
+            response.status_code != status.HTTP_200_OK
+            or not response.data["is_published"]
+            or response.data["is_pro_content"]
+        ):
+            return response
+
+        if entry is None or entry["etag"] != response["ETag"]:
+            entry = {
+                "version": NewsDetailSerializer.cache_version,
+                "etag": response["ETag"],
+                "last_modified": response.data.serializer.instance.updated_at,
+                "content": {},
+            }
+        entry["content"][origin] = request.accepted_renderer.render(
+            response.data,
+            request.accepted_media_type,
+            self.get_renderer_context(),
+        )
+        cache.set(cache_key, entry, NEWS_DETAIL_CACHE_TIMEOUT)
+        rendered = HttpResponse(
+            entry["content"][origin], content_type=JSONRenderer.media_type
+        )
+        return self.set_validators(rendered, entry["etag"], entry["last_modified"])
+
+    def is_detail_cacheable(self):
+        request = self.request
+        lookup = self.kwargs[self.lookup_field]
+        return (
+            # Only the canonical id, the key News.clear_detail_cache deletes:
+            # aliases such as "01" would outlive invalidation
+            lookup.isdigit()
+            and str(int(lookup)) == lookup
+            and not request.query_params
+            and isinstance(request.accepted_renderer, JSONRenderer)
+            and request.accepted_media_type == JSONRenderer.media_type
+        )
+
     def perform_create(self, serializer):
         """Set the author to the current user when creating news"""
         news = serializer.save(author=self.request.user)
+        audit(
+            "news.created",
+            news_id=news.id,
+            title=news.title,
+            status=news.status,
+            author=self.request.user.username,
+        )
+
+    @extend_schema(
+        tags=["News"],
+        summary="Importar ou atualizar notícias em lote",
+        description=(
+            "Recebe um array JSON ou um stream NDJSON (`application/x-ndjson`) de notícias. "
+            "Itens sem `id` são criados, itens com `id` são atualizados parcialmente. "
+            "Os itens são validados e gravados em blocos, cada bloco em sua própria transação, "
+            "e a resposta traz o resultado de cada item na ordem recebida. "
+            "Disponível apenas para administradores e editores; editores só atualizam suas próprias notícias."
+        ),
+        request=NewsSerializer(many=True),
+        responses={
+            200: OpenApiResponse(
+                description="Resultado por item",
+                response={
+                    "created": 1,
+                    "updated": 1,
+                    "failed": 1,
+                    "results": [
+                        {"index": 0, "status": "created", "id": 10},
+                        {"index": 1, "status": "updated", "id": 3},
+                        {"index": 2, "status": "error", "errors": {"title": ["..."]}},
+                    ],
+                },
+            ),
+        },
+    )
+    @action(detail=False, methods=["post"], parser_classes=[JSONParser, NDJSONParser])
+    def bulk(self, request):
+        """Create and update articles in batches"""
+        items = request.data
+        if isinstance(items, dict):
+            raise ParseError("Expected a JSON array or an NDJSON stream of articles.")
+
+        results = import_news(items, request.user, self.get_queryset())
+        summary = {"created": 0, "updated": 0, "error": 0}
+        for result in results:
+            summary[result["status"]] += 1
+        return Response(
+            {
+                "created": summary["created"],
+                "updated": summary["updated"],
+                "failed": summary["error"],
+                "results": results,
+            }
+        )
+
+    @extend_schema(
+        tags=["News"],
+        summary="Exportar notícias",
+        description=(
+            "Exporta, em streaming, todas as notícias visíveis para o usuário em NDJSON ou CSV, "
+            "com os mesmos filtros, busca e ordenação da listagem. "
+            "O conteúdo de notícias PRO fora das verticais do usuário vem vazio."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name="export_format",
+                description="Formato do arquivo exportado.",
+                required=False,
+                type=str,
+                enum=list(EXPORT_FORMATS),
+                default="ndjson",
+            ),
+        ],
+        responses={
+            (200, "application/x-ndjson"): OpenApiTypes.STR,
+            (200, "text/csv"): OpenApiTypes.STR,
+        },
+    )
+    @action(detail=False, methods=["get"])
+    def export(self, request):
+        """Stream the filtered news as NDJSON or CSV"""
+        export_format = request.query_params.get("export_format", "ndjson")
+        if export_format not in EXPORT_FORMATS:
+            raise ValidationError(
+                {"export_format": [f"Choose one of: {', '.join(EXPORT_FORMATS)}"]}
+            )
+
+        content_type, encode = EXPORT_FORMATS[export_format]
+        queryset = self.filter_queryset(self.get_queryset())
+        response = StreamingHttpResponse(
+            encode(iter_rows(queryset)), content_type=content_type
+        )
+        filename = f"news-{timezone.now():%Y%m%d-%H%M%S}.{export_format}"
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
         logger.info(
-            f"News article created: ID={news.id}, Title='{news.title}', Author={self.request.user.username}"
+            "News export started: User=%s, Format=%s",
+            request.user.username,
+            export_format,
         )
+        return response
 
     @extend_schema(
         tags=["News"],
         summary="Publicar notícia",
-        description="Muda o status da notícia para publicado e define a data de publicação atual.",
+        description=(
+            "Muda o status da notícia para publicado e define a data de publicação atual. "
+            "Com `scheduled_for`, agenda a publicação: a notícia fica com status `scheduled` "
+            "e é publicada nessa data pelo comando `publish_scheduled_news`."
+        ),
+        request=NewsPublishSerializer,
         responses={
             200: NewsSerializer,
             403: OpenApiResponse(
@@ -151,20 +423,240 @@ class NewsViewSet(viewsets.ModelViewSet):
         news = self.get_object()
 
         # Check if the user has permission to publish
-        if not (request.user.is_admin() or news.author == request.user):
-            logger.warning(
-                f"Unauthorized publish attempt: User={request.user.username}, News ID={news.id}"
-            )
+        if not policies.is_allowed(request, policies.can_publish_news, news):
+            audit("news.publish_denied", news_id=news.id, user=request.user.username)
             return Response(
                 {"detail": "You do not have permission to publish this news."},
                 status=status.HTTP_403_FORBIDDEN,
             )
 
-        # Publish the news
-        news.status = News.StatusChoices.PUBLISHED
-        news.publication_date = timezone.now()
-        news.save()
+        publish = NewsPublishSerializer(data=request.data)
+        publish.is_valid(raise_exception=True)
+        scheduled_for = publish.validated_data.get("scheduled_for")
+
+        if scheduled_for:
+            # Published later by the scheduler
+            news.status = News.StatusChoices.SCHEDULED
+            news.scheduled_for = scheduled_for
+            news.publication_date = None
+            news.save()
+            audit(
+                "news.scheduled",
+                news_id=news.id,
+                title=news.title,
+                user=request.user.username,
+                scheduled_for=scheduled_for,
+            )
+        else:
+            # Publish the news
+            news.status = News.StatusChoices.PUBLISHED
+            news.publication_date = timezone.now()
+            news.scheduled_for = None
+            news.save()
+            audit(
+                "news.published",
+                news_id=news.id,
+                title=news.title,
+                user=request.user.username,
+            )
 
-        logger.info(f"News published: ID={news.id}, Title='{news.title}'")
         serializer = self.get_serializer(news)
         return Response(serializer.data)
+
+    @extend_schema(
+        tags=["News"],
+        summary="Enviar imagem da notícia",
+        description=(
+            "Recebe a imagem da notícia (multipart, campo `file`) e responde imediatamente com "
+            "`202 Accepted`, sem processá-la. A validação, a remoção dos metadados EXIF e o "
+            "redimensionamento são feitos em segundo plano pelo comando `process_uploads`; "
+            "acompanhe o `status` do envio em `/api/uploads/api/v1/uploads/{id}/`."
+        ),
+        request={"multipart/form-data": ImageUploadSerializer},
+        responses={202: UploadSerializer},
+    )
+    @action(detail=True, methods=["post"], url_path="image")
+    def upload_image(self, request, pk=None):
+        """Queue a new image for the article"""
+        news = self.get_object()
+        response = self.accept_image_upload(request, news, "image")
+        logger.info(
+            "News image queued: User=%s, News ID=%s, Upload ID=%s",
+            request.user.username,
+            news.id,
+            response.data["id"],
+        )
+        return response
+
+    @extend_schema(
+        tags=["News"],
+        summary="Publicar notícias em lote",
+        description=(
+            "Publica de uma vez as notícias indicadas em `ids`, com um único UPDATE. "
+            "Notícias já publicadas mantêm a data de publicação. "
+            "Administradores podem publicar qualquer notícia, editores apenas as suas; "
+            "os ids recusados voltam em `failed`."
+        ),
+        request=NewsBulkPublishSerializer,
+        responses={
+            200: OpenApiResponse(
+                description="Ids atualizados e ids recusados",
+                response={
+                    "updated": [1, 2],
+                    "failed": [{"id": 3, "detail": "Not found."}],
+                },
+            ),
+        },
+    )
+    @action(detail=False, methods=["post"], url_path="bulk-publish")
+    def bulk_publish(self, request):
+        """Publish many articles in one transaction"""
+        now = timezone.now()
+        return self._bulk_set_status(
+            request,
+            status=News.StatusChoices.PUBLISHED,
+            publication_date=now,
+            scheduled_for=None,
+            updated_at=now,
+        )
+
+    @extend_schema(
+        tags=["News"],
+        summary="Despublicar notícias em lote",
+        description=(
+            "Volta para rascunho, com um único UPDATE, as notícias indicadas em `ids`. "
+            "Administradores podem despublicar qualquer notícia, editores apenas as suas; "
+            "os ids recusados voltam em `failed`."
+        ),
+        request=NewsBulkPublishSerializer,
+        responses={
+            200: OpenApiResponse(
+                description="Ids atualizados e ids recusados",
+                response={
+                    "updated": [1, 2],
+                    "failed": [{"id": 3, "detail": "Not found."}],
+                },
+            ),
+        },
+    )
+    @action(detail=False, methods=["post"], url_path="bulk-unpublish")
+    def bulk_unpublish(self, request):
+        """Move many articles back to draft in one transaction"""
+        return self._bulk_set_status(
+            request,
+            status=News.StatusChoices.DRAFT,
+            publication_date=None,
+            scheduled_for=None,
+            updated_at=timezone.now(),
+        )
+
+    def _bulk_set_status(self, request, **values):
+        """
+        Apply ``values`` to the requested articles the user may change.
+
+        Visibility (``get_queryset``) and authorship are checked for all ids
+        with one query; articles already in the target status are reported
+        as updated but left untouched.
+        """
+        serializer = NewsBulkPublishSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        ids = list(dict.fromkeys(serializer.validated_data["ids"]))
+
+        rows = (
+            self.get_queryset()
+            .filter(id__in=ids)
+            .only("id", "author", "category", "status", "title")
+            .in_bulk()
+        )
+        allowed = policies.allowed_ids(
+            request, policies.can_publish_news, rows.values()
+        )
+
+        updated, failed, changed, verticals = [], [], [], set()
+        for news_id in ids:
+            if news_id not in rows:
+                failed.append({"id": news_id, "detail": "Not found."})
+                continue
+            if news_id not in allowed:
+                failed.append(
+                    {
+                        "id": news_id,
+                        "detail": "You do not have permission to change this news.",
+                    }
+                )
+                continue
+            updated.append(news_id)
+            if rows[news_id].status != values["status"]:
+                changed.append(rows[news_id])
+                verticals.add(rows[news_id].category)
+
+        with transaction.atomic():
+            News.objects.filter(id__in=updated).exclude(status=values["status"]).update(
+                **values
+            )
+            transaction.on_commit(
+                lambda: self._after_bulk_status_change(updated, verticals)
+            )
+
+        event = (
+            "news.published"
+            if values["status"] == News.StatusChoices.PUBLISHED
+            else "news.unpublished"
+        )
+        for news in changed:
+            audit(event, news_id=news.id, title=news.title, user=request.user.username)
+
+        logger.info(
+            "News bulk status change: User=%s, Status=%s, Updated=%s, Failed=%s",
+            request.user.username,
+            values["status"],
+            len(updated),
+            len(failed),
+        )
+        return Response({"updated": updated, "failed": failed})
+
+    @staticmethod
+    def _after_bulk_status_change(news_ids, verticals):
+        # QuerySet.update() skips the news signals
+        News.clear_detail_cache(news_ids)
+        for vertical in verticals:
+            rebuild_feed(vertical)
+
+
+@extend_schema_view(
+    retrieve=extend_schema(
+        tags=["News"],
+        summary="Últimas notícias da vertical",
+        description=(
+            "Retorna as últimas notícias publicadas de uma vertical, pré-calculadas e servidas do cache. "
+            "Cada notícia traz o campo `accessible`, indicando se o usuário pode lê-la na íntegra."
+        ),
+        responses={200: NewsListSerializer(many=True)},
+    ),
+)
+class NewsFeedViewSet(viewsets.ViewSet):
+    """
+    Materialized latest-news feed of each vertical (see ``news.feeds``).
+
+    Only the per-reader ``accessible`` flag is computed per request.
+    """
+
+    permission_classes = [IsAuthenticated]
+    lookup_field = "vertical"
+    lookup_value_regex = "[a-z]+"
+
+    def retrieve(self, request, vertical=None):
+        if vertical not in Vertical.VerticalChoices.values:
+            raise NotFound()
+
+        accessible_verticals = request.user.accessible_verticals
+        return Response(
+            [
+                {
+                    **item,
+                    "accessible": not item["is_pro_content"]
+                    or item["category"] in accessible_verticals,
+                }
+                for item in get_feed(vertical)
+            ]
+        )
@@ -0,0 +1,80 @@
+"""
+Streaming export of articles as NDJSON or CSV.
+
+Rows are read with ``QuerySet.iterator(chunk_size=...)``, which on Postgres
+runs over a server-side (named) cursor, and encoded one at a time, so memory
+use does not grow with the size of the archive.
+"""
+
+import csv
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+EXPORT_CHUNK_SIZE = 2000
+
+# (column, queryset lookup)
+EXPORT_FIELDS = (
+    ("id", "id"),
+    ("title", "title"),
+    ("subtitle", "subtitle"),
+    ("content", "content"),
+    ("category", "category"),
+    ("is_pro_content", "is_pro_content"),
+    ("status", "status"),
+    ("publication_date", "publication_date"),
+    ("scheduled_for", "scheduled_for"),
+    ("created_at", "created_at"),
+    ("updated_at", "updated_at"),
+    ("author", "author_id"),
+    ("author_username", "author__username"),
+    ("accessible", "accessible"),
+)
+
+
+def iter_rows(queryset):
+    """
+    Export rows of ``queryset``, which must carry the ``accessible``
+    annotation (``NewsQuerySet.with_access_flag``): the body of articles the
+    user cannot read is left empty.
+    """
+    columns = [column for column, _ in EXPORT_FIELDS]
+    lookups = [lookup for _, lookup in EXPORT_FIELDS]
+    for values in queryset.values_list(*lookups).iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        row = dict(zip(columns, values))
+        if not row["accessible"]:
+            row["content"] = None
+        yield row
+
+
+def iter_ndjson(rows):
+    encoder = DjangoJSONEncoder(ensure_ascii=False)
+    for row in rows:
+        yield encoder.encode(row) + "\n"
+
+
+class _Echo:
+    """File-like object handing back what csv.writer writes to it"""
+
+    def write(self, value):
+        return value
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return value
+
+
+def iter_csv(rows):
+    writer = csv.writer(_Echo())
+    yield writer.writerow([column for column, _ in EXPORT_FIELDS])
+    for row in rows:
+        yield writer.writerow(_csv_value(value) for value in row.values())
+
+
+EXPORT_FORMATS = {
+    "ndjson": ("application/x-ndjson", iter_ndjson),
+    "csv": ("text/csv", iter_csv),
+}
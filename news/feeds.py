@@ -0,0 +1,160 @@
+"""
+Materialized "latest news" feed of each vertical.
+
+Every vertical keeps, in the cache, the summaries of its ``FEED_SIZE``
+latest published articles in feed order (``News.Meta.ordering`` with ``id``
+as tie-breaker). The news signals update it incrementally after each commit;
+a feed that is missing from the cache, or that lost an article while full,
+is rebuilt from the database with a single indexed query.
+
+Incremental updates read, change and write back a whole feed, so each one
+holds the feed's lock (an ``add`` on the shared cache) meanwhile: two
+concurrent publishes would otherwise each store their own copy and lose one
+of the articles. An update that cannot get the lock rebuilds the feed
+instead.
+"""
+
+import time
+from contextlib import contextmanager
+from uuid import uuid4
+
+from django.core.cache import cache
+
+from news.models import News
+from plans.models import Vertical
+
+FEED_SIZE = 50
+FEED_CACHE_KEY = "news_feed:{vertical}"
+# Feeds are kept up to date by the signals, the TTL only bounds drift
+FEED_CACHE_TIMEOUT = 24 * 60 * 60
+FEED_LOCK_KEY = "news_feed_lock:{vertical}"
+# Bounds how long a worker that died holding the lock blocks the feed
+FEED_LOCK_TIMEOUT = 10
+# How long an update waits for the lock before rebuilding instead (seconds)
+FEED_LOCK_WAIT = 1.0
+
+
+def _sort_key(news):
+    # NULL publication dates sort first, as in the keyset-paginated list
+    publication_date = news.publication_date
+    return (
+        publication_date is None,
+        publication_date.timestamp() if publication_date else 0.0,
+        news.created_at.timestamp(),
+        news.pk,
+    )
+
+
+def _entry(news):
+    from news.api.v1.serializers import NewsFeedItemSerializer
+
+    return {"key": _sort_key(news), "data": dict(NewsFeedItemSerializer(news).data)}
+
+
+def _shared():
+    # Locked updates bypass the per-process L1, whose copy may lag behind
+    return getattr(cache, "shared", cache)
+
+
+@contextmanager
+def _feed_lock(vertical):
+    """Hold the update lock of ``vertical``'s feed; yield whether it was got"""
+    key = FEED_LOCK_KEY.format(vertical=vertical)
+    token = uuid4().hex
+    deadline = time.monotonic() + FEED_LOCK_WAIT
+    while not (locked := _shared().add(key, token, FEED_LOCK_TIMEOUT)):
+        if time.monotonic() >= deadline:
+            break
+        time.sleep(0.01)
+    try:
+        yield locked
+    finally:
+        # Not ours anymore if it expired and another update took it
+        if locked and _shared().get(key) == token:
+            _shared().delete(key)
+
+
+def _store(vertical, entries):
+    key = FEED_CACHE_KEY.format(vertical=vertical)
+    # Deleting first makes the other workers drop their in-process copy
+    cache.delete(key)
+    cache.set(key, entries, FEED_CACHE_TIMEOUT)
+
+
+def rebuild_feed(vertical):
+    """Recompute the feed of ``vertical`` from the database"""
+    queryset = (
+        News.objects.filter(status=News.StatusChoices.PUBLISHED, category=vertical)
+        .select_related("author")
+        .defer("content", "search_vector")
+        .order_by("-publication_date", "-created_at", "-id")[:FEED_SIZE]
+    )
+    entries = [_entry(news) for news in queryset]
+    _store(vertical, entries)
+    return entries
+
+
+def get_feed(vertical):
+    """Summaries of the latest published articles of ``vertical``"""
+    entries = cache.get(FEED_CACHE_KEY.format(vertical=vertical))
+    if entries is None:
+        entries = rebuild_feed(vertical)
+    return [entry["data"] for entry in entries]
+
+
+def _update_feed(vertical, entries, news_id, news):
+    """Store ``entries`` without ``news_id``, and with ``news`` if given"""
+    kept = [entry for entry in entries if entry["data"]["id"] != news_id]
+    removed = len(kept) != len(entries)
+
+    if removed and news is None and len(entries) == FEED_SIZE:
+        # The next article in line is only known to the database
+        rebuild_feed(vertical)
+        return
+
+    if news is not None:
+        entry = _entry(news)
+        kept.append(entry)
+        kept.sort(key=lambda item: item["key"], reverse=True)
+        if len(kept) > FEED_SIZE:
+            kept = kept[:FEED_SIZE]
+        if not removed and entry not in kept:
+            return
+    elif not removed:
+        return
+
+    _store(vertical, kept)
+
+
+def update_feeds(news_id, news=None):
+    """
+    Apply a saved article, or the removal of ``news_id`` when ``news`` is
+    None, to the feeds.
+
+    The article is removed from whichever feed holds it (its category may
+    have changed) and, if published, inserted in order into its vertical's
+    feed. Feeds not in the cache are left for ``get_feed`` to rebuild.
+    """
+    keys = {
+        vertical: FEED_CACHE_KEY.format(vertical=vertical)
+        for vertical in Vertical.VerticalChoices.values
+    }
+    feeds = _shared().get_many(keys.values())
+    for vertical, key in keys.items():
+        listed = news is not None and news.is_published and news.category == vertical
+        entries = feeds.get(key)
+        if entries is None:
+            continue
+        if not listed and all(entry["data"]["id"] != news_id for entry in entries):
+            continue  # Nothing to change, no need to lock
+
+        with _feed_lock(vertical) as locked:
+            if not locked:
+                # Another update is stuck on this feed: start over from the
+                # database, which already has this article
+                rebuild_feed(vertical)
+                continue
+            # Read again: it may have changed while waiting for the lock
+            entries = _shared().get(key)
+            if entries is not None:
+                _update_feed(vertical, entries, news_id, news if listed else None)
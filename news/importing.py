@@ -0,0 +1,168 @@
+"""
+Bulk import and update of articles.
+
+Items are validated with ``NewsSerializer`` in chunks, then written with one
+``bulk_create`` and one ``bulk_update`` per chunk, each chunk in its own
+transaction: a failing chunk does not roll back the ones before it, and a
+long import never holds locks for its whole duration.
+
+Updates follow the rules of ``NewsViewSet.update``: only articles in the
+user's visible queryset can be found, and only those ``can_edit_news``
+allows can be changed. Each written article gets its ``news.created`` or
+``news.updated`` audit event once its chunk commits.
+"""
+
+import logging
+from functools import partial
+from itertools import islice
+
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.exceptions import ParseError, ValidationError
+from rest_framework.serializers import as_serializer_error
+
+from core import policies
+from core.audit import audit
+from news.feeds import rebuild_feed
+from news.models import News
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 500
+
+
+def _invalidate(news_ids, verticals):
+    # bulk_create/bulk_update skip the news signals
+    News.clear_detail_cache(news_ids)
+    for vertical in verticals:
+        rebuild_feed(vertical)
+
+
+def _audit_written(username, created, updated):
+    for news in created:
+        audit(
+            "news.created",
+            news_id=news.pk,
+            title=news.title,
+            status=news.status,
+            author=username,
+        )
+    for news in updated:
+        audit("news.updated", news_id=news.pk, title=news.title, user=username)
+
+
+def _item_error(item):
+    if isinstance(item, ParseError):
+        return {"non_field_errors": [str(item.detail)]}
+    return {"non_field_errors": ["Expected a JSON object"]}
+
+
+def _import_chunk(chunk, user, queryset, start):
+    from news.api.v1.serializers import NewsSerializer
+
+    # One serializer for the whole chunk: building its fields costs more
+    # than validating an item
+    validator = NewsSerializer()
+    results = [None] * len(chunk)
+    update_ids = {
+        item["id"]
+        for item in chunk
+        if isinstance(item, dict) and isinstance(item.get("id"), int)
+    }
+    # Ids outside the visible queryset are "Not found", whether they exist
+    # or not, as in the detail endpoints
+    existing = queryset.defer("search_vector").in_bulk(update_ids)
+
+    to_create, to_update, fields, verticals = [], [], {"updated_at"}, set()
+    for offset, item in enumerate(chunk):
+        result = {"index": start + offset}
+        results[offset] = result
+
+        if not isinstance(item, dict):
+            result.update(status="error", errors=_item_error(item))
+            continue
+
+        news = None
+        if "id" in item:
+            news = existing.get(item["id"])
+            if news is None:
+                result.update(status="error", errors={"id": ["Not found"]})
+                continue
+            if not policies.can_edit_news(user, news):
+                result.update(
+                    status="error",
+                    errors={"id": ["You do not have permission to edit this news"]},
+                )
+                continue
+
+        validator.instance, validator.partial = news, news is not None
+        try:
+            validated_data = validator.run_validation(item)
+        except ValidationError as exc:
+            result.update(status="error", errors=as_serializer_error(exc))
+            continue
+
+        if news is None:
+            news = News(author=user, **validated_data)
+            to_create.append((result, news))
+        else:
+            if news.is_published:
+                verticals.add(news.category)
+            for name, value in validated_data.items():
+                setattr(news, name, value)
+            fields.update(validated_data)
+            to_update.append((result, news))
+
+        if news.is_published:
+            verticals.add(news.category)
+
+    with transaction.atomic():
+        News.objects.bulk_create([news for _, news in to_create])
+        if to_update:
+            now = timezone.now()
+            for _, news in to_update:
+                news.updated_at = now
+            News.objects.bulk_update([news for _, news in to_update], fields)
+
+        news_ids = [news.pk for _, news in to_update]
+        transaction.on_commit(partial(_invalidate, news_ids, verticals))
+        transaction.on_commit(
+            partial(
+                _audit_written,
+                user.username,
+                [news for _, news in to_create],
+                [news for _, news in to_update],
+            )
+        )
+
+    for status, written in (("created", to_create), ("updated", to_update)):
+        for result, news in written:
+            result.update(status=status, id=news.pk)
+
+    logger.info(
+        "Bulk news import: User=%s, Created=%s, Updated=%s, Failed=%s",
+        user.username,
+        len(to_create),
+        len(to_update),
+        len(chunk) - len(to_create) - len(to_update),
+    )
+    return results
+
+
+def import_news(items, user, queryset, chunk_size=None):
+    """
+    Create (items without ``id``) or update (items with ``id``) articles.
+
+    ``queryset`` holds the articles visible to ``user``; updates to any
+    other id fail as not found.
+
+    ``items`` may be any iterable, including a lazily parsed NDJSON stream.
+    Returns one result per item, in order: ``{"index", "status", "id"}`` on
+    success, ``{"index", "status": "error", "errors"}`` otherwise.
+    """
+    chunk_size = chunk_size or DEFAULT_CHUNK_SIZE
+    items = iter(items)
+    results = []
+    while chunk := list(islice(items, chunk_size)):
+        results.extend(_import_chunk(chunk, user, queryset, len(results)))
+    return results
@@ -0,0 +1,145 @@
+import random
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test import RequestFactory
+from django.utils import timezone
+from rest_framework.request import Request
+
+from news.api.v1.pagination import NewsKeysetPagination
+from news.api.v1.views import NewsViewSet
+from news.models import News
+from plans.models import Vertical
+from users.models import CustomUser
+
+BATCH_SIZE = 5000
+
+
+class Command(BaseCommand):
+    help = (
+        "Mostra o plano de execução (EXPLAIN) das consultas do feed de notícias "
+        "para cada papel de usuário e quais índices são utilizados."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows",
+            type=int,
+            default=0,
+            help="Number of synthetic articles to insert before explaining. "
+            "Everything is rolled back at the end.",
+        )
+        parser.add_argument(
+            "--analyze",
+            action="store_true",
+            help="Run EXPLAIN ANALYZE (Postgres only).",
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            users = self._create_users()
+            if options["rows"]:
+                self._seed(options["rows"], users["editor"])
+            with connection.cursor() as cursor:
+                cursor.execute(f"ANALYZE {News._meta.db_table}")
+
+            explain_options = {}
+            if options["analyze"] and connection.vendor == "postgresql":
+                explain_options = {"analyze": True, "buffers": True}
+
+            for role, user in users.items():
+                for label, params in self._feeds():
+                    self._explain(role, label, user, params, explain_options)
+
+            transaction.set_rollback(True)
+
+    def _feeds(self):
+        return [
+            ("feed", {}),
+            ("category", {"category": Vertical.VerticalChoices.TAX}),
+            ("keyset page", {"pagination": "cursor"}),
+        ]
+
+    def _explain(self, role, label, user, params, explain_options):
+        queryset = self._feed_queryset(user, params)
+        paginator = NewsKeysetPagination()
+
+        if "pagination" in params:
+            # Continue from the middle of the feed to show deep pages stay cheap
+            page = paginator.get_page_queryset(queryset)
+            boundary = page[page.count() // 2 : page.count() // 2 + 1].first()
+            values = paginator.get_position(boundary) if boundary else None
+            queryset = paginator.get_page_queryset(queryset, values)
+
+        queryset = queryset[: paginator.page_size]
+        start = time.perf_counter()
+        plan = queryset.explain(**explain_options)
+        elapsed = (time.perf_counter() - start) * 1000
+
+        used = [index.name for index in News._meta.indexes if index.name in plan]
+        self.stdout.write(self.style.MIGRATE_HEADING(f"{role} / {label}"))
+        self.stdout.write(plan)
+        if used:
+            self.stdout.write(self.style.SUCCESS(f"Indexes used: {', '.join(used)}"))
+        else:
+            self.stdout.write(self.style.WARNING("No feed index used"))
+        self.stdout.write(f"Planned in {elapsed:.1f} ms\n\n")
+
+    def _feed_queryset(self, user, params):
+        """Build the list queryset exactly as ``NewsViewSet`` does for ``user``"""
+        request = Request(RequestFactory().get("/", params))
+        request.user = user
+        view = NewsViewSet(request=request, action="list", format_kwarg=None)
+        return view.filter_queryset(view.get_queryset())
+
+    def _create_users(self):
+        return {
+            user_type: CustomUser.objects.create(
+                username=f"benchmark_{user_type}",
+                email=f"benchmark_{user_type}@example.com",
+                user_type=user_type,
+            )
+            for user_type in (CustomUser.ADMIN, CustomUser.EDITOR, CustomUser.READER)
+        }
+
+    def _seed(self, rows, editor):
+        authors = [editor] + [
+            CustomUser.objects.create(
+                username=f"benchmark_author_{index}",
+                email=f"benchmark_author_{index}@example.com",
+                user_type=CustomUser.EDITOR,
+            )
+            for index in range(49)
+        ]
+        categories = list(Vertical.VerticalChoices.values)
+        now = timezone.now()
+
+        created = 0
+        while created < rows:
+            batch = []
+            for _ in range(min(BATCH_SIZE, rows - created)):
+                published = random.random() < 0.9
+                batch.append(
+                    News(
+                        title="Benchmark",
+                        content="Lorem ipsum dolor sit amet. " * 20,
+                        author=random.choice(authors),
+                        category=random.choice(categories),
+                        is_pro_content=random.random() < 0.3,
+                        status=(
+                            News.StatusChoices.PUBLISHED
+                            if published
+                            else News.StatusChoices.DRAFT
+                        ),
+                        publication_date=(
+                            now - timedelta(minutes=random.randint(0, 5_000_000))
+                            if published
+                            else None
+                        ),
+                    )
+                )
+            News.objects.bulk_create(batch)
+            created += len(batch)
+        self.stdout.write(f"Inserted {created} synthetic articles")
@@ -0,0 +1,85 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from news.api.v1.serializers import NewsSerializer
+from news.importing import DEFAULT_CHUNK_SIZE, import_news
+from news.models import News
+from plans.models import Vertical
+from users.models import CustomUser
+
+
+class Command(BaseCommand):
+    help = (
+        "Compara a criação de notícias uma a uma (como em POST /articles/) com "
+        "a importação em lote, em artigos por segundo."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--articles",
+            type=int,
+            default=5000,
+            help="Number of synthetic articles per run. Everything is rolled back.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help="Chunk size of the bulk import.",
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            editor = CustomUser.objects.create(
+                username="benchmark_editor",
+                email="benchmark_editor@example.com",
+                user_type=CustomUser.EDITOR,
+            )
+            items = self._items(options["articles"])
+
+            self._run(
+                "one by one", options["articles"], self._one_by_one, items, editor
+            )
+            self._run(
+                f"bulk (chunks of {options['chunk_size']})",
+                options["articles"],
+                import_news,
+                items,
+                editor,
+                News.objects.filter(author=editor),
+                chunk_size=options["chunk_size"],
+            )
+
+            transaction.set_rollback(True)
+
+    def _items(self, count):
+        categories = Vertical.VerticalChoices.values
+        return [
+            {
+                "title": f"Benchmark {index}",
+                "subtitle": "Importação de arquivo",
+                "content": "Lorem ipsum dolor sit amet. " * 50,
+                "category": categories[index % len(categories)],
+                "status": "draft",
+            }
+            for index in range(count)
+        ]
+
+    def _one_by_one(self, items, user):
+        for item in items:
+            serializer = NewsSerializer(data=item)
+            serializer.is_valid(raise_exception=True)
+            serializer.save(author=user)
+
+    def _run(self, label, count, function, *args, **kwargs):
+        with transaction.atomic():
+            start = time.perf_counter()
+            function(*args, **kwargs)
+            elapsed = time.perf_counter() - start
+            transaction.set_rollback(True)
+
+        self.stdout.write(
+            f"  {label:<24} {elapsed:8.2f} s  {count / elapsed:10.0f} articles/s"
+        )
@@ -0,0 +1,120 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import RequestFactory
+from rest_framework.request import Request
+
+from core import policies
+from news.models import News
+from plans.models import Vertical
+from users.models import CustomUser
+
+
+def compare_authors(user, news):
+    """Check by model instances, as the permission classes used to"""
+    return user.is_admin() or news.author == user
+
+
+class Command(BaseCommand):
+    help = (
+        "Mede quantas verificações de permissão sobre notícias são feitas por "
+        "segundo, comparando instâncias do autor (como antes) com as políticas "
+        "de core.policies, com e sem memoização e em lote."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--articles",
+            type=int,
+            default=2000,
+            help="Number of synthetic articles checked per run. "
+            "Everything is rolled back.",
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            users = self._create_users()
+            self.author = users["editor"]
+            self._seed(options["articles"], self.author)
+
+            for role, user in users.items():
+                self.stdout.write(self.style.MIGRATE_HEADING(role))
+                self._run("author instance", user, self._check_each, compare_authors)
+                self._run("policy", user, self._check_each, policies.can_publish_news)
+                self._run(
+                    "policy, memoized",
+                    user,
+                    self._check_each,
+                    policies.can_publish_news,
+                    memoized=True,
+                )
+                self._run(
+                    "policy, bulk", user, self._check_bulk, policies.can_view_news
+                )
+
+            transaction.set_rollback(True)
+        CustomUser.clear_subscription_cache(user.pk for user in users.values())
+
+    def _articles(self):
+        # As get_object() loads them: without the author
+        return list(
+            News.objects.filter(author=self.author).defer("content", "search_vector")
+        )
+
+    def _request(self, user):
+        request = Request(RequestFactory().get("/"))
+        request.user = user
+        return request
+
+    def _check_each(self, user, articles, rule, memoized=False):
+        """One check per article, twice as get_object() and the view do"""
+        request = self._request(user)
+        for news in articles:
+            for _ in range(2):
+                if memoized:
+                    policies.is_allowed(request, rule, news)
+                else:
+                    rule(user, news)
+        return len(articles) * 2
+
+    def _check_bulk(self, user, articles, rule):
+        policies.allowed_ids(self._request(user), rule, articles)
+        return len(articles)
+
+    def _run(self, label, user, function, *args, **kwargs):
+        articles = self._articles()
+        start = time.perf_counter()
+        checks = function(user, articles, *args, **kwargs)
+        elapsed = time.perf_counter() - start
+        self.stdout.write(
+            f"  {label:<20} {elapsed * 1000:9.1f} ms  {checks / elapsed:12.0f} checks/s"
+        )
+
+    def _create_users(self):
+        return {
+            user_type: CustomUser.objects.create(
+                username=f"benchmark_{user_type}",
+                email=f"benchmark_{user_type}@example.com",
+                user_type=user_type,
+            )
+            for user_type in (CustomUser.ADMIN, CustomUser.EDITOR, CustomUser.READER)
+        }
+
+    def _seed(self, count, editor):
+        categories = Vertical.VerticalChoices.values
+        News.objects.bulk_create(
+            News(
+                title=f"Benchmark {index}",
+                content="Lorem ipsum dolor sit amet.",
+                author=editor,
+                category=categories[index % len(categories)],
+                is_pro_content=index % 3 == 0,
+                status=(
+                    News.StatusChoices.PUBLISHED
+                    if index % 10
+                    else News.StatusChoices.DRAFT
+                ),
+            )
+            for index in range(count)
+        )
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from news.models import News
+from news.renditions import generate_news_renditions
+
+
+class Command(BaseCommand):
+    help = (
+        "Gera as versões redimensionadas (e WebP) das imagens de notícias que "
+        "ainda não as têm, ou de todas com --all."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Regenerate every rendition, e.g. after changing IMAGE_RENDITIONS.",
+        )
+
+    def handle(self, *args, **options):
+        queryset = News.objects.exclude(image="").exclude(image__isnull=True)
+        if not options["all"]:
+            queryset = queryset.filter(image_renditions={})
+
+        count = 0
+        for news_id in queryset.values_list("id", flat=True).iterator():
+            generate_news_renditions(news_id)
+            count += 1
+        self.stdout.write(
+            self.style.SUCCESS(f"Renditions generated for {count} articles.")
+        )
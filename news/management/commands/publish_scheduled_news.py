@@ -0,0 +1,43 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from news.scheduling import DEFAULT_BATCH_SIZE, publish_due_news
+
+
+class Command(BaseCommand):
+    help = (
+        "Publica as notícias agendadas cuja data de publicação já chegou. "
+        "Pode rodar em vários nós ao mesmo tempo."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help="Articles claimed and published per transaction.",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep running, checking for due articles every --interval seconds.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=30,
+            help="Seconds between checks in --loop mode.",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            published = publish_due_news(batch_size=options["batch_size"])
+            if published or not options["loop"]:
+                self.stdout.write(f"Published {published} scheduled articles")
+            if not options["loop"]:
+                return
+            try:
+                time.sleep(options["interval"])
+            except KeyboardInterrupt:
+                return
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from news.feeds import rebuild_feed
+from plans.models import Vertical
+
+
+class Command(BaseCommand):
+    help = "Recalcula do zero o feed de últimas notícias de cada vertical no cache."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "verticals",
+            nargs="*",
+            choices=Vertical.VerticalChoices.values,
+            help="Verticals to rebuild (default: all).",
+        )
+
+    def handle(self, *args, **options):
+        for vertical in options["verticals"] or Vertical.VerticalChoices.values:
+            entries = rebuild_feed(vertical)
+            self.stdout.write(f"{vertical}: {len(entries)} articles")
+        self.stdout.write(self.style.SUCCESS("News feeds rebuilt."))
@@ -0,0 +1,47 @@
+# Generated by Django 4.2.10 on 2026-10-17 03:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("news", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="news",
+            index=models.Index(
+                fields=["status", "-publication_date", "-created_at", "-id"],
+                name="news_status_pub_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="news",
+            index=models.Index(
+                fields=["category", "status", "-publication_date", "-created_at"],
+                name="news_cat_status_pub_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="news",
+            index=models.Index(
+                fields=["author", "-publication_date", "-created_at"],
+                name="news_author_pub_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="news",
+            index=models.Index(
+                fields=["-publication_date", "-created_at", "-id"], name="news_feed_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="news",
+            index=models.Index(
+                condition=models.Q(("status", "published")),
+                fields=["-publication_date", "-created_at", "-id"],
+                name="news_published_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,70 @@
+# Generated by Django 4.2.10 on 2026-10-17 03:39
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+from core.migration_operations import AddPostgresIndex
+
+SEARCH_VECTOR_EXPRESSION = """
+    setweight(to_tsvector('portuguese', coalesce({row}title, '')), 'A') ||
+    setweight(to_tsvector('portuguese', coalesce({row}subtitle, '')), 'B') ||
+    setweight(to_tsvector('portuguese', coalesce({row}content, '')), 'C')
+"""
+
+
+def create_search_vector_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    schema_editor.execute(f"""
+        CREATE OR REPLACE FUNCTION news_news_search_vector_update()
+        RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector := {SEARCH_VECTOR_EXPRESSION.format(row="NEW.")};
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql;
+        """)
+    schema_editor.execute("""
+        CREATE TRIGGER news_news_search_vector_trigger
+        BEFORE INSERT OR UPDATE OF title, subtitle, content ON news_news
+        FOR EACH ROW EXECUTE FUNCTION news_news_search_vector_update();
+        """)
+    schema_editor.execute(
+        "UPDATE news_news SET search_vector = "
+        f"{SEARCH_VECTOR_EXPRESSION.format(row='')};"
+    )
+
+
+def drop_search_vector_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    schema_editor.execute(
+        "DROP TRIGGER IF EXISTS news_news_search_vector_trigger ON news_news;"
+    )
+    schema_editor.execute("DROP FUNCTION IF EXISTS news_news_search_vector_update();")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("news", "0002_news_feed_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="news",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        AddPostgresIndex(
+            model_name="news",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="news_search_vector_idx"
+            ),
+        ),
+        migrations.RunPython(create_search_vector_trigger, drop_search_vector_trigger),
+    ]
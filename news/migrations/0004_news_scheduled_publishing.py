@@ -0,0 +1,41 @@
+# Generated by Django 4.2.10 on 2026-10-17 04:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("news", "0003_news_search_vector"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="news",
+            name="scheduled_for",
+            field=models.DateTimeField(
+                blank=True, null=True, verbose_name="Scheduled For"
+            ),
+        ),
+        migrations.AlterField(
+            model_name="news",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("draft", "Draft"),
+                    ("scheduled", "Scheduled"),
+                    ("published", "Published"),
+                ],
+                default="draft",
+                max_length=10,
+                verbose_name="Status",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="news",
+            index=models.Index(
+                condition=models.Q(("status", "scheduled")),
+                fields=["scheduled_for"],
+                name="news_scheduled_due_idx",
+            ),
+        ),
+    ]
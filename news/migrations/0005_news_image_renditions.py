@@ -0,0 +1,22 @@
+# Generated by Django 4.2.10 on 2026-10-17 04:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("news", "0004_news_scheduled_publishing"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="news",
+            name="image_renditions",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                editable=False,
+                verbose_name="Image Renditions",
+            ),
+        ),
+    ]
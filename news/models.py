@@ -1,13 +1,42 @@
 from django.contrib.auth import get_user_model
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
+from core.models import DirtyFieldsMixin
 from plans.models import Vertical
 
 User = get_user_model()
 
+# Rendered detail of published, non-PRO articles; see NewsViewSet.retrieve
+NEWS_DETAIL_CACHE_KEY = "news_detail:{news_id}"
+NEWS_DETAIL_CACHE_TIMEOUT = 60 * 60
 
-class News(models.Model):
+
+class NewsQuerySet(models.QuerySet):
+    def with_access_flag(self, user):
+        """
+        Annotate each article with ``accessible``: whether ``user`` can read
+        its full content.
+
+        Mirrors ``CustomUser.can_access_content`` in SQL, using the user's
+        entitled verticals, so a whole page is resolved in the same query.
+        """
+        if not user.is_reader():
+            return self.annotate(accessible=models.Value(True))
+
+        condition = models.Q(is_pro_content=False)
+        if user.accessible_verticals:
+            condition |= models.Q(category__in=user.accessible_verticals)
+        return self.annotate(
+            accessible=models.ExpressionWrapper(
+                condition, output_field=models.BooleanField()
+            )
+        )
+
+
+class News(DirtyFieldsMixin, models.Model):
     """
     Model for managing news articles in the JOTA system.
     """
@@ -15,6 +44,7 @@ class News(models.Model):
     # Options for status field
     class StatusChoices(models.TextChoices):
         DRAFT = "draft", _("Draft")
+        SCHEDULED = "scheduled", _("Scheduled")
         PUBLISHED = "published", _("Published")
 
     title = models.CharField(_("Title"), max_length=200)
@@ -22,6 +52,10 @@ class News(models.Model):
     image = models.ImageField(
         _("Image"), upload_to="news/images/%Y/%m/%d/", blank=True, null=True
     )
+    # Downscaled JPEG/PNG and WebP copies of ``image`` (see news.renditions)
+    image_renditions = models.JSONField(
+        _("Image Renditions"), default=dict, blank=True, editable=False
+    )
     content = models.TextField(_("Content"))
     publication_date = models.DateTimeField(
         _("Publication Date"), blank=True, null=True
@@ -55,15 +89,74 @@ class News(models.Model):
         choices=StatusChoices.choices,
         default=StatusChoices.DRAFT,
     )
+    # Embargo of a scheduled article; becomes its publication date once the
+    # scheduler (manage.py publish_scheduled_news) publishes it
+    scheduled_for = models.DateTimeField(_("Scheduled For"), blank=True, null=True)
+
+    objects = NewsQuerySet.as_manager()
+
+    # Weighted title/subtitle/content tsvector, maintained by a database
+    # trigger on Postgres (see migration 0003). Always NULL on SQLite.
+    search_vector = SearchVectorField(null=True, editable=False)
 
     class Meta:
         verbose_name = _("Notícia")
         verbose_name_plural = _("Notícias")
         ordering = ["-publication_date", "-created_at"]
+        indexes = [
+            # Reader feed and admin status filter
+            models.Index(
+                fields=["status", "-publication_date", "-created_at", "-id"],
+                name="news_status_pub_idx",
+            ),
+            # Category pages (?category=X) restricted to published news
+            models.Index(
+                fields=["category", "status", "-publication_date", "-created_at"],
+                name="news_cat_status_pub_idx",
+            ),
+            # Editor feed: "author = me" branch of the OR
+            models.Index(
+                fields=["author", "-publication_date", "-created_at"],
+                name="news_author_pub_idx",
+            ),
+            # Admin feed, unfiltered
+            models.Index(
+                fields=["-publication_date", "-created_at", "-id"],
+                name="news_feed_idx",
+            ),
+            # Published feed only; much smaller than the full table
+            models.Index(
+                fields=["-publication_date", "-created_at", "-id"],
+                name="news_published_idx",
+                condition=models.Q(status="published"),
+            ),
+            # Scheduler: due articles, in due order
+            models.Index(
+                fields=["scheduled_for"],
+                name="news_scheduled_due_idx",
+                condition=models.Q(status="scheduled"),
+            ),
+            # Full-text search, created on Postgres only
+            GinIndex(fields=["search_vector"], name="news_search_vector_idx"),
+        ]
 
     def __str__(self) -> str:
         return self.title
 
+    @classmethod
+    def clear_detail_cache(cls, news_ids):
+        """
+        Drop the cached rendered detail of the given articles.
+
+        ``save()`` and ``delete()`` do it through the news signals; code that
+        writes with ``QuerySet.update()`` must call it explicitly.
+        """
+        from django.core.cache import cache
+
+        cache.delete_many(
+            [NEWS_DETAIL_CACHE_KEY.format(news_id=news_id) for news_id in news_ids]
+        )
+
     @property
     def is_published(self) -> bool:
         """Checks if the news article is published."""
@@ -0,0 +1,90 @@
+"""
+Renditions of ``News.image``.
+
+The news signals call ``schedule_renditions`` whenever an article's image no
+longer matches its ``image_renditions``. Once the transaction commits, the
+renditions are generated in a small background thread pool, off the request
+path (synchronously when ``IMAGE_RENDITIONS_ASYNC`` is off, e.g. in tests).
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.utils import timezone
+
+from core.images import delete_renditions, generate_renditions
+from news.feeds import rebuild_feed
+from news.models import News
+
+logger = logging.getLogger(__name__)
+
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="news-renditions")
+
+
+def _run_in_background(news_id):
+    try:
+        generate_news_renditions(news_id)
+    except Exception:
+        logger.exception("Rendition generation failed: News ID=%s", news_id)
+    finally:
+        # Worker threads open their own database connections
+        connections.close_all()
+
+
+def schedule_renditions(news_id):
+    """Generate the renditions of an article once the current transaction commits"""
+
+    def run():
+        if settings.IMAGE_RENDITIONS_ASYNC:
+            _executor.submit(_run_in_background, news_id)
+        else:
+            generate_news_renditions(news_id)
+
+    transaction.on_commit(run)
+
+
+def _shared(source, news_id):
+    # Identical uploads are stored once, so an image may be used by several
+    # articles, and so are its renditions
+    return News.objects.filter(image=source).exclude(pk=news_id).exists()
+
+
+def generate_news_renditions(news_id):
+    """
+    Bring ``image_renditions`` in line with the article's current image:
+    generate them for a new image, remove them when the image was cleared.
+    """
+    news = (
+        News.objects.only("id", "image", "image_renditions", "category", "status")
+        .filter(pk=news_id)
+        .first()
+    )
+    if news is None:
+        return
+
+    previous = news.image_renditions or {}
+    storage = news.image.storage
+    renditions = {}
+    if news.image:
+        renditions = generate_renditions(news.image, settings.IMAGE_RENDITIONS)
+
+    # The image may have been replaced while we were working on it
+    updated = News.objects.filter(pk=news_id, image=news.image.name).update(
+        image_renditions=renditions, updated_at=timezone.now()
+    )
+    if not updated:
+        if not _shared(news.image.name, news_id):
+            delete_renditions(storage, renditions)
+        return
+
+    source = previous.get("source")
+    if source != renditions.get("source") and not _shared(source, news_id):
+        delete_renditions(storage, previous)
+
+    # QuerySet.update() skips the news signals
+    News.clear_detail_cache([news_id])
+    if news.is_published:
+        rebuild_feed(news.category)
+    logger.info("Image renditions updated: News ID=%s", news_id)
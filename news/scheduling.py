@@ -0,0 +1,68 @@
+"""
+Scheduled publishing.
+
+Articles with status ``scheduled`` are published once ``scheduled_for`` is
+due by ``publish_due_news``, run by ``manage.py publish_scheduled_news``.
+Each batch is claimed with ``SELECT ... FOR UPDATE SKIP LOCKED`` and
+published with one ``UPDATE``, so several nodes can run the scheduler at the
+same time: a row locked by one of them is skipped by the others, and once
+committed it is no longer ``scheduled``.
+"""
+
+from functools import partial
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from core.audit import audit
+from news.feeds import rebuild_feed
+from news.models import News
+
+DEFAULT_BATCH_SIZE = 100
+
+
+def _invalidate_batch(news_ids, verticals):
+    # QuerySet.update() skips the news signals
+    News.clear_detail_cache(news_ids)
+    for vertical in verticals:
+        rebuild_feed(vertical)
+
+
+def publish_due_batch(now=None, batch_size=DEFAULT_BATCH_SIZE):
+    """Publish up to ``batch_size`` due articles; return how many"""
+    now = now or timezone.now()
+    with transaction.atomic():
+        due = list(
+            News.objects.select_for_update(skip_locked=True)
+            .filter(status=News.StatusChoices.SCHEDULED, scheduled_for__lte=now)
+            .order_by("scheduled_for")
+            .values_list("id", "category", "title")[:batch_size]
+        )
+        if not due:
+            return 0
+
+        news_ids = [news_id for news_id, _, _ in due]
+        News.objects.filter(id__in=news_ids).update(
+            status=News.StatusChoices.PUBLISHED,
+            publication_date=F("scheduled_for"),
+            scheduled_for=None,
+            updated_at=now,
+        )
+        verticals = {category for _, category, _ in due}
+        transaction.on_commit(partial(_invalidate_batch, news_ids, verticals))
+
+    # Published by the scheduler, not by a user
+    for news_id, _, title in due:
+        audit("news.published", news_id=news_id, title=title, user=None)
+    return len(due)
+
+
+def publish_due_news(now=None, batch_size=DEFAULT_BATCH_SIZE):
+    """Publish every due article, one batch per transaction"""
+    published = 0
+    while count := publish_due_batch(now, batch_size):
+        published += count
+        if count < batch_size:
+            break
+    return published
@@ -0,0 +1,36 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from news.feeds import update_feeds
+from news.models import News
+from news.renditions import schedule_renditions
+
+
+@receiver(post_save, sender=News)
+@receiver(post_delete, sender=News)
+def clear_news_detail_cache(sender, instance, **kwargs):
+    """An article was saved (publish included) or removed"""
+    News.clear_detail_cache([instance.pk])
+
+
+@receiver(post_save, sender=News)
+def update_news_feeds(sender, instance, **kwargs):
+    """Feeds are updated once the article is committed"""
+    news_id = instance.pk
+    transaction.on_commit(lambda: update_feeds(news_id, instance))
+
+
+@receiver(post_delete, sender=News)
+def remove_from_news_feeds(sender, instance, **kwargs):
+    """Feeds are updated once the removal is committed"""
+    # The instance loses its pk once deleted
+    news_id = instance.pk
+    transaction.on_commit(lambda: update_feeds(news_id))
+
+
+@receiver(post_save, sender=News)
+def update_news_renditions(sender, instance, **kwargs):
+    """The image was uploaded, replaced or cleared"""
+    if (instance.image.name or None) != instance.image_renditions.get("source"):
+        schedule_renditions(instance.pk)
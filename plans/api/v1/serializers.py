@@ -1,5 +1,6 @@
 from rest_framework import serializers
 
+from core.mixins import EagerLoadingMixin
 from plans.models import Plan, Subscription, Vertical
 
 
@@ -13,9 +14,11 @@ class VerticalSerializer(serializers.ModelSerializer):
         fields = ["id", "name", "slug", "description", "display_name"]
 
 
-class PlanSerializer(serializers.ModelSerializer):
+class PlanSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     """Serializer for Plan model"""
 
+    prefetch_related_fields = ("verticals",)
+
     plan_type_display = serializers.ReadOnlyField(source="get_plan_type_display")
     verticals = VerticalSerializer(many=True, read_only=True)
 
@@ -55,9 +58,12 @@ class PlanCreateUpdateSerializer(serializers.ModelSerializer):
         ]
 
 
-class SubscriptionSerializer(serializers.ModelSerializer):
+class SubscriptionSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     """Serializer for Subscription model"""
 
+    select_related_fields = ("user", "plan")
+    prefetch_related_fields = ("plan__verticals",)
+
     plan = PlanSerializer(read_only=True)
     user_username = serializers.ReadOnlyField(source="user.username")
     status_display = serializers.ReadOnlyField(source="get_status_display")
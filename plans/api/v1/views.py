@@ -5,9 +5,12 @@ from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from core.audit import audit
+from core.filters import TrigramSearchFilter
+from core.mixins import EagerLoadingViewMixin
+from core.permissions import IsAdminUser
 from plans.models import Plan, Subscription, Vertical
 
-from .permissions import IsAdminUser
 from .serializers import (
     PlanCreateUpdateSerializer,
     PlanSerializer,
@@ -54,7 +57,7 @@ class VerticalViewSet(viewsets.ModelViewSet):
 
     queryset = Vertical.objects.all()
     serializer_class = VerticalSerializer
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [filters.OrderingFilter, TrigramSearchFilter]
     search_fields = ["name", "description"]
     ordering_fields = ["name"]
     ordering = ["name"]
@@ -99,15 +102,15 @@ class VerticalViewSet(viewsets.ModelViewSet):
         description="Exclui um plano. Disponível apenas para administradores.",
     ),
 )
-class PlanViewSet(viewsets.ModelViewSet):
+class PlanViewSet(EagerLoadingViewMixin, viewsets.ModelViewSet):
     """API endpoint para gerenciamento de planos de assinatura"""
 
     queryset = Plan.objects.all()
     serializer_class = PlanSerializer
     filter_backends = [
         DjangoFilterBackend,
-        filters.SearchFilter,
         filters.OrderingFilter,
+        TrigramSearchFilter,
     ]
     filterset_fields = ["plan_type", "is_active"]
     search_fields = ["name", "description"]
@@ -137,7 +140,7 @@ class PlanViewSet(viewsets.ModelViewSet):
     def subscriptions(self, request, pk=None):
         """Get all subscriptions for a plan"""
         plan = self.get_object()
-        queryset = plan.subscriptions.all()
+        queryset = self.eager_load(plan.subscriptions.all(), SubscriptionSerializer)
 
         page = self.paginate_queryset(queryset)
         if page is not None:
@@ -180,7 +183,7 @@ class PlanViewSet(viewsets.ModelViewSet):
         description="Exclui uma assinatura. Disponível apenas para administradores.",
     ),
 )
-class SubscriptionViewSet(viewsets.ModelViewSet):
+class SubscriptionViewSet(EagerLoadingViewMixin, viewsets.ModelViewSet):
     """API endpoint para gerenciamento de assinaturas"""
 
     queryset = Subscription.objects.all()
@@ -215,6 +218,29 @@ class SubscriptionViewSet(viewsets.ModelViewSet):
             return SubscriptionCreateUpdateSerializer
         return SubscriptionSerializer
 
+    def _audit(self, event, subscription):
+        audit(
+            event,
+            subscription_id=subscription.id,
+            user_id=subscription.user_id,
+            plan_id=subscription.plan_id,
+            status=subscription.status,
+            by=self.request.user.username,
+        )
+
+    def perform_create(self, serializer):
+        self._audit("subscription.created", serializer.save())
+
+    def perform_update(self, serializer):
+        self._audit("subscription.updated", serializer.save())
+
+    def perform_destroy(self, instance):
+        subscription_id = instance.id
+        instance.delete()
+        # delete() clears the primary key
+        instance.id = subscription_id
+        self._audit("subscription.deleted", instance)
+
     @extend_schema(
         tags=["Subscriptions"],
         summary="Minhas assinaturas",
@@ -226,7 +252,7 @@ class SubscriptionViewSet(viewsets.ModelViewSet):
         """
         Get current user's subscriptions
         """
-        queryset = Subscription.objects.filter(user=request.user)
+        queryset = self.eager_load(Subscription.objects.filter(user=request.user))
 
         page = self.paginate_queryset(queryset)
         if page is not None:
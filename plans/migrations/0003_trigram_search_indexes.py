@@ -0,0 +1,56 @@
+# Generated by Django 4.2.10 on 2026-10-17 03:41
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+from core.migration_operations import AddPostgresIndex
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("plans", "0002_initial"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        AddPostgresIndex(
+            model_name="plan",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("name"), name="gin_trgm_ops"
+                ),
+                name="plan_name_trgm_idx",
+            ),
+        ),
+        AddPostgresIndex(
+            model_name="plan",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("description"),
+                    name="gin_trgm_ops",
+                ),
+                name="plan_description_trgm_idx",
+            ),
+        ),
+        AddPostgresIndex(
+            model_name="vertical",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("name"), name="gin_trgm_ops"
+                ),
+                name="vertical_name_trgm_idx",
+            ),
+        ),
+        AddPostgresIndex(
+            model_name="vertical",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("description"),
+                    name="gin_trgm_ops",
+                ),
+                name="vertical_description_trgm_idx",
+            ),
+        ),
+    ]
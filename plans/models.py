@@ -1,8 +1,12 @@
 from django.contrib.auth import get_user_model
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
+from core.models import DirtyFieldsMixin
+
 User = get_user_model()
 
 # Constantes
@@ -34,9 +38,19 @@ class Vertical(models.Model):
     class Meta:
         verbose_name = _("Vertical")
         verbose_name_plural = _("Verticals")
-
-
-class Plan(models.Model):
+        indexes = [
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"),
+                name="vertical_name_trgm_idx",
+            ),
+            GinIndex(
+                OpClass(Upper("description"), name="gin_trgm_ops"),
+                name="vertical_description_trgm_idx",
+            ),
+        ]
+
+
+class Plan(DirtyFieldsMixin, models.Model):
     """Model representing subscription plans that users can purchase"""
 
     class PlanTypeChoices(models.TextChoices):
@@ -95,6 +109,15 @@ class Plan(models.Model):
     class Meta:
         verbose_name = _("Plan")
         verbose_name_plural = _("Plans")
+        indexes = [
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"), name="plan_name_trgm_idx"
+            ),
+            GinIndex(
+                OpClass(Upper("description"), name="gin_trgm_ops"),
+                name="plan_description_trgm_idx",
+            ),
+        ]
 
     @property
     def current_price(self):
@@ -109,7 +132,7 @@ class Plan(models.Model):
         return self.price
 
 
-class Subscription(models.Model):
+class Subscription(DirtyFieldsMixin, models.Model):
     """Model representing a user's subscription to a specific plan"""
 
     class StatusChoices(models.TextChoices):
@@ -0,0 +1,63 @@
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from plans.models import Plan, Subscription
+from users.models import CACHE_INVALIDATION_BATCH_SIZE, CustomUser
+
+
+def clear_subscription_cache(user_ids):
+    """
+    Invalidate the cached subscription data of ``user_ids``.
+
+    The cache is cleared right away, so the rest of the request sees the
+    change, and again once the transaction commits, dropping anything a
+    concurrent request cached from the rows as they were before the commit.
+    """
+    user_ids = list(user_ids)
+    if not user_ids:
+        return
+    CustomUser.clear_subscription_cache(user_ids)
+    transaction.on_commit(lambda: CustomUser.clear_subscription_cache(user_ids))
+
+
+def subscriber_ids(plan_ids):
+    return (
+        Subscription.objects.filter(plan_id__in=plan_ids)
+        .values_list("user_id", flat=True)
+        .distinct()
+        .iterator(chunk_size=CACHE_INVALIDATION_BATCH_SIZE)
+    )
+
+
+@receiver(post_save, sender=Subscription)
+@receiver(post_delete, sender=Subscription)
+def clear_subscriber_cache(sender, instance, **kwargs):
+    """A subscription was created, changed or removed"""
+    clear_subscription_cache([instance.user_id])
+
+
+@receiver(post_save, sender=Plan)
+def clear_plan_subscribers_cache(sender, instance, created, **kwargs):
+    """Cached subscriptions embed their plan"""
+    if not created:
+        clear_subscription_cache(subscriber_ids([instance.pk]))
+
+
+@receiver(m2m_changed, sender=Plan.verticals.through)
+def clear_plan_entitlements(sender, instance, action, reverse, pk_set, **kwargs):
+    """The verticals of one or more plans changed"""
+    if reverse:
+        # vertical.plans.add(...): instance is a Vertical, pk_set are plans
+        if action == "pre_clear":
+            plan_ids = list(instance.plans.values_list("id", flat=True))
+        elif action in ("post_add", "post_remove"):
+            plan_ids = pk_set
+        else:
+            return
+    elif action in ("post_add", "post_remove", "post_clear"):
+        plan_ids = [instance.pk]
+    else:
+        return
+
+    clear_subscription_cache(subscriber_ids(plan_ids))
@@ -1,9 +1,14 @@
+import logging
 from datetime import timedelta
 
 import pytest
+from django.conf import settings
+from django.core.cache import cache
+from django.test import override_settings
 from django.utils import timezone
 from rest_framework.test import APIClient
 
+from authentication.revocation import revocations
 from news.models import News
 from plans.models import Plan, Subscription, Vertical
 from users.models import CustomUser
@@ -22,6 +27,49 @@ READER_USERNAME = "reader"
 TEST_USERNAME = "testuser"
 
 
+@pytest.fixture(scope="session", autouse=True)
+def isolated_cache_dir(tmp_path_factory):
+    """Cache em arquivo dos testes num diretório próprio, limpo sem afetar outros"""
+    shared = settings.CACHES["shared"]
+    if shared["BACKEND"] != "django.core.cache.backends.filebased.FileBasedCache":
+        yield
+        return
+    location = str(tmp_path_factory.mktemp("cache"))
+    with override_settings(
+        CACHES={**settings.CACHES, "shared": {**shared, "LOCATION": location}}
+    ):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Garante que nenhum teste reaproveite o cache de outro"""
+    cache.clear()
+    revocations.reset()
+    yield
+    cache.clear()
+    revocations.reset()
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def audit_records():
+    """Registros do logger de auditoria durante o teste"""
+    audit_logger = logging.getLogger("audit")
+    handler = ListHandler()
+    audit_logger.addHandler(handler)
+    yield handler.records
+    audit_logger.removeHandler(handler)
+
+
 @pytest.fixture
 def api_client():
     """Fixture que fornece um cliente API para testes"""
@@ -156,6 +204,8 @@ def admin_token(api_client, admin_user):
     response = api_client.post(
         url, {"username": ADMIN_USERNAME, "password": ADMIN_PASSWORD}
     )
+    # As the first authenticated request would, so budgets measure the rest
+    revocations.sync()
     return response.json()["access"]
 
 
@@ -166,6 +216,7 @@ def admin_staff_token(api_client, admin_staff_user):
     response = api_client.post(
         url, {"username": ADMIN_STAFF_USERNAME, "password": ADMIN_PASSWORD}
     )
+    revocations.sync()
     return response.json()["access"]
 
 
@@ -176,6 +227,7 @@ def editor_token(api_client, editor_user):
     response = api_client.post(
         url, {"username": EDITOR_USERNAME, "password": EDITOR_PASSWORD}
     )
+    revocations.sync()
     return response.json()["access"]
 
 
@@ -186,4 +238,5 @@ def reader_token(api_client, reader_user):
     response = api_client.post(
         url, {"username": READER_USERNAME, "password": READER_PASSWORD}
     )
+    revocations.sync()
     return response.json()["access"]
@@ -1,11 +1,36 @@
+import csv
+import io
+import json
+from base64 import urlsafe_b64encode
+from datetime import timedelta
+
 import pytest
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.utils import timezone
+from PIL import Image
 from rest_framework import status
 from rest_framework.test import APIClient
 
+from news import feeds, importing
 from news.models import News
+from news.scheduling import publish_due_news
+from plans.models import Subscription
+from uploads.processing import process_pending_uploads
 
 # Constantes de URL
 BASE_URL = "/api/v1/news/articles/"
+FEEDS_URL = "/api/v1/news/feeds/"
+BULK_URL = f"{BASE_URL}bulk/"
+EXPORT_URL = f"{BASE_URL}export/"
+
+
+def make_image(name, size, image_format="JPEG"):
+    """Gera um arquivo de imagem para upload"""
+    buffer = io.BytesIO()
+    Image.new("RGB", size, "navy").save(buffer, format=image_format)
+    return SimpleUploadedFile(name, buffer.getvalue())
 
 
 def get_detail_url(article_id):
@@ -159,3 +184,934 @@ class TestNewsAPI:
 
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data["results"]) > 0
+
+    def test_list_news_cursor_pagination(
+        self, api_client: APIClient, admin_token: str, editor_user
+    ):
+        """Testa se a paginação por cursor percorre o feed sem repetir notícias"""
+        publication_date = timezone.now()
+        for index in range(12):
+            News.objects.create(
+                title=f"Notícia {index}",
+                content="Conteúdo",
+                author=editor_user,
+                category="poder",
+                status=News.StatusChoices.PUBLISHED,
+                # Datas repetidas forçam o desempate por created_at/id
+                publication_date=publication_date - timedelta(hours=index // 3),
+            )
+        News.objects.create(
+            title="Rascunho", content="Conteúdo", author=editor_user, category="poder"
+        )
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {admin_token}")
+
+        response = api_client.get(f"{BASE_URL}?pagination=cursor")
+        assert response.status_code == status.HTTP_200_OK
+        assert "count" not in response.data
+        assert response.data["previous"] is None
+        first_page = [item["id"] for item in response.data["results"]]
+        assert len(first_page) == 10
+
+        response = api_client.get(response.data["next"])
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["next"] is None
+        second_page = [item["id"] for item in response.data["results"]]
+        # Rascunhos sem data de publicação ficam no início, como no Postgres
+        assert first_page[0] == News.objects.get(title="Rascunho").id
+        assert len(set(first_page + second_page)) == 13
+
+        response = api_client.get(response.data["previous"])
+        assert [item["id"] for item in response.data["results"]] == first_page
+
+    def test_list_news_cursor_pagination_with_filters(
+        self, api_client: APIClient, reader_token: str, published_news: News
+    ):
+        """Testa se a paginação por cursor respeita os filtros e o papel do usuário"""
+        News.objects.create(
+            title="Saúde",
+            content="Conteúdo",
+            author=published_news.author,
+            category="saude",
+            status=News.StatusChoices.PUBLISHED,
+            publication_date=timezone.now(),
+        )
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {reader_token}")
+
+        response = api_client.get(f"{BASE_URL}?pagination=cursor&category=poder")
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["id"] for item in response.data["results"]] == [published_news.id]
+
+    @pytest.mark.parametrize(
+        "cursor",
+        [
+            "invalido",
+            "não-ascii",
+            urlsafe_b64encode(b"nao e json").decode(),
+            urlsafe_b64encode(b"[1, 2]").decode(),
+            urlsafe_b64encode(b'{"k": [1]}').decode(),
+            urlsafe_b64encode(b'{"k": ["ontem", null, 1]}').decode(),
+        ],
+    )
+    def test_list_news_invalid_cursor(
+        self, api_client: APIClient, admin_token: str, cursor: str
+    ):
+        """Testa se um cursor inválido retorna 404"""
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {admin_token}")
+        response = api_client.get(BASE_URL, {"cursor": cursor})
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_retrieve_pro_news_reader_entitlements(
+        self,
+        api_client: APIClient,
+        reader_token: str,
+        subscription: Subscription,
+        published_news: News,
+    ):
+        """Testa se leitores só acessam conteúdo PRO das verticais do seu plano"""
+        published_news.is_pro_content = True
+        published_news.save()
+        other_news = News.objects.create(
+            title="Notícia PRO de Saúde",
+            content="Conteúdo",
+            author=published_news.author,
+            category="saude",
+            is_pro_content=True,
+            status=News.StatusChoices.PUBLISHED,
+            publication_date=timezone.now(),
+        )
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {reader_token}")
+
+        response = api_client.get(get_detail_url(published_news.id))
+        assert response.status_code == status.HTTP_200_OK
+
+        response = api_client.get(get_detail_url(other_news.id))
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_retrieve_pro_news_after_subscription_change(
+        self,
+        api_client: APIClient,
+        reader_token: str,
+        vertical,
+        subscription: Subscription,
+        published_news: News,
+    ):
+        """Testa se mudanças na assinatura e no plano invalidam o acesso em cache"""
+        published_news.is_pro_content = True
+        published_news.save()
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {reader_token}")
+        url = get_detail_url(published_news.id)
+
+        assert api_client.get(url).status_code == status.HTTP_200_OK
+
+        subscription.plan.verticals.clear()
+        assert api_client.get(url).status_code == status.HTTP_403_FORBIDDEN
+
+        subscription.plan.verticals.add(vertical)
+        assert api_client.get(url).status_code == status.HTTP_200_OK
+
+        subscription.status = Subscription.StatusChoices.CANCELLED
+        subscription.save()
+        assert api_client.get(url).status_code == status.HTTP_403_FORBIDDEN
+
+    def test_list_news_accessible_flag_and_filter(
+        self,
+        api_client: APIClient,
+        reader_token: str,
+        subscription: Subscription,
+        published_news: News,
+    ):
+        """Testa o campo accessible e o filtro accessible=true na listagem"""
+        pro_news = News.objects.create(
+            title="Notícia PRO de Poder",
+            content="Conteúdo",
+            author=published_news.author,
+            category="poder",
+            is_pro_content=True,
+            status=News.StatusChoices.PUBLISHED,
+            publication_date=timezone.now(),
+        )
+        locked_news = News.objects.create(
+            title="Notícia PRO de Saúde",
+            content="Conteúdo",
+            author=published_news.author,
+            category="saude",
+            is_pro_content=True,
+            status=News.StatusChoices.PUBLISHED,
+            publication_date=timezone.now(),
+        )
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {reader_token}")
+
+        response = api_client.get(BASE_URL)
+        assert response.status_code == status.HTTP_200_OK
+        flags = {item["id"]: item["accessible"] for item in response.data["results"]}
+        assert flags == {
+            published_news.id: True,
+            pro_news.id: True,
+            locked_news.id: False,
+        }
+
+        response = api_client.get(f"{BASE_URL}?accessible=true")
+        assert response.status_code == status.HTTP_200_OK
+        assert {item["id"] for item in response.data["results"]} == {
+            published_news.id,
+            pro_news.id,
+        }
+
+    def test_retrieve_news_conditional_get(
+        self,
+        api_client: APIClient,
+        reader_token: str,
+        published_news: News,
+        django_assert_max_num_queries,
+    ):
+        """Testa o 304 Not Modified no detalhe da notícia via ETag e Last-Modified"""
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {reader_token}")
+        url = get_detail_url(published_news.id)
+
+        response = api_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        etag = response["ETag"]
+        last_modified = response["Last-Modified"]
+
+        # Apenas a notícia, sem o conteúdo
+        with django_assert_max_num_queries(1):
+            response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response["ETag"] == etag
+
+        response = api_client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+        published_news.content = "Conteúdo atualizado"
+        published_news.save()
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["content"] == "Conteúdo atualizado"
+        assert response["ETag"] != etag
+
+    def test_list_news_conditional_get(
+        self,
+        api_client: APIClient,
+        reader_token: str,
+        editor_user,
+        published_news: News,
+    ):
+        """Testa o 304 Not Modified na listagem, que muda com novas notícias e filtros"""
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {reader_token}")
+
+        response = api_client.get(BASE_URL)
+        etag = response["ETag"]
+        assert api_client.get(BASE_URL, HTTP_IF_NONE_MATCH=etag).status_code == (
+            status.HTTP_304_NOT_MODIFIED
+        )
+
+        # Outros filtros têm outra representação
+        response = api_client.get(f"{BASE_URL}?category=poder", HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+
+        # Rascunhos não aparecem para leitores e não mudam a listagem
+        News.objects.create(
+            title="Rascunho",
+            content="Conteúdo",
+            author=editor_user,
+            category="poder",
+        )
+        assert api_client.get(BASE_URL, HTTP_IF_NONE_MATCH=etag).status_code == (
+            status.HTTP_304_NOT_MODIFIED
+        )
+
+        published_news.delete()
+        response = api_client.get(BASE_URL, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["count"] == 0
+
+    def test_list_news_ignores_if_modified_since(
+        self, api_client: APIClient, reader_token: str, published_news: News
+    ):
+        """A listagem não usa datas: excluir uma notícia não avança nenhuma"""
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {reader_token}")
+        since = "Fri, 01 Jan 2100 00:00:00 GMT"
+
+        for url in (BASE_URL, f"{BASE_URL}?pagination=cursor"):
+            response = api_client.get(url)
+            assert "Last-Modified" not in response
+            assert "ETag" in response
+
+        published_news.delete()
+        for url in (BASE_URL, f"{BASE_URL}?pagination=cursor"):
+            response = api_client.get(url, HTTP_IF_MODIFIED_SINCE=since)
+            assert response.status_code == status.HTTP_200_OK
+            assert response.data["results"] == []
+
+    def test_list_news_cursor_conditional_get_without_count(
+        self,
+        api_client: APIClient,
+        reader_token: str,
+        published_news: News,
+        django_assert_num_queries,
+    ):
+        """No modo cursor, o ETag vem das linhas da página, sem COUNT(*)"""
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {reader_token}")
+        url = f"{BASE_URL}?pagination=cursor"
+
+        # Verticais do leitor (depois em cache) e a página
+        with django_assert_num_queries(2) as context:
+            response = api_client.get(url)
+        assert not any(
+            "COUNT(" in query["sql"].upper() for query in context.captured_queries
+        )
+        etag = response["ETag"]
+
+        with django_assert_num_queries(1):
+            response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+        published_news.title = "Título atualizado"
+        published_news.save()
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_retrieve_news_rendered_response_cache(
+        self,
+        api_client: APIClient,
+        reader_token: str,
+        editor_token: str,
+        published_news: News,
+        django_assert_num_queries,
+    ):
+        """Testa o cache da resposta renderizada de notícias publicadas e não PRO"""
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {reader_token}")
+        url = get_detail_url(published_news.id)
+        first = api_client.get(url)
+        assert first.status_code == status.HTTP_200_OK
+
+        # Nenhuma consulta: o usuário vem das claims do token
+        with django_assert_num_queries(0):
+            cached = api_client.get(url)
+        assert cached.status_code == status.HTTP_200_OK
+        assert cached.content == first.content
+        assert cached["ETag"] == first["ETag"]
+
+        with django_assert_num_queries(0):
+            response = api_client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+        published_news.title = "Título atualizado"
+        published_news.save()
+        assert api_client.get(url).json()["title"] == "Título atualizado"
+
+        # Conteúdo PRO depende das verticais do leitor e nunca vem do cache
+        published_news.is_pro_content = True
+        published_news.save()
+        assert api_client.get(url).status_code == status.HTTP_403_FORBIDDEN
+
+    def test_retrieve_news_cache_per_origin(
+        self,
+        api_client: APIClient,
+        reader_token: str,
+        published_news: News,
+        settings,
+    ):
+        """Testa se URLs absolutas em cache respeitam o host e o esquema da requisição"""
+        settings.ALLOWED_HOSTS = ["testserver", "noticias.example.com"]
+        News.objects.filter(pk=published_news.pk).update(image="news/images/capa.jpg")
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {reader_token}")
+        url = get_detail_url(published_news.id)
+
+        first = api_client.get(url)
+        assert first.json()["image"].startswith("http://testserver/")
+        other_host = api_client.get(url, HTTP_HOST="noticias.example.com")
+        assert other_host.json()["image"].startswith("http://noticias.example.com/")
+        secure = api_client.get(url, secure=True)
+        assert secure.json()["image"].startswith("https://testserver/")
+        assert other_host["ETag"] == secure["ETag"] == first["ETag"]
+
+        # Todas as origens ficam na mesma entrada e são limpas juntas
+        assert api_client.get(url).content == first.content
+        published_news.title = "Título atualizado"
+        published_news.save()
+        response = api_client.get(url, HTTP_HOST="noticias.example.com")
+        assert response.json()["title"] == "Título atualizado"
+
+    def test_retrieve_news_cache_skips_non_canonical_ids(
+        self, api_client: APIClient, reader_token: str, published_news: News
+    ):
+        """Testa se ids não canônicos não deixam cópias que sobrevivem à invalidação"""
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {reader_token}")
+        alias_url = f"{BASE_URL}0{published_news.id}/"
+        assert api_client.get(alias_url).status_code == status.HTTP_200_OK
+        assert api_client.get(get_detail_url(published_news.id)).status_code == (
+            status.HTTP_200_OK
+        )
+
+        published_news.status = News.StatusChoices.DRAFT
+        published_news.save()
+        assert api_client.get(alias_url).status_code == status.HTTP_404_NOT_FOUND
+        assert api_client.get(get_detail_url(published_news.id)).status_code == (
+            status.HTTP_404_NOT_FOUND
+        )
+
+    def test_retrieve_news_cache_skips_drafts(
+        self,
+        api_client: APIClient,
+        editor_token: str,
+        reader_token: str,
+        unpublished_news: News,
+    ):
+        """Testa se rascunhos vistos pelo autor não ficam em cache para leitores"""
+        url = get_detail_url(unpublished_news.id)
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {editor_token}")
+        assert api_client.get(url).status_code == status.HTTP_200_OK
+
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {reader_token}")
+        assert api_client.get(url).status_code == status.HTTP_404_NOT_FOUND
+
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {editor_token}")
+        publish_url = f"{get_detail_url(unpublished_news.id)}publish/"
+        assert api_client.post(publish_url).status_code == status.HTTP_200_OK
+
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {reader_token}")
+        response = api_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["status"] == News.StatusChoices.PUBLISHED
+
+    def test_vertical_feed(
+        self,
+        api_client: APIClient,
+        reader_token: str,
+        editor_user,
+        published_news: News,
+        unpublished_news: News,
+        django_assert_num_queries,
+        django_capture_on_commit_callbacks,
+    ):
+        """Testa o feed materializado da vertical e sua atualização incremental"""
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {reader_token}")
+        url = f"{FEEDS_URL}poder/"
+
+        response = api_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["id"] for item in response.data] == [published_news.id]
+        assert response.data[0]["accessible"] is True
+
+        # Servido do cache, sem nenhuma consulta
+        with django_assert_num_queries(0):
+            assert api_client.get(url).status_code == status.HTTP_200_OK
+
+        with django_capture_on_commit_callbacks(execute=True):
+            unpublished_news.status = News.StatusChoices.PUBLISHED
+            unpublished_news.publication_date = timezone.now()
+            unpublished_news.save()
+        with django_assert_num_queries(0):
+            response = api_client.get(url)
+        assert [item["id"] for item in response.data] == [
+            unpublished_news.id,
+            published_news.id,
+        ]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            unpublished_news.category = "saude"
+            unpublished_news.is_pro_content = True
+            unpublished_news.save()
+        assert [item["id"] for item in api_client.get(url).data] == [published_news.id]
+        response = api_client.get(f"{FEEDS_URL}saude/")
+        assert [item["accessible"] for item in response.data] == [False]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            published_news.delete()
+        assert api_client.get(url).data == []
+
+        assert api_client.get(f"{FEEDS_URL}esportes/").status_code == (
+            status.HTTP_404_NOT_FOUND
+        )
+
+    def test_vertical_feed_keeps_latest_when_full(
+        self,
+        api_client: APIClient,
+        reader_token: str,
+        editor_user,
+        django_capture_on_commit_callbacks,
+        monkeypatch,
+    ):
+        """Testa se o feed cheio é recalculado ao perder uma notícia"""
+        monkeypatch.setattr(feeds, "FEED_SIZE", 2)
+        now = timezone.now()
+        articles = [
+            News.objects.create(
+                title=f"Notícia {index}",
+                content="Conteúdo",
+                author=editor_user,
+                category="poder",
+                status=News.StatusChoices.PUBLISHED,
+                publication_date=now - timedelta(hours=index),
+            )
+            for index in range(3)
+        ]
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {reader_token}")
+        url = f"{FEEDS_URL}poder/"
+        assert [item["id"] for item in api_client.get(url).data] == [
+            articles[0].id,
+            articles[1].id,
+        ]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            articles[0].delete()
+        assert [item["id"] for item in api_client.get(url).data] == [
+            articles[1].id,
+            articles[2].id,
+        ]
+
+        call_command("rebuild_news_feeds", "poder", stdout=io.StringIO())
+        assert len(api_client.get(url).data) == 2
+
+    def test_vertical_feed_update_waits_for_lock(
+        self,
+        api_client: APIClient,
+        reader_token: str,
+        published_news: News,
+        unpublished_news: News,
+        django_capture_on_commit_callbacks,
+        monkeypatch,
+    ):
+        """Testa se atualizações concorrentes do feed não perdem notícias"""
+        monkeypatch.setattr(feeds, "FEED_LOCK_WAIT", 0)
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {reader_token}")
+        url = f"{FEEDS_URL}poder/"
+        assert [item["id"] for item in api_client.get(url).data] == [published_news.id]
+        lock_key = feeds.FEED_LOCK_KEY.format(vertical="poder")
+
+        # Outro worker segura o feed: a atualização o recalcula do banco
+        cache.add(lock_key, "outro worker", feeds.FEED_LOCK_TIMEOUT)
+        with django_capture_on_commit_callbacks(execute=True):
+            unpublished_news.status = News.StatusChoices.PUBLISHED
+            unpublished_news.publication_date = timezone.now()
+            unpublished_news.save()
+        assert [item["id"] for item in api_client.get(url).data] == [
+            unpublished_news.id,
+            published_news.id,
+        ]
+        assert cache.get(lock_key) == "outro worker"
+
+        # Com o feed livre, a atualização incremental libera o lock ao terminar
+        cache.delete(lock_key)
+        with django_capture_on_commit_callbacks(execute=True):
+            published_news.delete()
+        assert [item["id"] for item in api_client.get(url).data] == [
+            unpublished_news.id
+        ]
+        assert cache.get(lock_key) is None
+
+    def test_schedule_and_publish_due_news(
+        self,
+        api_client: APIClient,
+        editor_token: str,
+        reader_token: str,
+        unpublished_news: News,
+        django_capture_on_commit_callbacks,
+        audit_records,
+    ):
+        """Testa o agendamento via publish e a publicação pelo agendador"""
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {editor_token}")
+        publish_url = f"{get_detail_url(unpublished_news.id)}publish/"
+        scheduled_for = timezone.now() + timedelta(hours=1)
+
+        response = api_client.post(
+            publish_url,
+            {"scheduled_for": (timezone.now() - timedelta(hours=1)).isoformat()},
+            format="json",
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        response = api_client.post(
+            publish_url, {"scheduled_for": scheduled_for.isoformat()}, format="json"
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["status"] == News.StatusChoices.SCHEDULED
+
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {reader_token}")
+        assert api_client.get(f"{FEEDS_URL}poder/").data == []
+        assert publish_due_news() == 0
+
+        with django_capture_on_commit_callbacks(execute=True):
+            assert publish_due_news(now=scheduled_for) == 1
+
+        unpublished_news.refresh_from_db()
+        assert unpublished_news.status == News.StatusChoices.PUBLISHED
+        assert unpublished_news.publication_date == scheduled_for
+        assert unpublished_news.scheduled_for is None
+        assert [
+            (record.msg, record.audit["news_id"], record.audit["user"])
+            for record in audit_records
+        ] == [
+            ("news.scheduled", unpublished_news.id, "editor"),
+            ("news.published", unpublished_news.id, None),
+        ]
+        feed = api_client.get(f"{FEEDS_URL}poder/").data
+        assert [item["id"] for item in feed] == [unpublished_news.id]
+        assert publish_due_news(now=scheduled_for) == 0
+
+    def test_create_scheduled_news_requires_date(
+        self, api_client: APIClient, editor_token: str
+    ):
+        """Testa se notícias agendadas exigem scheduled_for"""
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {editor_token}")
+        data = {
+            "title": "Notícia agendada",
+            "content": "Conteúdo",
+            "category": "poder",
+            "status": News.StatusChoices.SCHEDULED,
+        }
+
+        response = api_client.post(BASE_URL, data, format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "scheduled_for" in response.data
+
+        data["scheduled_for"] = (timezone.now() + timedelta(days=1)).isoformat()
+        response = api_client.post(BASE_URL, data, format="json")
+        assert response.status_code == status.HTTP_201_CREATED
+
+    def test_bulk_import_json(
+        self,
+        api_client: APIClient,
+        editor_token: str,
+        editor_user,
+        admin_user,
+        published_news: News,
+        django_capture_on_commit_callbacks,
+        audit_records,
+    ):
+        """Testa a importação em lote com criação, atualização e erros por item"""
+        others_news = News.objects.create(
+            title="Notícia do admin", content="Conteúdo", author=admin_user
+        )
+        others_published = News.objects.create(
+            title="Publicada do admin",
+            content="Conteúdo",
+            author=admin_user,
+            status=News.StatusChoices.PUBLISHED,
+            publication_date=timezone.now(),
+        )
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {editor_token}")
+        items = [
+            {"title": "Nova 1", "content": "Conteúdo", "category": "saude"},
+            {"title": "", "content": "Conteúdo"},
+            {"id": published_news.id, "title": "Título em lote"},
+            {"id": others_published.id, "title": "Não permitido"},
+            {"id": others_news.id, "title": "Rascunho de outro autor"},
+            {"id": 999999, "title": "Inexistente"},
+            "não é um objeto",
+        ]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            response = api_client.post(BULK_URL, items, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert (response.data["created"], response.data["updated"]) == (1, 1)
+        assert response.data["failed"] == 5
+        results = response.data["results"]
+        assert [result["status"] for result in results] == [
+            "created",
+            "error",
+            "updated",
+            "error",
+            "error",
+            "error",
+            "error",
+        ]
+        assert "title" in results[1]["errors"]
+        assert results[3]["errors"] == {
+            "id": ["You do not have permission to edit this news"]
+        }
+        # Rascunhos de outros autores não são distinguíveis de ids inexistentes
+        assert results[4]["errors"] == results[5]["errors"] == {"id": ["Not found"]}
+        assert [(record.msg, record.audit["news_id"]) for record in audit_records] == [
+            ("news.created", results[0]["id"]),
+            ("news.updated", published_news.id),
+        ]
+        created = News.objects.get(id=results[0]["id"])
+        assert (created.author, created.category) == (editor_user, "saude")
+        published_news.refresh_from_db()
+        assert published_news.title == "Título em lote"
+        assert News.objects.get(id=others_news.id).title == "Notícia do admin"
+        assert News.objects.get(id=others_published.id).title == "Publicada do admin"
+
+    def test_bulk_import_ndjson(
+        self, api_client: APIClient, editor_token: str, monkeypatch
+    ):
+        """Testa a importação em lote via NDJSON, em vários blocos"""
+        monkeypatch.setattr(importing, "DEFAULT_CHUNK_SIZE", 2)
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {editor_token}")
+        lines = [
+            json.dumps({"title": f"Notícia {index}", "content": "Conteúdo"})
+            for index in range(3)
+        ]
+        lines.insert(1, "{json inválido")
+        body = "\n".join(lines) + "\n"
+
+        response = api_client.post(BULK_URL, body, content_type="application/x-ndjson")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [result["status"] for result in response.data["results"]] == [
+            "created",
+            "error",
+            "created",
+            "created",
+        ]
+        assert News.objects.filter(title__startswith="Notícia ").count() == 3
+
+    def test_bulk_import_reader_forbidden(
+        self, api_client: APIClient, reader_token: str
+    ):
+        """Testa se leitores não podem importar notícias"""
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {reader_token}")
+        response = api_client.post(BULK_URL, [], format="json")
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_export_news_ndjson(
+        self,
+        api_client: APIClient,
+        reader_token: str,
+        published_news: News,
+        unpublished_news: News,
+    ):
+        """Testa a exportação NDJSON com os filtros de papel e o conteúdo PRO omitido"""
+        pro_news = News.objects.create(
+            title="Notícia PRO",
+            content="Conteúdo exclusivo",
+            author=published_news.author,
+            category="saude",
+            is_pro_content=True,
+            status=News.StatusChoices.PUBLISHED,
+            publication_date=timezone.now() - timedelta(days=1),
+        )
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {reader_token}")
+
+        response = api_client.get(EXPORT_URL)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "application/x-ndjson"
+        rows = [
+            json.loads(line)
+            for line in b"".join(response.streaming_content).decode().splitlines()
+        ]
+        assert [row["id"] for row in rows] == [published_news.id, pro_news.id]
+        assert rows[0]["content"] == published_news.content
+        assert rows[1]["content"] is None
+        assert rows[1]["author_username"] == published_news.author.username
+
+        response = api_client.get(f"{EXPORT_URL}?category=saude")
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        assert [json.loads(line)["id"] for line in lines] == [pro_news.id]
+
+    def test_export_news_csv(
+        self,
+        api_client: APIClient,
+        editor_token: str,
+        published_news: News,
+        unpublished_news: News,
+    ):
+        """Testa a exportação CSV, incluindo os rascunhos do próprio editor"""
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {editor_token}")
+
+        response = api_client.get(f"{EXPORT_URL}?export_format=csv")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert "attachment" in response["Content-Disposition"]
+        content = b"".join(response.streaming_content).decode()
+        rows = list(csv.DictReader(io.StringIO(content)))
+        assert {int(row["id"]) for row in rows} == {
+            published_news.id,
+            unpublished_news.id,
+        }
+        draft = next(row for row in rows if int(row["id"]) == unpublished_news.id)
+        assert draft["publication_date"] == ""
+        assert draft["content"] == unpublished_news.content
+
+        response = api_client.get(f"{EXPORT_URL}?export_format=xml")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_bulk_publish_and_unpublish(
+        self,
+        api_client: APIClient,
+        editor_token: str,
+        admin_user,
+        published_news: News,
+        unpublished_news: News,
+        django_assert_max_num_queries,
+        audit_records,
+    ):
+        """Testa a publicação em lote com verificação de autoria em uma consulta"""
+        others_draft = News.objects.create(
+            title="Rascunho do admin", content="Conteúdo", author=admin_user
+        )
+        others_published = News.objects.create(
+            title="Publicada do admin",
+            content="Conteúdo",
+            author=admin_user,
+            status=News.StatusChoices.PUBLISHED,
+            publication_date=timezone.now(),
+        )
+        original_date = published_news.publication_date
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {editor_token}")
+        ids = [
+            unpublished_news.id,
+            published_news.id,
+            others_draft.id,
+            others_published.id,
+            999999,
+        ]
+
+        # Consulta dos ids, UPDATE (e savepoint do atomic)
+        with django_assert_max_num_queries(4):
+            response = api_client.post(
+                f"{BASE_URL}bulk-publish/", {"ids": ids}, format="json"
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["updated"] == [unpublished_news.id, published_news.id]
+        assert {item["id"] for item in response.data["failed"]} == {
+            others_draft.id,
+            others_published.id,
+            999999,
+        }
+        unpublished_news.refresh_from_db()
+        published_news.refresh_from_db()
+        assert unpublished_news.status == News.StatusChoices.PUBLISHED
+        assert unpublished_news.publication_date is not None
+        assert published_news.publication_date == original_date
+        others_draft.refresh_from_db()
+        assert others_draft.status == News.StatusChoices.DRAFT
+
+        response = api_client.post(
+            f"{BASE_URL}bulk-unpublish/", {"ids": [unpublished_news.id]}, format="json"
+        )
+        assert response.data["updated"] == [unpublished_news.id]
+        # Um evento por notícia que mudou de status
+        assert [
+            (record.msg, record.audit["news_id"], record.audit["user"])
+            for record in audit_records
+        ] == [
+            ("news.published", unpublished_news.id, "editor"),
+            ("news.unpublished", unpublished_news.id, "editor"),
+        ]
+        unpublished_news.refresh_from_db()
+        assert unpublished_news.status == News.StatusChoices.DRAFT
+        assert unpublished_news.publication_date is None
+
+    @pytest.mark.parametrize(
+        ("action", "expected"),
+        [
+            ("bulk-publish", News.StatusChoices.PUBLISHED),
+            ("bulk-unpublish", News.StatusChoices.DRAFT),
+        ],
+    )
+    def test_bulk_status_change_clears_schedule(
+        self, api_client: APIClient, editor_token: str, editor_user, action, expected
+    ):
+        """Testa se a mudança de status em lote remove o agendamento, como o publish"""
+        scheduled = News.objects.create(
+            title="Agendada",
+            content="Conteúdo",
+            author=editor_user,
+            status=News.StatusChoices.SCHEDULED,
+            scheduled_for=timezone.now() + timedelta(hours=1),
+        )
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {editor_token}")
+
+        response = api_client.post(
+            f"{BASE_URL}{action}/", {"ids": [scheduled.id]}, format="json"
+        )
+
+        assert response.data["updated"] == [scheduled.id]
+        scheduled.refresh_from_db()
+        assert scheduled.status == expected
+        assert scheduled.scheduled_for is None
+
+    def test_bulk_publish_reader_forbidden(
+        self, api_client: APIClient, reader_token: str, unpublished_news: News
+    ):
+        """Testa se leitores não podem publicar em lote"""
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {reader_token}")
+        response = api_client.post(
+            f"{BASE_URL}bulk-publish/", {"ids": [unpublished_news.id]}, format="json"
+        )
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_image_renditions(
+        self,
+        api_client: APIClient,
+        editor_token: str,
+        unpublished_news: News,
+        settings,
+        tmp_path,
+        django_capture_on_commit_callbacks,
+    ):
+        """Testa a geração das versões redimensionadas e WebP da imagem"""
+        settings.MEDIA_ROOT = tmp_path
+        settings.IMAGE_RENDITIONS_ASYNC = False
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {editor_token}")
+        image_url = f"{get_detail_url(unpublished_news.id)}image/"
+
+        response = api_client.post(
+            image_url,
+            {"file": make_image("foto.jpg", size=(1600, 900))},
+            format="multipart",
+        )
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        # Geradas depois do processamento, fora da resposta do upload
+        with django_capture_on_commit_callbacks(execute=True):
+            process_pending_uploads()
+
+        news = News.objects.get(id=unpublished_news.id)
+        renditions = api_client.get(get_detail_url(news.id)).json()["renditions"]
+        assert set(renditions) == {"thumbnail", "small", "large"}
+        assert (
+            renditions["thumbnail"]["width"],
+            renditions["thumbnail"]["height"],
+        ) == (
+            320,
+            180,
+        )
+        assert renditions["small"]["webp"].endswith(".small.webp")
+        thumbnail = news.image_renditions["thumbnail"]
+        with Image.open(tmp_path / thumbnail["webp"]) as webp:
+            assert (webp.format, webp.size) == ("WEBP", (320, 180))
+
+        # Trocar a imagem gera novas versões e remove as antigas
+        api_client.post(
+            image_url,
+            {"file": make_image("nova.png", size=(200, 100), image_format="PNG")},
+            format="multipart",
+        )
+        with django_capture_on_commit_callbacks(execute=True):
+            process_pending_uploads()
+        news.refresh_from_db()
+        assert news.image_renditions["large"]["width"] == 200
+        assert news.image_renditions["large"]["image"].endswith(".large.png")
+        assert not (tmp_path / thumbnail["webp"]).exists()
+
+    def test_image_cannot_be_written_directly(
+        self, api_client: APIClient, editor_token: str, unpublished_news: News
+    ):
+        """A imagem só é aceita pela fila de uploads, nunca direto na notícia"""
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {editor_token}")
+
+        response = api_client.patch(
+            get_detail_url(unpublished_news.id),
+            {"image": make_image("foto.jpg", size=(100, 100))},
+            format="multipart",
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "image" in response.data
+
+        data = {
+            "title": "Notícia com imagem",
+            "content": "Conteúdo",
+            "category": "poder",
+            "image": make_image("foto.jpg", size=(100, 100)),
+        }
+        response = api_client.post(BASE_URL, data, format="multipart")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not News.objects.filter(title="Notícia com imagem").exists()
+        unpublished_news.refresh_from_db()
+        assert not unpublished_news.image
@@ -0,0 +1,127 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from news.models import News
+from plans.models import Plan, Subscription, Vertical
+from users.models import CustomUser
+
+# Número de registros criados por endpoint: grande o bastante para que uma
+# consulta N+1 estoure qualquer orçamento abaixo
+ROWS = 15
+
+# (endpoint, token do usuário ou None para anônimo, orçamento máximo de
+# consultas por requisição). A autenticação JWT não consulta o usuário: ele
+# vem das claims do token.
+QUERY_BUDGETS = [
+    ("/api/v1/news/articles/", "admin_token", 2),
+    ("/api/v1/news/articles/", "editor_token", 2),
+    # Leitores: + 1 consulta das verticais liberadas (campo accessible)
+    ("/api/v1/news/articles/", "reader_token", 3),
+    # Cursor: sem COUNT(*) da paginação, mas com o agregado do ETag
+    ("/api/v1/news/articles/?pagination=cursor", "reader_token", 3),
+    ("/api/v1/news/articles/?accessible=true", "reader_token", 3),
+    ("/api/v1/news/articles/{news_id}/", "admin_token", 1),
+    ("/api/v1/news/articles/{news_id}/", "reader_token", 1),
+    ("/api/v1/news/articles/{pro_news_id}/", "reader_token", 2),
+    ("/api/v1/plans/", None, 3),
+    ("/api/v1/plans/{plan_id}/subscriptions/", "admin_token", 5),
+    ("/api/v1/plans/subscriptions/", "admin_token", 3),
+    ("/api/v1/plans/subscriptions/", "reader_token", 3),
+    ("/api/v1/plans/subscriptions/my-subscriptions/", "reader_token", 3),
+]
+
+
+@pytest.fixture
+def many_news(editor_user, admin_user):
+    """Cria notícias de autores diferentes, publicadas e rascunhos"""
+    return News.objects.bulk_create(
+        News(
+            title=f"Notícia {index}",
+            content="Conteúdo " * 100,
+            author=editor_user if index % 2 else admin_user,
+            category="poder",
+            is_pro_content=index == 1,
+            status=News.StatusChoices.PUBLISHED,
+            publication_date=timezone.now(),
+        )
+        for index in range(ROWS)
+    )
+
+
+@pytest.fixture
+def many_subscriptions(reader_user):
+    """Cria planos com verticais e assinaturas de vários leitores"""
+    verticals = [
+        Vertical.objects.create(name=label, slug=slug)
+        for slug, label in Vertical.VerticalChoices.choices
+    ]
+    plans = []
+    for index in range(ROWS):
+        plan = Plan.objects.create(
+            name=f"Plano {index}", slug=f"plano-{index}", plan_type="pro", price=10
+        )
+        plan.verticals.set(verticals[: index % len(verticals) + 1])
+        plans.append(plan)
+
+    readers = [reader_user] + [
+        CustomUser.objects.create_user(
+            username=f"leitor{index}", email=f"leitor{index}@test.com"
+        )
+        for index in range(ROWS)
+    ]
+    now = timezone.now()
+    Subscription.objects.bulk_create(
+        [
+            Subscription(
+                user=reader_user,
+                plan=plan,
+                start_date=now,
+                end_date=now + timedelta(30),
+            )
+            for plan in plans
+        ]
+        + [
+            Subscription(
+                user=reader, plan=plans[0], start_date=now, end_date=now + timedelta(30)
+            )
+            for reader in readers[1:]
+        ]
+    )
+    return plans
+
+
+@pytest.mark.integration
+@pytest.mark.api
+@pytest.mark.django_db
+class TestQueryBudgets:
+    """Falha quando um endpoint de leitura excede seu orçamento de consultas"""
+
+    @pytest.mark.parametrize("url,token_fixture,budget", QUERY_BUDGETS)
+    def test_read_endpoint_query_budget(
+        self,
+        request,
+        api_client: APIClient,
+        django_assert_max_num_queries,
+        many_news,
+        many_subscriptions,
+        url,
+        token_fixture,
+        budget,
+    ):
+        if token_fixture:
+            token = request.getfixturevalue(token_fixture)
+            api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        url = url.format(
+            news_id=many_news[0].id,
+            pro_news_id=many_news[1].id,
+            plan_id=many_subscriptions[0].id,
+        )
+
+        with django_assert_max_num_queries(budget):
+            response = api_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
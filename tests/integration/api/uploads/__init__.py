@@ -0,0 +1 @@
+# Arquivo vazio para marcar o diretório como um pacote Python
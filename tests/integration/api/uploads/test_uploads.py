@@ -0,0 +1,299 @@
+import io
+from datetime import timedelta
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.utils import timezone
+from PIL import Image
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from news.models import News
+from uploads.models import Upload
+from uploads.processing import claim_uploads, process_pending_uploads
+
+# Constantes de URL
+BASE_URL = "/api/v1/uploads/"
+NEWS_URL = "/api/v1/news/articles/"
+USERS_URL = "/api/v1/users/"
+
+
+def make_image(name, size, image_format="JPEG", exif=None):
+    """Gera um arquivo de imagem para upload"""
+    buffer = io.BytesIO()
+    options = {"exif": exif} if exif is not None else {}
+    Image.new("RGB", size, "navy").save(buffer, format=image_format, **options)
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type="image/jpeg")
+
+
+def get_news_image_url(news_id):
+    return f"{NEWS_URL}{news_id}/image/"
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    """Arquivos enviados vão para um diretório temporário"""
+    settings.MEDIA_ROOT = tmp_path
+    settings.IMAGE_RENDITIONS_ASYNC = False
+    return tmp_path
+
+
+@pytest.mark.integration
+@pytest.mark.api
+@pytest.mark.django_db
+class TestUploadAPI:
+    def test_news_image_upload(
+        self,
+        api_client: APIClient,
+        editor_token: str,
+        unpublished_news: News,
+        media_root,
+        django_capture_on_commit_callbacks,
+    ):
+        """Testa o envio da imagem da notícia e o acompanhamento do processamento"""
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {editor_token}")
+        response = api_client.post(
+            get_news_image_url(unpublished_news.id),
+            {"file": make_image("foto.jpg", size=(4000, 1000))},
+            format="multipart",
+        )
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert response.data["status"] == Upload.StatusChoices.PENDING
+        assert response.data["image"] is None
+
+        # Nada é processado dentro da requisição
+        unpublished_news.refresh_from_db()
+        assert not unpublished_news.image
+        upload = Upload.objects.get(id=response.data["id"])
+        received = media_root / upload.file.name
+        assert received.exists()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            assert process_pending_uploads() == 1
+
+        response = api_client.get(f"{BASE_URL}{upload.id}/")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["status"] == Upload.StatusChoices.DONE
+        assert (response.data["width"], response.data["height"]) == (2560, 640)
+        assert response.data["image"].endswith(".jpg")
+        assert not received.exists()
+
+        unpublished_news.refresh_from_db()
+        assert unpublished_news.image.name == Upload.objects.get(id=upload.id).result
+        # As versões redimensionadas partem da imagem já processada
+        assert (
+            unpublished_news.image_renditions["source"] == unpublished_news.image.name
+        )
+
+    def test_exif_is_stripped(
+        self,
+        api_client: APIClient,
+        reader_user,
+        reader_token: str,
+        media_root,
+    ):
+        """Testa se a foto é girada conforme a orientação EXIF e perde os metadados"""
+        exif = Image.Exif()
+        exif[0x0112] = 6  # Orientação: girar 90 graus
+        exif[0x010F] = "Câmera"
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {reader_token}")
+        response = api_client.post(
+            f"{USERS_URL}{reader_user.id}/profile-picture/",
+            {"file": make_image("perfil.jpg", size=(300, 200), exif=exif)},
+            format="multipart",
+        )
+        assert response.status_code == status.HTTP_202_ACCEPTED
+
+        process_pending_uploads()
+
+        reader_user.refresh_from_db()
+        assert reader_user.profile_picture.name.startswith("profiles/")
+        with Image.open(media_root / reader_user.profile_picture.name) as image:
+            assert image.size == (200, 300)
+            assert not image.getexif()
+
+    def test_invalid_image_fails(
+        self,
+        api_client: APIClient,
+        editor_token: str,
+        unpublished_news: News,
+    ):
+        """Testa se um arquivo que não é imagem é rejeitado pelo processamento"""
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {editor_token}")
+        response = api_client.post(
+            get_news_image_url(unpublished_news.id),
+            {"file": SimpleUploadedFile("falsa.jpg", b"nao sou uma imagem")},
+            format="multipart",
+        )
+        assert response.status_code == status.HTTP_202_ACCEPTED
+
+        process_pending_uploads()
+
+        response = api_client.get(f"{BASE_URL}{response.data['id']}/")
+        assert response.data["status"] == Upload.StatusChoices.FAILED
+        assert response.data["error"] == "The file is not a valid image."
+        unpublished_news.refresh_from_db()
+        assert not unpublished_news.image
+
+    def test_request_validation(
+        self,
+        api_client: APIClient,
+        editor_token: str,
+        unpublished_news: News,
+        settings,
+    ):
+        """Testa as validações feitas na própria requisição: tamanho e extensão"""
+        settings.UPLOAD_MAX_SIZE = 100
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {editor_token}")
+        response = api_client.post(
+            get_news_image_url(unpublished_news.id),
+            {"file": make_image("grande.jpg", size=(100, 100))},
+            format="multipart",
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "file" in response.data
+
+        response = api_client.post(
+            get_news_image_url(unpublished_news.id),
+            {"file": SimpleUploadedFile("script.sh", b"#!")},
+            format="multipart",
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not Upload.objects.exists()
+
+    def test_duplicate_upload_reuses_result(
+        self,
+        api_client: APIClient,
+        editor_user,
+        editor_token: str,
+        unpublished_news: News,
+    ):
+        """Testa se a mesma imagem enviada duas vezes é processada uma vez só"""
+        other_news = News.objects.create(
+            title="Outra notícia", content="Conteúdo", author=editor_user
+        )
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {editor_token}")
+        content = make_image("foto.jpg", size=(50, 50)).read()
+        for news in (unpublished_news, other_news):
+            api_client.post(
+                get_news_image_url(news.id),
+                {"file": SimpleUploadedFile("foto.jpg", content)},
+                format="multipart",
+            )
+            process_pending_uploads()
+
+        first, second = Upload.objects.order_by("created_at")
+        assert first.checksum == second.checksum
+        assert first.result == second.result
+        unpublished_news.refresh_from_db()
+        other_news.refresh_from_db()
+        assert unpublished_news.image.name == other_news.image.name
+
+    def test_older_upload_does_not_overwrite_newer(
+        self,
+        api_client: APIClient,
+        editor_token: str,
+        unpublished_news: News,
+    ):
+        """Testa se um envio antigo processado por último não substitui o mais recente"""
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {editor_token}")
+        for name, size in (("antiga.jpg", (10, 10)), ("nova.jpg", (20, 20))):
+            api_client.post(
+                get_news_image_url(unpublished_news.id),
+                {"file": make_image(name, size=size)},
+                format="multipart",
+            )
+        older, newer = Upload.objects.order_by("created_at")
+        Upload.objects.filter(id=older.id).update(
+            created_at=newer.created_at - timedelta(seconds=1)
+        )
+
+        # O mais recente termina primeiro
+        Upload.objects.filter(id=older.id).update(status=Upload.StatusChoices.DONE)
+        process_pending_uploads()
+        Upload.objects.filter(id=older.id).update(status=Upload.StatusChoices.PENDING)
+        process_pending_uploads()
+
+        unpublished_news.refresh_from_db()
+        newer.refresh_from_db()
+        assert unpublished_news.image.name == newer.result
+        assert Upload.objects.get(id=older.id).status == Upload.StatusChoices.DONE
+
+    def test_stale_uploads_are_retried(
+        self,
+        api_client: APIClient,
+        editor_token: str,
+        unpublished_news: News,
+        settings,
+    ):
+        """Testa se envios abandonados por um worker são retomados ou dados como falhos"""
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {editor_token}")
+        for name in ("a.jpg", "b.jpg"):
+            api_client.post(
+                get_news_image_url(unpublished_news.id),
+                {"file": make_image(name, size=(10, 10))},
+                format="multipart",
+            )
+        retried, abandoned = Upload.objects.order_by("created_at")
+        started_at = timezone.now() - timedelta(
+            seconds=settings.UPLOAD_PROCESSING_TIMEOUT + 1
+        )
+        Upload.objects.filter(id=retried.id).update(
+            status=Upload.StatusChoices.PROCESSING, started_at=started_at, attempts=1
+        )
+        Upload.objects.filter(id=abandoned.id).update(
+            status=Upload.StatusChoices.PROCESSING,
+            started_at=started_at,
+            attempts=settings.UPLOAD_MAX_ATTEMPTS,
+        )
+
+        claimed = claim_uploads()
+        assert [upload.id for upload in claimed] == [retried.id]
+        assert claimed[0].attempts == 2
+        abandoned.refresh_from_db()
+        assert abandoned.status == Upload.StatusChoices.FAILED
+        # Em processamento há pouco tempo: não é retomado
+        assert claim_uploads() == []
+
+    def test_upload_permissions(
+        self,
+        api_client: APIClient,
+        admin_token: str,
+        reader_user,
+        reader_token: str,
+        editor_user,
+        unpublished_news: News,
+    ):
+        """Testa quem pode enviar imagens e acompanhar os envios"""
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {reader_token}")
+        response = api_client.post(
+            f"{USERS_URL}{editor_user.id}/profile-picture/",
+            {"file": make_image("perfil.jpg", size=(10, 10))},
+            format="multipart",
+        )
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+        response = api_client.post(
+            f"{USERS_URL}{reader_user.id}/profile-picture/",
+            {"file": make_image("perfil.jpg", size=(10, 10))},
+            format="multipart",
+        )
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        upload_id = response.data["id"]
+
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {admin_token}")
+        response = api_client.post(
+            get_news_image_url(unpublished_news.id),
+            {"file": make_image("foto.jpg", size=(10, 10))},
+            format="multipart",
+        )
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        # Administradores veem todos os envios
+        assert api_client.get(BASE_URL).data["count"] == 2
+
+        # Leitores veem apenas os próprios envios
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {reader_token}")
+        response = api_client.get(BASE_URL)
+        assert [upload["id"] for upload in response.data["results"]] == [upload_id]
+        response = api_client.get(f"{BASE_URL}{response.data['results'][0]['id'] + 1}/")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -1,8 +1,23 @@
+from datetime import timedelta
+
 import pytest
+from django.core.cache import cache
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
 
-from users.models import CustomUser
+from authentication import login_limiter
+from authentication.api.v1.serializers import CustomTokenObtainPairSerializer
+from authentication.backends import StatelessJWTAuthentication
+from authentication.models import RevokedToken, TokenUser
+from authentication.revocation import (
+    RevocationList,
+    prune_revoked_tokens,
+    revoke_tokens,
+)
+from plans.models import Subscription
+from users.models import ACTIVE_SUBSCRIPTION_CACHE_KEY, CustomUser
 
 BASE_URL = "/api/v1/users/"
 ME_URL = f"{BASE_URL}me/"
@@ -29,6 +44,50 @@ class TestUserAPI:
         assert response.json()["active_subscription"]["plan_name"] == plan.name
         assert response.json()["user_type"] == reader_user.user_type
 
+    def test_me_active_subscription_cache_invalidation(
+        self,
+        api_client,
+        reader_user,
+        reader_token,
+        plan,
+        subscription,
+        django_assert_num_queries,
+    ):
+        """Testa se a assinatura em cache acompanha mudanças na assinatura e no plano"""
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {reader_token}")
+        subscription.status = Subscription.StatusChoices.CANCELLED
+        subscription.save()
+
+        # Ausência de assinatura também fica em cache
+        assert api_client.get(ME_URL).json()["active_subscription"] is None
+        with django_assert_num_queries(0):
+            assert CustomUser(id=reader_user.id).get_active_subscription() is None
+
+        subscription.status = Subscription.StatusChoices.ACTIVE
+        subscription.save()
+        response = api_client.get(ME_URL)
+        assert response.json()["active_subscription"]["plan_name"] == plan.name
+
+        plan.name = "Plano Renomeado"
+        plan.save()
+        response = api_client.get(ME_URL)
+        assert response.json()["active_subscription"]["plan_name"] == plan.name
+
+    def test_subscription_cache_cleared_again_on_commit(
+        self, reader_user, subscription, django_capture_on_commit_callbacks
+    ):
+        """Testa se o cache é limpo de novo após o commit da transação"""
+        with django_capture_on_commit_callbacks(execute=True):
+            subscription.status = Subscription.StatusChoices.CANCELLED
+            subscription.save()
+            # Leitura concorrente antes do commit repõe o valor antigo
+            cache.set(
+                ACTIVE_SUBSCRIPTION_CACHE_KEY.format(user_id=reader_user.id),
+                subscription,
+            )
+
+        assert CustomUser(id=reader_user.id).get_active_subscription() is None
+
     def test_list_users_admin(
         self,
         api_client: APIClient,
@@ -46,6 +105,20 @@ class TestUserAPI:
             response.data["count"] >= 3
         )  # Deve encontrar pelo menos os 3 usuários criados nas fixtures
 
+    def test_search_users_admin(
+        self,
+        api_client: APIClient,
+        admin_token: str,
+        reader_user: CustomUser,
+        editor_user: CustomUser,
+    ):
+        """Admin pode buscar usuários por parte do nome de usuário ou e-mail"""
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {admin_token}")
+        response = api_client.get(f"{BASE_URL}?search=READ")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [user["id"] for user in response.data["results"]] == [reader_user.id]
+
     def test_list_users_reader_forbidden(
         self, api_client: APIClient, reader_token: str, admin_user: CustomUser
     ):
@@ -186,3 +259,292 @@ class TestUserAPI:
         assert response.status_code == status.HTTP_403_FORBIDDEN
         # Confirma que o usuário não foi excluído
         assert CustomUser.objects.filter(id=editor_user.id).exists()
+
+
+@pytest.mark.integration
+@pytest.mark.django_db
+class TestStatelessJWTAuthentication:
+    def test_user_built_from_claims(
+        self, reader_user: CustomUser, django_assert_num_queries
+    ):
+        """O usuário é montado a partir das claims, sem consultar o banco"""
+        token = CustomTokenObtainPairSerializer.get_token(reader_user).access_token
+
+        with django_assert_num_queries(0):
+            user = StatelessJWTAuthentication().get_user(token)
+            assert isinstance(user, TokenUser)
+            assert user == reader_user
+            assert user.is_reader() and not user.is_admin()
+            assert (user.username, user.email) == (
+                reader_user.username,
+                reader_user.email,
+            )
+
+        # O primeiro campo fora das claims carrega todos os demais de uma vez
+        with django_assert_num_queries(1):
+            assert user.first_name == reader_user.first_name
+            assert user.date_joined == reader_user.date_joined
+            assert user.is_active
+
+    def test_token_without_claims_loads_user(
+        self, reader_user: CustomUser, django_assert_num_queries
+    ):
+        """Tokens sem as claims continuam consultando o usuário no banco"""
+        token = AccessToken.for_user(reader_user)
+
+        with django_assert_num_queries(1):
+            user = StatelessJWTAuthentication().get_user(token)
+        assert type(user) is CustomUser
+        assert user == reader_user
+
+
+@pytest.mark.integration
+@pytest.mark.django_db(transaction=True)
+class TestTokenRevocation:
+    def login(self, api_client, username, password):
+        response = api_client.post(
+            "/api/v1/auth/token/", {"username": username, "password": password}
+        )
+        return response.json()
+
+    def test_logout_revokes_tokens(
+        self, api_client: APIClient, reader_user: CustomUser
+    ):
+        """O logout revoga o token de acesso e o de atualização"""
+        tokens = self.login(api_client, "reader", "readerpass123")
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access']}")
+        assert api_client.get(ME_URL).status_code == status.HTTP_200_OK
+
+        response = api_client.post(
+            "/api/v1/auth/logout/", {"refresh": tokens["refresh"]}
+        )
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+
+        assert api_client.get(ME_URL).status_code == status.HTTP_401_UNAUTHORIZED
+        api_client.credentials()
+        response = api_client.post(
+            "/api/v1/auth/token/refresh/", {"refresh": tokens["refresh"]}
+        )
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        response = api_client.post(
+            "/api/v1/auth/token/verify/", {"token": tokens["access"]}
+        )
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_logout_rejects_refresh_of_another_user(
+        self, api_client: APIClient, reader_user: CustomUser, editor_user: CustomUser
+    ):
+        """Não é possível revogar o token de atualização de outro usuário"""
+        editor_tokens = self.login(api_client, "editor", "editorpass123")
+        tokens = self.login(api_client, "reader", "readerpass123")
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access']}")
+
+        response = api_client.post(
+            "/api/v1/auth/logout/", {"refresh": editor_tokens["refresh"]}
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        # Nada foi revogado
+        assert api_client.get(ME_URL).status_code == status.HTTP_200_OK
+
+    def test_password_change_revokes_previous_tokens(
+        self, api_client: APIClient, reader_user: CustomUser
+    ):
+        """A troca de senha revoga todos os tokens emitidos antes dela"""
+        other_session = self.login(api_client, "reader", "readerpass123")
+        tokens = self.login(api_client, "reader", "readerpass123")
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access']}")
+
+        response = api_client.post(
+            "/api/v1/auth/change-password/",
+            {"current_password": "readerpass123", "new_password": "newpass12345"},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        new_tokens = response.json()
+
+        for access in (tokens["access"], other_session["access"]):
+            api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {access}")
+            assert api_client.get(ME_URL).status_code == status.HTTP_401_UNAUTHORIZED
+        api_client.credentials()
+        response = api_client.post(
+            "/api/v1/auth/token/refresh/", {"refresh": other_session["refresh"]}
+        )
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+        # Os novos tokens continuam válidos
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {new_tokens['access']}")
+        assert api_client.get(ME_URL).status_code == status.HTTP_200_OK
+        response = api_client.post(
+            "/api/v1/auth/token/refresh/", {"refresh": new_tokens["refresh"]}
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+    @pytest.mark.parametrize("change", ["deactivate", "user_type", "delete"])
+    def test_user_changes_revoke_tokens(
+        self, api_client: APIClient, reader_user: CustomUser, change
+    ):
+        """Desativar, excluir ou mudar o tipo do usuário revoga seus tokens"""
+        tokens = self.login(api_client, "reader", "readerpass123")
+
+        user = CustomUser.objects.get(id=reader_user.id)
+        if change == "delete":
+            user.delete()
+        else:
+            if change == "deactivate":
+                user.is_active = False
+            else:
+                user.user_type = CustomUser.EDITOR
+            user.save()
+
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access']}")
+        assert api_client.get(ME_URL).status_code == status.HTTP_401_UNAUTHORIZED
+        api_client.credentials()
+        response = api_client.post(
+            "/api/v1/auth/token/refresh/", {"refresh": tokens["refresh"]}
+        )
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_other_changes_keep_tokens(
+        self, api_client: APIClient, reader_user: CustomUser
+    ):
+        """Alterações que não constam nas claims mantêm os tokens"""
+        tokens = self.login(api_client, "reader", "readerpass123")
+
+        user = CustomUser.objects.get(id=reader_user.id)
+        user.first_name = "Outro"
+        user.save()
+
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access']}")
+        assert api_client.get(ME_URL).status_code == status.HTTP_200_OK
+
+    def test_refresh_rejected_for_inactive_user(
+        self, api_client: APIClient, reader_user: CustomUser
+    ):
+        """O refresh consulta o usuário, mesmo sem revogação (ex.: update())"""
+        tokens = self.login(api_client, "reader", "readerpass123")
+        CustomUser.objects.filter(id=reader_user.id).update(is_active=False)
+
+        response = api_client.post(
+            "/api/v1/auth/token/refresh/", {"refresh": tokens["refresh"]}
+        )
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_revocations_reach_other_processes(
+        self, reader_user: CustomUser, django_assert_num_queries
+    ):
+        """Outro processo passa a rejeitar o token após sincronizar"""
+        refresh = CustomTokenObtainPairSerializer.get_token(reader_user)
+        access = refresh.access_token
+        other_process = RevocationList()
+
+        # Tokens válidos são verificados sem consultas depois da sincronização
+        assert not other_process.is_revoked(access)
+        with django_assert_num_queries(0):
+            assert not other_process.is_revoked(access)
+
+        revoke_tokens([access])
+        other_process._checked_at = 0  # Intervalo de sincronização esgotado
+        assert other_process.is_revoked(access)
+        assert not other_process.is_revoked(refresh)
+
+    def test_prune_revoked_tokens(self, reader_user: CustomUser):
+        """Revogações expiradas são removidas"""
+        access = CustomTokenObtainPairSerializer.get_token(reader_user).access_token
+        revoke_tokens([access])
+        RevokedToken.objects.create(
+            key="jti:expired", expires_at=timezone.now() - timedelta(seconds=1)
+        )
+
+        assert prune_revoked_tokens() == 1
+        assert list(RevokedToken.objects.values_list("key", flat=True)) == [
+            f"jti:{access['jti']}"
+        ]
+
+
+@pytest.mark.integration
+@pytest.mark.django_db
+class TestLoginLimiter:
+    URL = "/api/v1/auth/token/"
+
+    @pytest.fixture(autouse=True)
+    def limits(self, settings):
+        settings.LOGIN_MAX_ATTEMPTS_PER_USERNAME = 3
+        settings.LOGIN_MAX_ATTEMPTS_PER_IP = 5
+
+    def login(self, api_client, username, password, ip="10.0.0.1"):
+        return api_client.post(
+            self.URL,
+            {"username": username, "password": password},
+            HTTP_X_FORWARDED_FOR=ip,
+        )
+
+    def test_username_locked_out_without_checking_password(
+        self, api_client: APIClient, reader_user: CustomUser, django_assert_num_queries
+    ):
+        """Após o limite, o usuário é bloqueado sem verificar a senha"""
+        for _ in range(3):
+            response = self.login(api_client, "reader", "errada")
+            assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+        # Nem a senha correta é verificada: nenhuma consulta ao usuário
+        with django_assert_num_queries(0):
+            response = self.login(api_client, "reader", "readerpass123")
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert int(response["Retry-After"]) == 60
+
+        # Outros usuários do mesmo IP continuam entrando
+        response = self.login(api_client, "other", "errada")
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_ip_locked_out_across_usernames(self, api_client: APIClient):
+        """Tentativas com vários usuários a partir do mesmo IP também bloqueiam"""
+        for index in range(5):
+            self.login(api_client, f"user{index}", "errada")
+
+        response = self.login(api_client, "another", "errada")
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        response = self.login(api_client, "another", "errada", ip="10.0.0.2")
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_non_object_bodies_are_rejected(
+        self, api_client: APIClient, reader_token: str
+    ):
+        """Corpos JSON que não são objetos retornam 400, não 500"""
+        response = api_client.post(self.URL, ["reader", "errada"], format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {reader_token}")
+        response = api_client.post(
+            "/api/v1/auth/change-password/", ["readerpass123"], format="json"
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        # Sem nova senha a senha atual continua valendo
+        response = api_client.post(
+            "/api/v1/auth/change-password/", {"current_password": "readerpass123"}
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "new_password" in response.data
+        api_client.credentials()
+        assert self.login(api_client, "reader", "readerpass123").status_code == (
+            status.HTTP_200_OK
+        )
+
+    def test_lockout_doubles(self):
+        """Cada bloqueio seguido dobra a duração do anterior"""
+        assert [
+            login_limiter.record_failure("reader", "10.0.0.1") for _ in range(5)
+        ] == [0, 0, 60, 120, 240]
+        assert 230 < login_limiter.lockout_remaining("reader", "10.0.0.1") <= 240
+        assert login_limiter.lockout_remaining("other", "10.0.0.2") == 0
+
+    def test_success_clears_username_failures(
+        self, api_client: APIClient, reader_user: CustomUser
+    ):
+        """Um login com sucesso zera as falhas do usuário"""
+        for _ in range(2):
+            self.login(api_client, "reader", "errada")
+        response = self.login(api_client, "reader", "readerpass123")
+        assert response.status_code == status.HTTP_200_OK
+
+        for _ in range(2):
+            response = self.login(api_client, "reader", "errada")
+            assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,104 @@
+import json
+import logging
+import threading
+
+import pytest
+
+from core.audit import AsyncAuditHandler, audit
+from tests.conftest import READER_PASSWORD, READER_USERNAME
+
+
+def make_handler(tmp_path, **kwargs):
+    handler = AsyncAuditHandler(tmp_path / "audit.log", **kwargs)
+    handler.setLevel(logging.INFO)
+    return handler
+
+
+def read_lines(tmp_path):
+    return [
+        json.loads(line) for line in (tmp_path / "audit.log").read_text().splitlines()
+    ]
+
+
+def test_events_must_match_their_schema(audit_records):
+    """Campos ausentes ou a mais são rejeitados"""
+    with pytest.raises(ValueError):
+        audit("login.failed", username="reader")
+    with pytest.raises(ValueError):
+        audit("login.failed", username="reader", ip="127.0.0.1", password="x")
+    with pytest.raises(KeyError):
+        audit("unknown.event")
+
+    audit("login.failed", username="reader", ip="127.0.0.1")
+    assert [record.audit for record in audit_records] == [
+        {"username": "reader", "ip": "127.0.0.1"}
+    ]
+
+
+def test_handler_writes_json_lines_in_the_background(tmp_path):
+    """Os registros são gravados como JSON pela thread do listener"""
+    handler = make_handler(tmp_path)
+    record = logging.makeLogRecord(
+        {
+            "name": "audit",
+            "levelno": logging.INFO,
+            "levelname": "INFO",
+            "msg": "login.succeeded",
+            "audit": {"username": "reader", "ip": "127.0.0.1"},
+        }
+    )
+
+    for _ in range(1000):
+        handler.handle(record)
+    handler.flush()
+
+    lines = read_lines(tmp_path)
+    assert len(lines) == 1000
+    assert lines[0]["event"] == "login.succeeded"
+    assert lines[0]["username"] == "reader"
+    assert handler._listener._thread is not threading.current_thread()
+    handler.close()
+
+
+def test_full_queue_drops_records_and_reports_them(tmp_path):
+    """Com a fila cheia, os registros são descartados e contabilizados"""
+    handler = make_handler(tmp_path, queue_size=2)
+    release = threading.Event()
+    # Segura o listener para a fila encher
+    handler.target.handle_batch = lambda records, write=handler.target.handle_batch: (
+        release.wait(),
+        write(records),
+    )
+
+    for index in range(10):
+        handler.handle(
+            logging.makeLogRecord(
+                {"levelno": logging.INFO, "msg": "logout", "audit": {"index": index}}
+            )
+        )
+    release.set()
+    handler.flush()
+    # Próximo lote traz a contagem dos descartados
+    handler.handle(logging.makeLogRecord({"levelno": logging.INFO, "msg": "logout"}))
+    handler.flush()
+    handler.close()
+
+    events = [line["event"] for line in read_lines(tmp_path)]
+    dropped = [
+        line for line in read_lines(tmp_path) if line["event"] == "audit.dropped"
+    ]
+    assert len(dropped) == 1
+    assert events.count("logout") + dropped[0]["count"] == 11
+
+
+@pytest.mark.django_db
+def test_login_is_audited(api_client, reader_user, audit_records):
+    """Logins com sucesso e falhos geram eventos de auditoria"""
+    url = "/api/v1/auth/token/"
+    api_client.post(url, {"username": READER_USERNAME, "password": READER_PASSWORD})
+    api_client.post(url, {"username": READER_USERNAME, "password": "errada"})
+
+    assert [(record.msg, record.audit["username"]) for record in audit_records] == [
+        ("login.succeeded", READER_USERNAME),
+        ("login.failed", READER_USERNAME),
+    ]
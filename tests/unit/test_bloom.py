@@ -0,0 +1,25 @@
+from core.bloom import BloomFilter
+
+
+def test_added_items_are_always_found():
+    """Um item adicionado nunca deixa de ser encontrado"""
+    bloom = BloomFilter(capacity=1000)
+    items = [f"jti:{index}" for index in range(1000)]
+    for item in items:
+        bloom.add(item)
+
+    assert all(item in bloom for item in items)
+    assert len(bloom) == 1000
+    assert not bloom.is_full
+    bloom.add("jti:extra")
+    assert bloom.is_full
+
+
+def test_false_positive_rate_within_bounds():
+    """A taxa de falsos positivos fica próxima da configurada"""
+    bloom = BloomFilter(capacity=10_000, error_rate=0.01)
+    for index in range(10_000):
+        bloom.add(f"revoked:{index}")
+
+    false_positives = sum(f"valid:{index}" in bloom for index in range(10_000))
+    assert false_positives < 10_000 * 0.02
@@ -0,0 +1,108 @@
+from pathlib import Path
+
+import pytest
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.cache.backends.filebased import FileBasedCache
+
+from core.cache import TieredCache, _LocalStore
+
+
+def make_worker(**options):
+    """Simula outro processo: mesmo L2, mas com L1 próprio"""
+    worker = TieredCache("shared", {"OPTIONS": {"SYNC_INTERVAL": 0, **options}})
+    worker._store = _LocalStore()
+    return worker
+
+
+@pytest.fixture
+def workers():
+    return make_worker(), make_worker()
+
+
+def test_get_is_served_by_l1_after_first_read(workers):
+    """Testa se a segunda leitura da mesma chave não vai ao cache compartilhado"""
+    first, _ = workers
+    first.set("entitlements:user_1", frozenset({"poder"}))
+
+    assert first.get("entitlements:user_1") == frozenset({"poder"})
+    first.shared.delete("entitlements:user_1")
+    assert first.get("entitlements:user_1") == frozenset({"poder"})
+    assert first.stats()["namespaces"]["entitlements"]["l1_hits"] == 2
+
+
+def test_values_are_shared_between_workers(workers):
+    """Testa se um valor gravado por um processo é lido pelo outro via L2"""
+    first, second = workers
+    first.set("subscriptions:user_1_active", "assinatura")
+
+    assert second.get("subscriptions:user_1_active") == "assinatura"
+    assert second.stats()["namespaces"]["subscriptions"]["l2_hits"] == 1
+
+
+def test_delete_invalidates_other_workers_l1(workers):
+    """Testa se a remoção em um processo invalida o L1 dos demais"""
+    first, second = workers
+    first.set("entitlements:user_1", frozenset({"poder"}))
+    assert second.get("entitlements:user_1") == frozenset({"poder"})
+
+    first.delete_many(["entitlements:user_1"])
+
+    assert second.get("entitlements:user_1") is None
+    assert second.stats()["namespaces"]["entitlements"]["misses"] == 1
+
+
+def test_delete_keeps_other_namespaces_in_l1(workers):
+    """Testa se a invalidação de um namespace não afeta os outros"""
+    first, second = workers
+    first.set("entitlements:user_1", frozenset())
+    first.set("subscriptions:user_1_active", "assinatura")
+    second.get("subscriptions:user_1_active")
+
+    first.delete("entitlements:user_1")
+    second.shared.delete("subscriptions:user_1_active")
+
+    assert second.get("subscriptions:user_1_active") == "assinatura"
+
+
+def test_l1_is_bounded():
+    """Testa se o L1 descarta as chaves menos usadas ao atingir o limite"""
+    worker = make_worker(L1_MAX_ENTRIES=2)
+    for index in range(3):
+        worker.set(f"news:{index}", index)
+
+    assert worker.stats()["l1_entries"] == 2
+    assert worker.get("news:0") == 0
+    assert worker.stats()["namespaces"]["news"] == {
+        "l2_hits": 1,
+        "hit_ratio": 1.0,
+    }
+
+
+def test_default_cache_is_tiered():
+    """Testa se o cache padrão da aplicação é o cache em dois níveis"""
+    assert isinstance(caches["default"], TieredCache)
+
+
+def test_file_cache_is_outside_the_source_tree():
+    """Testa se limpar o cache em arquivo dos testes não apaga nada do repositório"""
+    shared = caches["shared"]
+    if not isinstance(shared, FileBasedCache):
+        pytest.skip("cache compartilhado não é em arquivo")
+    assert not Path(shared._dir).is_relative_to(settings.BASE_DIR)
+
+
+@pytest.mark.django_db
+def test_cache_stats_endpoint(api_client, admin_token, reader_token):
+    """Testa se as métricas do cache são expostas apenas para administradores"""
+    url = "/api/v1/cache/stats/"
+    cache.get("entitlements:user_1")
+
+    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {reader_token}")
+    assert api_client.get(url).status_code == 403
+
+    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {admin_token}")
+    response = api_client.get(url)
+    assert response.status_code == 200
+    assert "pid" in response.data
+    assert "entitlements" in response.data["namespaces"]
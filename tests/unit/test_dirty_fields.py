@@ -0,0 +1,136 @@
+import re
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from news.models import News
+from plans.models import Plan, Subscription
+from tests.conftest import READER_PASSWORD
+from users.models import CustomUser
+
+
+def updated_columns(queries, table):
+    """Colunas do SET de cada UPDATE emitido para a tabela"""
+    columns = []
+    for query in queries:
+        sql = query["sql"]
+        if sql.startswith(f'UPDATE "{table}"'):
+            set_clause = sql.split(" SET ", 1)[1].split(" WHERE ", 1)[0]
+            columns.append(set(re.findall(r'"(\w+)" =', set_clause)))
+    return columns
+
+
+@pytest.mark.django_db
+def test_publish_writes_only_changed_columns(
+    api_client, editor_token, unpublished_news
+):
+    """Testa se publicar não regrava o conteúdo da notícia"""
+    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {editor_token}")
+
+    with CaptureQueriesContext(connection) as context:
+        response = api_client.post(
+            f"/api/v1/news/articles/{unpublished_news.id}/publish/"
+        )
+
+    assert response.status_code == 200
+    assert updated_columns(context.captured_queries, "news_news") == [
+        {"status", "publication_date", "updated_at"}
+    ]
+
+
+@pytest.mark.django_db
+def test_serializer_update_writes_only_changed_columns(
+    api_client, editor_token, published_news
+):
+    """Testa se o PATCH grava apenas os campos alterados"""
+    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {editor_token}")
+
+    with CaptureQueriesContext(connection) as context:
+        response = api_client.patch(
+            f"/api/v1/news/articles/{published_news.id}/",
+            {"title": "Novo título", "content": published_news.content},
+            format="json",
+        )
+
+    assert response.status_code == 200
+    assert updated_columns(context.captured_queries, "news_news") == [
+        {"title", "updated_at"}
+    ]
+
+
+@pytest.mark.django_db
+def test_password_change_writes_only_password(api_client, reader_token):
+    """Testa se a troca de senha grava apenas a coluna password"""
+    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {reader_token}")
+
+    with CaptureQueriesContext(connection) as context:
+        response = api_client.post(
+            "/api/v1/auth/change-password/",
+            {"current_password": READER_PASSWORD, "new_password": "novasenha123"},
+        )
+
+    assert response.status_code == 200
+    # E depois a versão dos tokens, que revoga os emitidos antes da troca
+    assert updated_columns(context.captured_queries, "users_customuser") == [
+        {"password"},
+        {"token_version"},
+    ]
+
+
+@pytest.mark.django_db
+def test_subscription_and_plan_write_only_changed_columns(subscription):
+    """Testa o rastreamento de campos alterados em Subscription e Plan"""
+    subscription = Subscription.objects.get(id=subscription.id)
+    plan = Plan.objects.get(id=subscription.plan_id)
+
+    with CaptureQueriesContext(connection) as context:
+        subscription.status = Subscription.StatusChoices.CANCELLED
+        subscription.save()
+        plan.price = 150
+        plan.save()
+        # Sem alterações: apenas os campos auto_now
+        subscription.save()
+
+    assert updated_columns(context.captured_queries, "plans_subscription") == [
+        {"status", "updated_at"},
+        {"updated_at"},
+    ]
+    assert updated_columns(context.captured_queries, "plans_plan") == [{"price"}]
+
+
+@pytest.mark.django_db
+def test_in_place_json_change_is_written(published_news):
+    """Testa se alterar um JSONField no próprio dicionário é detectado e gravado"""
+    news = News.objects.get(id=published_news.id)
+    news.image_renditions["thumbnail"] = {"url": "news/thumb.jpg"}
+
+    assert news.get_dirty_fields() == ["image_renditions"]
+    with CaptureQueriesContext(connection) as context:
+        news.save()
+
+    assert updated_columns(context.captured_queries, "news_news") == [
+        {"image_renditions", "updated_at"}
+    ]
+    assert News.objects.get(id=news.id).image_renditions == {
+        "thumbnail": {"url": "news/thumb.jpg"}
+    }
+    assert news.get_dirty_fields() == []
+
+
+@pytest.mark.django_db
+def test_new_and_deferred_instances_are_saved_normally(editor_user):
+    """Testa se instâncias novas e campos adiados continuam sendo gravados"""
+    news = News.objects.create(
+        title="Nova", content="Conteúdo", author=editor_user, status="draft"
+    )
+    news = News.objects.defer("content").get(id=news.id)
+    news.content = "Conteúdo alterado"
+    news.save()
+    assert News.objects.get(id=news.id).content == "Conteúdo alterado"
+
+    user = CustomUser.objects.get(id=editor_user.id)
+    user.last_login = timezone.now()
+    user.save()
+    assert CustomUser.objects.get(id=editor_user.id).last_login is not None
@@ -0,0 +1,62 @@
+import pytest
+from django.test import RequestFactory
+from rest_framework.request import Request
+
+from core import policies
+from news.models import News
+
+
+def make_request(user):
+    request = Request(RequestFactory().get("/"))
+    request.user = user
+    return request
+
+
+@pytest.mark.django_db
+def test_news_rules_compare_author_ids(
+    editor_user, reader_user, unpublished_news, django_assert_num_queries
+):
+    """Testa se as regras comparam o id do autor, sem buscar o autor no banco"""
+    news = News.objects.get(id=unpublished_news.id)
+
+    with django_assert_num_queries(0):
+        assert policies.can_edit_news(editor_user, news)
+        assert policies.can_view_news(editor_user, news)
+        assert not policies.can_edit_news(reader_user, news)
+        assert not policies.can_view_news(reader_user, news)
+    assert "author" not in news._state.fields_cache
+
+
+@pytest.mark.django_db
+def test_decisions_are_memoized_per_request(editor_user, unpublished_news):
+    """Testa se cada decisão é avaliada uma vez por requisição"""
+    calls = []
+
+    def rule(user, obj):
+        calls.append(obj.pk)
+        return True
+
+    request = make_request(editor_user)
+    assert policies.is_allowed(request, rule, unpublished_news)
+    assert policies.is_allowed(request, rule, unpublished_news)
+    assert calls == [unpublished_news.pk]
+
+    # Outra requisição decide de novo
+    policies.is_allowed(make_request(editor_user), rule, unpublished_news)
+    assert len(calls) == 2
+
+
+@pytest.mark.django_db
+def test_allowed_ids(admin_user, editor_user, published_news, unpublished_news):
+    """Testa a avaliação de uma lista de notícias de uma vez"""
+    others = News.objects.create(
+        title="De outro autor", content="Conteúdo", author=admin_user
+    )
+    articles = [published_news, unpublished_news, others]
+
+    assert policies.allowed_ids(
+        make_request(editor_user), policies.can_publish_news, articles
+    ) == {published_news.id, unpublished_news.id}
+    assert policies.allowed_ids(
+        make_request(admin_user), policies.can_publish_news, articles
+    ) == {news.id for news in articles}
@@ -0,0 +1,33 @@
+from django.contrib import admin
+
+from uploads.models import Upload
+
+
+@admin.register(Upload)
+class UploadAdmin(admin.ModelAdmin):
+    list_display = [
+        "id",
+        "original_name",
+        "owner",
+        "content_type",
+        "object_id",
+        "status",
+        "attempts",
+        "created_at",
+        "finished_at",
+    ]
+    list_filter = ["status", "content_type", "field_name"]
+    search_fields = ["original_name", "checksum", "owner__username"]
+    list_select_related = ["owner", "content_type"]
+    raw_id_fields = ["owner"]
+    readonly_fields = [
+        "checksum",
+        "result",
+        "width",
+        "height",
+        "attempts",
+        "created_at",
+        "started_at",
+        "finished_at",
+    ]
+    ordering = ["-created_at"]
@@ -0,0 +1,26 @@
+from rest_framework import status
+from rest_framework.response import Response
+
+from uploads.processing import enqueue_upload
+
+from .serializers import ImageUploadSerializer, UploadSerializer
+
+
+class ImageUploadViewMixin:
+    """
+    Viewset mixin for actions that receive an image for one of the object's
+    image fields.
+
+    The file is only stored and queued: the response is ``202 Accepted``
+    with the upload, whose ``status`` the client polls on the uploads
+    endpoint until the worker has processed and assigned the image.
+    """
+
+    def accept_image_upload(self, request, instance, field_name):
+        upload = ImageUploadSerializer(data=request.data)
+        upload.is_valid(raise_exception=True)
+        queued = enqueue_upload(
+            instance, field_name, upload.validated_data["file"], request.user
+        )
+        serializer = UploadSerializer(queued, context={"request": request})
+        return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
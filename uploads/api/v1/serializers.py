@@ -0,0 +1,63 @@
+import os
+
+from django.conf import settings
+from rest_framework import serializers
+
+from uploads.models import Upload
+
+# Cheap checks made in the request; the content is validated by the worker
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".webp", ".gif")
+
+
+class ImageUploadSerializer(serializers.Serializer):
+    """Image sent to an image field, to be processed by the upload worker"""
+
+    file = serializers.FileField()
+
+    def validate_file(self, value):
+        if value.size > settings.UPLOAD_MAX_SIZE:
+            raise serializers.ValidationError(
+                f"The file is larger than {settings.UPLOAD_MAX_SIZE} bytes."
+            )
+        extension = os.path.splitext(value.name)[1].lower()
+        if extension not in IMAGE_EXTENSIONS:
+            raise serializers.ValidationError(
+                f"Unsupported file extension. Use one of: {', '.join(IMAGE_EXTENSIONS)}."
+            )
+        return value
+
+
+class UploadSerializer(serializers.ModelSerializer):
+    """Processing status of an upload"""
+
+    status_display = serializers.ReadOnlyField(source="get_status_display")
+    target_type = serializers.ReadOnlyField(source="content_type.model")
+    image = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Upload
+        fields = [
+            "id",
+            "status",
+            "status_display",
+            "error",
+            "target_type",
+            "object_id",
+            "field_name",
+            "original_name",
+            "size",
+            "image",
+            "width",
+            "height",
+            "created_at",
+            "finished_at",
+        ]
+        read_only_fields = fields
+
+    def get_image(self, obj) -> str | None:
+        """URL of the processed image, once done"""
+        if not obj.result:
+            return None
+        url = obj.file.storage.url(obj.result)
+        request = self.context.get("request")
+        return request.build_absolute_uri(url) if request is not None else url
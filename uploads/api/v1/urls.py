@@ -0,0 +1,13 @@
+from django.urls import include, path
+from rest_framework.routers import DefaultRouter
+
+from .views import UploadViewSet
+
+app_name = "api-v1"
+
+router = DefaultRouter()
+router.register(r"", UploadViewSet)
+
+urlpatterns = [
+    path("", include(router.urls)),
+]
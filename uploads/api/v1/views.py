@@ -0,0 +1,42 @@
+from drf_spectacular.utils import extend_schema, extend_schema_view
+from rest_framework import viewsets
+from rest_framework.permissions import IsAuthenticated
+
+from uploads.models import Upload
+
+from .serializers import UploadSerializer
+
+
+@extend_schema_view(
+    list=extend_schema(
+        tags=["Uploads"],
+        summary="Listar envios de imagem",
+        description=(
+            "Retorna os envios de imagem do usuário atual, do mais recente ao mais antigo. "
+            "Administradores veem os envios de todos os usuários."
+        ),
+    ),
+    retrieve=extend_schema(
+        tags=["Uploads"],
+        summary="Obter status do envio",
+        description=(
+            "Retorna o status do processamento de uma imagem enviada: `pending`, "
+            "`processing`, `done` (a imagem já foi atribuída e `image` traz a sua URL) "
+            "ou `failed` (o motivo está em `error`). Consulte este endpoint até que o "
+            "envio termine."
+        ),
+    ),
+)
+class UploadViewSet(viewsets.ReadOnlyModelViewSet):
+    """API endpoint para acompanhar o processamento de imagens enviadas"""
+
+    queryset = Upload.objects.select_related("content_type")
+    serializer_class = UploadSerializer
+    permission_classes = [IsAuthenticated]
+    filterset_fields = ["status"]
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if not self.request.user.is_admin():
+            queryset = queryset.filter(owner=self.request.user)
+        return queryset
@@ -0,0 +1,44 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from uploads.processing import DEFAULT_BATCH_SIZE, process_pending_uploads
+
+
+class Command(BaseCommand):
+    help = (
+        "Processa as imagens enviadas que aguardam na fila: validação, remoção dos "
+        "metadados EXIF, redimensionamento e atribuição ao campo de destino. "
+        "Pode rodar em vários nós ao mesmo tempo."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help="Uploads claimed per transaction.",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep running, checking the queue every --interval seconds.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=2,
+            help="Seconds between checks in --loop mode.",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            processed = process_pending_uploads(batch_size=options["batch_size"])
+            if processed or not options["loop"]:
+                self.stdout.write(f"Processed {processed} uploads")
+            if not options["loop"]:
+                return
+            try:
+                time.sleep(options["interval"])
+            except KeyboardInterrupt:
+                return
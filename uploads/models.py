@@ -0,0 +1,84 @@
+from django.conf import settings
+from django.contrib.contenttypes.fields import GenericForeignKey
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class Upload(models.Model):
+    """
+    An image received by the API and waiting to be processed into a model's
+    image field (``News.image``, ``CustomUser.profile_picture``).
+
+    The request only streams the file to storage and creates the row; the
+    upload worker (``manage.py process_uploads``) validates it, strips its
+    metadata, resizes it and assigns it to ``field_name`` of the target.
+    Clients poll ``status`` until it is ``done`` or ``failed``.
+    """
+
+    class StatusChoices(models.TextChoices):
+        PENDING = "pending", _("Pending")
+        PROCESSING = "processing", _("Processing")
+        DONE = "done", _("Done")
+        FAILED = "failed", _("Failed")
+
+    owner = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="uploads",
+        verbose_name=_("Owner"),
+    )
+    content_type = models.ForeignKey(
+        ContentType, on_delete=models.CASCADE, verbose_name=_("Content Type")
+    )
+    object_id = models.PositiveBigIntegerField(_("Object ID"))
+    target = GenericForeignKey("content_type", "object_id")
+    field_name = models.CharField(_("Field Name"), max_length=100)
+
+    file = models.FileField(
+        _("Received File"), upload_to="uploads/pending/%Y/%m/%d/", blank=True
+    )
+    original_name = models.CharField(_("Original Name"), max_length=255)
+    size = models.PositiveBigIntegerField(_("Size"))
+    status = models.CharField(
+        _("Status"),
+        max_length=10,
+        choices=StatusChoices.choices,
+        default=StatusChoices.PENDING,
+    )
+    error = models.TextField(_("Error"), blank=True)
+    attempts = models.PositiveSmallIntegerField(_("Attempts"), default=0)
+    # SHA-256 of the received bytes, used to skip processing duplicates
+    checksum = models.CharField(_("Checksum"), max_length=64, blank=True)
+    result = models.CharField(_("Processed Image"), max_length=255, blank=True)
+    width = models.PositiveIntegerField(_("Width"), null=True, blank=True)
+    height = models.PositiveIntegerField(_("Height"), null=True, blank=True)
+
+    created_at = models.DateTimeField(_("Created At"), auto_now_add=True)
+    started_at = models.DateTimeField(_("Started At"), null=True, blank=True)
+    finished_at = models.DateTimeField(_("Finished At"), null=True, blank=True)
+
+    class Meta:
+        verbose_name = _("Upload")
+        verbose_name_plural = _("Uploads")
+        ordering = ["-created_at"]
+        indexes = [
+            # The worker's queue: only unfinished uploads are indexed
+            models.Index(
+                fields=["created_at"],
+                name="upload_queue_idx",
+                condition=models.Q(status__in=["pending", "processing"]),
+            ),
+            models.Index(
+                fields=["checksum", "content_type", "field_name"],
+                name="upload_checksum_idx",
+                condition=models.Q(status="done"),
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.original_name} ({self.get_status_display()})"
+
+    @property
+    def is_finished(self):
+        return self.status in (self.StatusChoices.DONE, self.StatusChoices.FAILED)
@@ -0,0 +1,213 @@
+"""
+Image upload queue.
+
+``enqueue_upload`` is all an upload request does: the received file is
+streamed to storage as is and an ``Upload`` row is created, so the request
+returns without decoding the image. ``process_pending_uploads``, run by
+``manage.py process_uploads``, works through the queue in the database:
+
+- each batch is claimed with ``SELECT ... FOR UPDATE SKIP LOCKED``, so
+  several workers can run at the same time, and uploads left ``processing``
+  by a worker that died are claimed again after ``UPLOAD_PROCESSING_TIMEOUT``
+  (at most ``UPLOAD_MAX_ATTEMPTS`` times);
+- the received bytes are hashed and, when the same file was already
+  processed for the same field, its result is reused without decoding it;
+- otherwise the image is validated, stripped of its metadata, rotated
+  according to its EXIF orientation and downscaled (``sanitize_image``);
+- the result is assigned to the target field, unless a newer upload for
+  that field already finished, and the received file is removed.
+"""
+
+import hashlib
+import logging
+from datetime import timedelta
+from functools import partial
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from core.images import InvalidImage, sanitize_image
+from uploads.models import Upload
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 10
+
+
+def enqueue_upload(instance, field_name, file, owner):
+    """Store ``file`` for ``instance.<field_name>`` and queue its processing"""
+    return Upload.objects.create(
+        owner=owner,
+        content_type=ContentType.objects.get_for_model(instance),
+        object_id=instance.pk,
+        field_name=field_name,
+        file=file,
+        original_name=file.name[:255],
+        size=file.size,
+    )
+
+
+def claim_uploads(batch_size=DEFAULT_BATCH_SIZE, now=None):
+    """Mark up to ``batch_size`` queued uploads as processing and return them"""
+    now = now or timezone.now()
+    stale = Q(
+        status=Upload.StatusChoices.PROCESSING,
+        started_at__lt=now - timedelta(seconds=settings.UPLOAD_PROCESSING_TIMEOUT),
+    )
+    with transaction.atomic():
+        abandoned = Upload.objects.select_for_update(skip_locked=True).filter(
+            stale, attempts__gte=settings.UPLOAD_MAX_ATTEMPTS
+        )
+        for upload in abandoned:
+            _finish(
+                upload,
+                Upload.StatusChoices.FAILED,
+                error="Processing did not finish after several attempts.",
+            )
+
+        upload_ids = list(
+            Upload.objects.select_for_update(skip_locked=True)
+            .filter(
+                Q(status=Upload.StatusChoices.PENDING)
+                | (stale & Q(attempts__lt=settings.UPLOAD_MAX_ATTEMPTS))
+            )
+            .order_by("created_at")
+            .values_list("id", flat=True)[:batch_size]
+        )
+        Upload.objects.filter(id__in=upload_ids).update(
+            status=Upload.StatusChoices.PROCESSING,
+            started_at=now,
+            attempts=F("attempts") + 1,
+        )
+    return list(
+        Upload.objects.select_related("content_type")
+        .filter(id__in=upload_ids)
+        .order_by("created_at")
+    )
+
+
+def _checksum(field_file):
+    digest = hashlib.sha256()
+    with field_file.open("rb") as source:
+        for chunk in source.chunks():
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _finish(upload, status, **fields):
+    """Record the outcome of ``upload`` and drop the received file"""
+    received = upload.file.name
+    if received:
+        # Removed once the outcome is committed
+        transaction.on_commit(partial(upload.file.storage.delete, received))
+    upload.status = status
+    upload.file = ""
+    upload.finished_at = timezone.now()
+    for name, value in fields.items():
+        setattr(upload, name, value)
+    upload.save()
+
+
+def _process(upload, target, field):
+    """Checksum of the received file, and the stored processed image"""
+    checksum = _checksum(upload.file)
+    duplicate = (
+        Upload.objects.filter(
+            status=Upload.StatusChoices.DONE,
+            checksum=checksum,
+            content_type_id=upload.content_type_id,
+            field_name=upload.field_name,
+        )
+        .exclude(result="")
+        .order_by("-finished_at")
+        .first()
+    )
+    if duplicate is not None and field.storage.exists(duplicate.result):
+        return checksum, duplicate.result, duplicate.width, duplicate.height
+
+    with upload.file.open("rb") as source:
+        content, extension, width, height = sanitize_image(
+            source,
+            settings.UPLOAD_IMAGE_MAX_SIZE,
+            settings.UPLOAD_IMAGE_MAX_PIXELS,
+            settings.UPLOAD_IMAGE_FORMATS,
+        )
+    name = field.generate_filename(target, f"{checksum[:32]}.{extension}")
+    return checksum, field.storage.save(name, content), width, height
+
+
+def process_upload(upload):
+    """Process a claimed upload and assign the result to its target"""
+    model = upload.content_type.model_class()
+    field = model._meta.get_field(upload.field_name)
+    target = model.objects.filter(pk=upload.object_id).first()
+    if target is None:
+        _finish(
+            upload,
+            Upload.StatusChoices.FAILED,
+            error="The object this image was sent to no longer exists.",
+        )
+        return upload
+
+    try:
+        checksum, result, width, height = _process(upload, target, field)
+    except InvalidImage as exc:
+        _finish(upload, Upload.StatusChoices.FAILED, error=str(exc))
+        logger.info("Upload rejected: ID=%s, Reason=%s", upload.id, exc)
+        return upload
+    except Exception:
+        logger.exception("Upload processing failed: ID=%s", upload.id)
+        _finish(
+            upload,
+            Upload.StatusChoices.FAILED,
+            error="The image could not be processed.",
+        )
+        return upload
+
+    with transaction.atomic():
+        target = model.objects.select_for_update().filter(pk=upload.object_id).first()
+        if target is None:
+            _finish(
+                upload,
+                Upload.StatusChoices.FAILED,
+                error="The object this image was sent to no longer exists.",
+            )
+            return upload
+
+        # Uploads finish out of order: an older one must not win
+        superseded = Upload.objects.filter(
+            content_type_id=upload.content_type_id,
+            object_id=upload.object_id,
+            field_name=upload.field_name,
+            status=Upload.StatusChoices.DONE,
+            created_at__gt=upload.created_at,
+        ).exists()
+        if not superseded:
+            setattr(target, upload.field_name, result)
+            target.save()
+
+        _finish(
+            upload,
+            Upload.StatusChoices.DONE,
+            checksum=checksum,
+            result=result,
+            width=width,
+            height=height,
+        )
+    logger.info("Upload processed: ID=%s, Image=%s", upload.id, result)
+    return upload
+
+
+def process_pending_uploads(batch_size=DEFAULT_BATCH_SIZE, now=None):
+    """Process every queued upload, one claimed batch at a time"""
+    processed = 0
+    while uploads := claim_uploads(batch_size, now):
+        for upload in uploads:
+            process_upload(upload)
+        processed += len(uploads)
+        if len(uploads) < batch_size:
+            break
+    return processed
@@ -0,0 +1,8 @@
+from django.urls import include, path
+
+app_name = "uploads"
+
+urlpatterns = [
+    # API v1 endpoints
+    path("api/v1/uploads/", include("uploads.api.v1.urls")),
+]
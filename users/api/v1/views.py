@@ -5,7 +5,11 @@ from rest_framework.decorators import action
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 
-from .permissions import IsAdminOrSelf, IsAdminUser
+from core.filters import TrigramSearchFilter
+from core.permissions import IsAdminOrSelf, IsAdminUser
+from uploads.api.v1.mixins import ImageUploadViewMixin
+from uploads.api.v1.serializers import ImageUploadSerializer, UploadSerializer
+
 from .serializers import UserCreateSerializer, UserDetailSerializer, UserSerializer
 
 User = get_user_model()
@@ -43,12 +47,13 @@ User = get_user_model()
         description="Exclui um usuário. Disponível apenas para administradores.",
     ),
 )
-class UserViewSet(viewsets.ModelViewSet):
+class UserViewSet(ImageUploadViewMixin, viewsets.ModelViewSet):
     """API endpoint para gerenciamento de usuários"""
 
     queryset = User.objects.all()
     serializer_class = UserSerializer
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
+    # Trigram search last, so results can be sorted by similarity
+    filter_backends = [filters.OrderingFilter, TrigramSearchFilter]
     search_fields = ["username", "email", "first_name", "last_name"]
     ordering_fields = ["username", "date_joined"]
     ordering = ["-date_joined"]
@@ -74,7 +79,12 @@ class UserViewSet(viewsets.ModelViewSet):
         elif self.action in ["create_admin", "create_editor"]:
             # Apenas admin pode criar admin ou editor
             permission_classes = [IsAdminUser]
-        elif self.action in ["retrieve", "update", "partial_update"]:
+        elif self.action in [
+            "retrieve",
+            "update",
+            "partial_update",
+            "profile_picture",
+        ]:
             permission_classes = [IsAdminOrSelf]
         elif self.action == "destroy":
             permission_classes = [IsAdminUser]
@@ -148,3 +158,21 @@ class UserViewSet(viewsets.ModelViewSet):
         """Get current user information"""
         serializer = self.get_serializer(request.user)
         return Response(serializer.data)
+
+    @extend_schema(
+        tags=["Users"],
+        summary="Enviar foto de perfil",
+        description=(
+            "Recebe a foto de perfil (multipart, campo `file`) e responde imediatamente com "
+            "`202 Accepted`. A imagem é validada, tem os metadados EXIF removidos e é "
+            "redimensionada em segundo plano pelo comando `process_uploads`; acompanhe o "
+            "`status` do envio em `/api/uploads/api/v1/uploads/{id}/`."
+        ),
+        request={"multipart/form-data": ImageUploadSerializer},
+        responses={202: UploadSerializer},
+    )
+    @action(detail=True, methods=["post"], url_path="profile-picture")
+    def profile_picture(self, request, pk=None):
+        """Queue a new profile picture"""
+        user = self.get_object()
+        return self.accept_image_upload(request, user, "profile_picture")
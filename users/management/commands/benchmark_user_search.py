@@ -0,0 +1,108 @@
+import random
+import string
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test import RequestFactory
+from rest_framework import filters
+from rest_framework.request import Request
+
+from core.filters import TrigramSearchFilter
+from users.api.v1.views import UserViewSet
+from users.models import CustomUser
+
+BATCH_SIZE = 10_000
+FIRST_NAMES = ["Ana", "Bruno", "Carla", "Daniel", "Eduarda", "Felipe", "Gabriela"]
+LAST_NAMES = ["Silva", "Santos", "Oliveira", "Souza", "Pereira", "Costa", "Almeida"]
+
+
+class Command(BaseCommand):
+    help = (
+        "Compara a busca de usuários por ILIKE (SearchFilter) com a busca "
+        "por trigramas (TrigramSearchFilter) sobre uma base sintética."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--users",
+            type=int,
+            default=1_000_000,
+            help="Number of synthetic users to insert. Everything is rolled back.",
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=5, help="Runs per search term."
+        )
+        parser.add_argument(
+            "terms",
+            nargs="*",
+            default=["silva", "gabriela san", "olivera", "user_4242"],
+            help="Search terms to benchmark.",
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            self.stdout.write(
+                self.style.WARNING(
+                    "Trigram search is Postgres only, both backends will use ILIKE."
+                )
+            )
+
+        with transaction.atomic():
+            self._seed(options["users"])
+            with connection.cursor() as cursor:
+                cursor.execute(f"ANALYZE {CustomUser._meta.db_table}")
+
+            for term in options["terms"]:
+                self.stdout.write(self.style.MIGRATE_HEADING(f"search={term!r}"))
+                for backend in (filters.SearchFilter, TrigramSearchFilter):
+                    self._benchmark(backend, term, options["repeat"])
+
+            transaction.set_rollback(True)
+
+    def _benchmark(self, backend, term, repeat):
+        queryset = self._search_queryset(backend, term)[:10]
+
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            results = list(queryset.values_list("username", flat=True))
+            timings.append((time.perf_counter() - start) * 1000)
+
+        plan = queryset.explain()
+        used = [index.name for index in CustomUser._meta.indexes if index.name in plan]
+        self.stdout.write(
+            f"  {backend.__name__:<20} best {min(timings):8.1f} ms  "
+            f"median {sorted(timings)[len(timings) // 2]:8.1f} ms  "
+            f"indexes: {', '.join(used) or '-'}"
+        )
+        self.stdout.write(f"    top results: {', '.join(results[:3])}")
+
+    def _search_queryset(self, backend, term):
+        """Build the list queryset as ``UserViewSet`` does with ``backend``"""
+        request = Request(RequestFactory().get("/", {"search": term}))
+        view = UserViewSet(request=request, action="list", format_kwarg=None)
+        queryset = filters.OrderingFilter().filter_queryset(
+            request, view.get_queryset(), view
+        )
+        return backend().filter_queryset(request, queryset, view)
+
+    def _seed(self, total):
+        created = 0
+        while created < total:
+            batch = []
+            for index in range(created, min(created + BATCH_SIZE, total)):
+                suffix = "".join(random.choices(string.ascii_lowercase, k=4))
+                batch.append(
+                    CustomUser(
+                        username=f"user_{index}_{suffix}",
+                        email=f"user_{index}_{suffix}@example.com",
+                        first_name=random.choice(FIRST_NAMES),
+                        last_name=random.choice(LAST_NAMES),
+                        # Hashing a million passwords would dominate the run
+                        password="!",
+                    )
+                )
+            CustomUser.objects.bulk_create(batch)
+            created += len(batch)
+        self.stdout.write(f"Inserted {created} synthetic users")
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.10 on 2026-10-17 04:45
+
+from django.db import migrations, models
+
+from core.migration_operations import AddFieldBesidePostgresIndexes
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("users", "0003_trigram_search_indexes"),
+    ]
+
+    operations = [
+        AddFieldBesidePostgresIndexes(
+            model_name="customuser",
+            name="token_version",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Token Version"
+            ),
+        ),
+    ]
@@ -1,11 +1,25 @@
+from itertools import islice
+
 from django.contrib.auth.models import AbstractUser, UserManager
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models.functions import Upper
 from django.utils import timezone
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
+from core.models import DirtyFieldsMixin
+
 # Constantes
 ONE_HOUR_IN_SECONDS = 60 * 60  # 3600 seconds = 1 hour
+ONE_DAY_IN_SECONDS = 24 * ONE_HOUR_IN_SECONDS
+# Users whose cached subscription data is dropped per cache round trip
+CACHE_INVALIDATION_BATCH_SIZE = 1000
+# Cache keys are "<namespace>:<key>"; see core.cache.TieredCache
+ACTIVE_SUBSCRIPTION_CACHE_KEY = "subscriptions:user_{user_id}_active"
+ACCESSIBLE_VERTICALS_CACHE_KEY = "entitlements:user_{user_id}"
+_MISSING = object()
 
 
 class CustomUserManager(UserManager):
@@ -21,7 +35,7 @@ class CustomUserManager(UserManager):
 
 
 # Create your models here.
-class CustomUser(AbstractUser):
+class CustomUser(DirtyFieldsMixin, AbstractUser):
     # User types
     ADMIN = "admin"
     EDITOR = "editor"
@@ -48,9 +62,34 @@ class CustomUser(AbstractUser):
         _("Profile Picture"), upload_to="profiles/%Y/%m/", blank=True, null=True
     )
 
+    # Claim of every token issued to the user; bumping it revokes them all
+    token_version = models.PositiveIntegerField(
+        _("Token Version"), default=0, editable=False
+    )
+
     # Substitui o manager padrão pelo customizado
     objects = CustomUserManager()
 
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # Trigram indexes for the admin type-ahead search (Postgres only)
+            GinIndex(
+                OpClass(Upper("username"), name="gin_trgm_ops"),
+                name="user_username_trgm_idx",
+            ),
+            GinIndex(
+                OpClass(Upper("email"), name="gin_trgm_ops"), name="user_email_trgm_idx"
+            ),
+            GinIndex(
+                OpClass(Upper("first_name"), name="gin_trgm_ops"),
+                name="user_first_name_trgm_idx",
+            ),
+            GinIndex(
+                OpClass(Upper("last_name"), name="gin_trgm_ops"),
+                name="user_last_name_trgm_idx",
+            ),
+        ]
+
     # Helper methods to check user type
     def is_admin(self):
         return self.user_type == self.ADMIN
@@ -68,41 +107,104 @@ class CustomUser(AbstractUser):
             raise ValidationError({"email": _("Email is required")})
 
     def get_active_subscription(self):
-        """Returns the user's active subscription if any"""
-        # Add caching to improve performance
-        from django.core.cache import cache
+        """
+        Returns the user's active subscription if any.
 
-        cache_key = f"user_{self.id}_active_subscription"
-        cached_sub = cache.get(cache_key)
+        The result (``None`` included) is cached with its plan for a day, or
+        until the subscription ends if that comes first. The plans signals
+        clear it whenever one of the user's subscriptions or its plan changes.
+        """
+        from django.core.cache import cache
 
-        if cached_sub is not None:
+        cache_key = ACTIVE_SUBSCRIPTION_CACHE_KEY.format(user_id=self.id)
+        cached_sub = cache.get(cache_key, _MISSING)
+        if cached_sub is not _MISSING:
             return cached_sub
 
-        subscription = self.subscriptions.filter(
-            status="active", end_date__gt=timezone.now()
-        ).first()
+        now = timezone.now()
+        subscription = (
+            self.subscriptions.select_related("plan")
+            .filter(status="active", end_date__gt=now)
+            .first()
+        )
+
+        timeout = ONE_DAY_IN_SECONDS
+        if subscription is not None:
+            seconds_to_expiration = (subscription.end_date - now).total_seconds()
+            timeout = max(1, min(timeout, int(seconds_to_expiration)))
 
-        # Cache for 1 hour
-        cache.set(cache_key, subscription, ONE_HOUR_IN_SECONDS)
+        cache.set(cache_key, subscription, timeout)
         return subscription
 
-    def has_access_to_vertical(self, vertical_slug):
-        """Check if user has access to a specific vertical"""
+    @cached_property
+    def accessible_verticals(self):
+        """
+        Slugs of the verticals the user can read, as a frozenset.
+
+        Resolved with a single query over all active subscriptions, memoized
+        on the user instance (so once per request) and cached until the
+        earliest subscription expires. The cache is cleared by the plans
+        signals whenever a subscription or a plan's verticals change.
+        """
+        from django.core.cache import cache
+
+        from plans.models import Subscription, Vertical
+
         # Admin and editor have full access
         if self.is_admin() or self.is_editor():
-            return True
-
-        # Get active subscription
-        subscription = self.get_active_subscription()
-        if not subscription:
-            return False
+            return frozenset(Vertical.VerticalChoices.values)
+
+        cache_key = ACCESSIBLE_VERTICALS_CACHE_KEY.format(user_id=self.id)
+        cached_slugs = cache.get(cache_key)
+        if cached_slugs is not None:
+            return cached_slugs
+
+        now = timezone.now()
+        rows = list(
+            Vertical.objects.filter(
+                models.Q(plans__subscriptions__end_date__isnull=True)
+                | models.Q(plans__subscriptions__end_date__gt=now),
+                plans__subscriptions__user=self,
+                plans__subscriptions__status=Subscription.StatusChoices.ACTIVE,
+            ).values_list("slug", "plans__subscriptions__end_date")
+        )
+
+        slugs = frozenset(slug for slug, _ in rows)
+        end_dates = [end_date for _, end_date in rows if end_date is not None]
+        timeout = ONE_DAY_IN_SECONDS
+        if end_dates:
+            seconds_to_expiration = (min(end_dates) - now).total_seconds()
+            timeout = max(1, min(timeout, int(seconds_to_expiration)))
+
+        cache.set(cache_key, slugs, timeout)
+        return slugs
+
+    @classmethod
+    def clear_subscription_cache(cls, user_ids):
+        """
+        Drop the cached active subscription and entitlements of the given users.
+
+        Keys are deleted in batches, so a plan change reaching thousands of
+        subscribers costs a few cache round trips rather than one per user.
+        """
+        from django.core.cache import cache
 
-        # Check if subscription is actually active and not expired
-        if not subscription.is_active:
-            return False
+        user_ids = iter(user_ids)
+        while batch := list(islice(user_ids, CACHE_INVALIDATION_BATCH_SIZE)):
+            cache.delete_many(
+                [
+                    key.format(user_id=user_id)
+                    for user_id in batch
+                    for key in (
+                        ACTIVE_SUBSCRIPTION_CACHE_KEY,
+                        ACCESSIBLE_VERTICALS_CACHE_KEY,
+                    )
+                ]
+            )
 
-        # Check if the vertical is in the plan's verticals
-        return subscription.plan.verticals.filter(slug=vertical_slug).exists()
+    def has_access_to_vertical(self, vertical_slug):
+        """Check if user has access to a specific vertical"""
+        return vertical_slug in self.accessible_verticals
 
     def can_access_content(self, content):
         """Check if the user can access specific content based on their subscription"""